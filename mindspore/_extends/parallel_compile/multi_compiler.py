@@ -13,43 +13,200 @@
 # limitations under the License.
 # ============================================================================
 """Providing multi process compile with json"""
+import hashlib
 import json
-import math
 import os
+import shutil
 import subprocess
 import sys
+import time
 from multiprocessing import Pool
 
+from mindspore import log as logger
 
-def _compiletask(platform, *jsons):
-    """
-        compile func called in single process
+# the environment variable of the kernel compile cache directory, the cache is disabled if it is not set
+KERNEL_CACHE_PATH_ENV = "MS_KERNEL_CACHE_PATH"
+
+# the directories where the compilers write the kernels
+_KERNEL_META_DIRS = {"TBE": "./kernel_meta", "AKG": "/tmp/cuda_meta"}
+
+# the number of the slowest kernels reported after compiling
+_REPORTED_KERNEL_NUM = 5
 
-        Parameters:
-            platform: str. AKG platform or TBE platform
-            *jsons: str. json str contain kernel info, suitable for json compile
-                    api
+_TBE_RESULT_PREFIX = "__tbe_compile_result__:"
 
-        """
-    if platform == "AKG":
+
+class AkgCompiler:
+    """AKG compiler, which compiles the kernels in the process."""
+    def __init__(self):
         p = __import__("akg", globals(), locals(), ['ms'], 0)
-        func = getattr(p.ms, "compilewithjson")
-        for json_item in jsons:
-            res = func(json_item)
-            if not res:
-                raise ValueError("Compile error")
-    if platform == "TBE":
-        tbe_compiler = os.path.join(os.path.split(os.path.realpath(__file__))[0], "tbe_compiler", "compiler.py")
-        for json_item in jsons:
-            res = subprocess.run([sys.executable, tbe_compiler], input=json_item, text=True)
-            if res.returncode != 0:
-                raise ValueError("Tbe compile error")
+        self._compile = getattr(p.ms, "compilewithjson")
+
+    @staticmethod
+    def version():
+        """The version of the compiler, which is a part of the cache key."""
+        try:
+            akg = __import__("akg")
+        except ImportError:
+            return "AKG"
+        return "AKG-" + str(getattr(akg, "__version__", ""))
+
+    def compile(self, json_str):
+        """Compile the kernel."""
+        if not self._compile(json_str):
+            raise ValueError("Compile error")
+
+
+class TbeCompiler:
+    """TBE compiler, which compiles the kernels one by one in a long-lived compiler process."""
+    def __init__(self):
+        self._compiler = os.path.join(os.path.split(os.path.realpath(__file__))[0], "tbe_compiler", "compiler.py")
+        self._process = None
+
+    @staticmethod
+    def version():
+        """The version of the compiler, which is a part of the cache key."""
+        from .tbe_compiler.common import get_ddk_version
+        return "TBE-" + get_ddk_version()
+
+    def compile(self, json_str):
+        """Compile the kernel, restarting the compiler process if it has exited."""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen([sys.executable, self._compiler, "--server"], stdin=subprocess.PIPE,
+                                             stdout=subprocess.PIPE, universal_newlines=True)
+        self._process.stdin.write(json_str + "\n")
+        self._process.stdin.flush()
+        for line in self._process.stdout:
+            if line.startswith(_TBE_RESULT_PREFIX):
+                result = json.loads(line[len(_TBE_RESULT_PREFIX):])
+                break
+            sys.stdout.write(line)
+        else:
+            self.close()
+            raise ValueError("Tbe compile error: the compiler process exited")
+        if result != "Success":
+            raise ValueError("Tbe compile error: " + result)
+
+    def close(self):
+        """Stop the compiler process."""
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process = None
+
+
+_COMPILERS = {"AKG": AkgCompiler, "TBE": TbeCompiler}
+
+# the compilers of the worker process, kept for all the kernels it compiles
+_worker_compilers = {}
+
+
+def _compiletask(task):
+    """
+    compile func called in the worker process
+
+    Parameters:
+        task: tuple. the key of the kernel, the platform (AKG or TBE) and the json str contain kernel info,
+              suitable for json compile api
+
+    Returns:
+        tuple, the key of the kernel, the compile time and the error message, None if succeeded.
+    """
+    key, platform, json_str = task
+    start = time.time()
+    try:
+        compiler = _worker_compilers.get(platform)
+        if compiler is None:
+            compiler = _COMPILERS[platform]()
+            _worker_compilers[platform] = compiler
+        compiler.compile(json_str)
+    except Exception as e:  # pylint: disable=broad-except
+        return key, time.time() - start, str(e) or type(e).__name__
+    return key, time.time() - start, None
+
+
+def _kernel_name(kernel_info):
+    """Get the name of the kernel, which names the files it is compiled into."""
+    if "fusion_op" in kernel_info:
+        return kernel_info["fusion_op"].get("fusion_op_name", "")
+    if "op_info" in kernel_info:
+        return kernel_info["op_info"].get("kernel_name", "")
+    return kernel_info.get("op", "")
+
+
+class KernelCompileCache:
+    """
+    The content-addressed cache of the compiled kernels.
+
+    The key of a kernel is the hash of its canonicalized json and the version of the compiler, and the entry keeps
+    the files the kernel is compiled into.
+
+    Parameters:
+        path: str. the directory of the cache
+    """
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def key(kernel_info, version):
+        """Get the key of the kernel compiled by the compiler of the version."""
+        canonical = json.dumps(kernel_info, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256((version + "\n" + canonical).encode()).hexdigest()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.path, key[:2], key)
+
+    def load(self, key, meta_dir):
+        """Copy the files of the cached kernel into the kernel directory, False if it is not cached."""
+        entry_dir = self._entry_dir(key)
+        if not os.path.isdir(entry_dir):
+            return False
+        os.makedirs(meta_dir, exist_ok=True)
+        for file_name in os.listdir(entry_dir):
+            shutil.copyfile(os.path.join(entry_dir, file_name), os.path.join(meta_dir, file_name))
+        return True
+
+    def save(self, key, meta_dir, kernel_name):
+        """Keep the files of the compiled kernel, False if the compiler does not write any."""
+        if not kernel_name or not os.path.isdir(meta_dir):
+            return False
+        files = [file_name for file_name in os.listdir(meta_dir)
+                 if os.path.splitext(file_name)[0] == kernel_name]
+        if not files:
+            return False
+        entry_dir = self._entry_dir(key)
+        tmp_dir = "{}.{}.tmp".format(entry_dir, os.getpid())
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            for file_name in files:
+                shutil.copyfile(os.path.join(meta_dir, file_name), os.path.join(tmp_dir, file_name))
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # another process has saved the same kernel
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return True
+
+
+def _report_compile_times(times):
+    """Log the compile time of each kernel and the slowest ones, which hold up the parallel compiling."""
+    for kernel_name, compile_time in times:
+        logger.info("Kernel {} compiled in {:.3f}s.".format(kernel_name, compile_time))
+    if not times:
+        return
+    total = sum(compile_time for _, compile_time in times)
+    slowest = sorted(times, key=lambda item: item[1], reverse=True)[:_REPORTED_KERNEL_NUM]
+    logger.info("{} kernels compiled in {:.3f}s in total, the slowest: {}.".format(
+        len(times), total, ", ".join("{} {:.3f}s".format(name, compile_time) for name, compile_time in slowest)))
 
 
 def compilekernelparallel(jsons, process, waitime):
     """
     compile kernel use multi processes
 
+    The kernels are taken one by one from a queue shared by the processes, so a process finishing its kernel takes
+    the next one, and each process keeps its compilers for all the kernels it compiles. If the environment
+    variable MS_KERNEL_CACHE_PATH is set, the kernels compiled before are copied from the cache instead.
+
     Parameters:
         jsons: list. json str list contain kernel info
         process: int. processes num
@@ -62,46 +219,49 @@ def compilekernelparallel(jsons, process, waitime):
     if not isinstance(waitime, int):
         raise ValueError("waittime must be a num")
 
-    jsons_akg = []
-    jsons_tbe = []
+    kernels = []
     for json_ in jsons:
         j = json.loads(json_)
-        if j["platform"] == "TBE":
-            jsons_tbe.append(json_)
+        if j["platform"] not in _COMPILERS:
+            raise RuntimeError(
+                "not support this platform {0}".format(j["platform"]))
+        kernels.append(j)
+
+    cache_path = os.environ.get(KERNEL_CACHE_PATH_ENV)
+    cache = KernelCompileCache(cache_path) if cache_path else None
+    versions = {}
+    tasks = {}
+    cached_num = 0
+    for kernel_info in kernels:
+        platform = kernel_info["platform"]
+        if platform not in versions:
+            versions[platform] = _COMPILERS[platform].version()
+        key = KernelCompileCache.key(kernel_info, versions[platform])
+        if key in tasks:
             continue
-        if j["platform"] == "AKG":
-            jsons_akg.append(json_)
+        if cache is not None and cache.load(key, _KERNEL_META_DIRS[platform]):
+            cached_num += 1
             continue
-        raise RuntimeError(
-            "not support this platform {0}".format(j["platform"]))
-    if jsons_akg:
-        process_akg = math.floor(len(jsons)/len(jsons_akg)*process)
-    else:
-        process_akg = 0
-
-    if process_akg == 0 and jsons_akg:
-        process_akg = 1
-    process_tbe = process-process_akg
-    if process_tbe == 0 and jsons_tbe:
-        process_tbe = 1
-        raise RuntimeWarning("we add a process for compile more operator")
-
-    args = [[] for _ in range(process_akg+process_tbe)]
-    args_lens = len(args)
-    for p in range(args_lens):
-        if p < process_tbe:
-            args[p].append("TBE")
-        else:
-            args[p].append("AKG")
-    jsons_tbe_lens = len(jsons_tbe)
-    for p in range(jsons_tbe_lens):
-        args[p % process_tbe].append(jsons_tbe[p])
-    jsons_akg_lens = len(jsons_akg)
-    for p in range(jsons_akg_lens):
-        args[process-p % process_akg-1].append(jsons_akg[p])
-    for p in range(args_lens):
-        args[p] = tuple(args[p])
-    with Pool(processes=process) as pool:
-        res = pool.starmap_async(_compiletask, args)
-        res.get(timeout=waitime)
+        tasks[key] = kernel_info
+    if cache is not None:
+        logger.info("Kernel compile cache: {} kernels cached, {} to compile.".format(cached_num, len(tasks)))
+    if not tasks:
+        return True
+
+    deadline = time.time() + waitime
+    times = []
+    with Pool(processes=max(1, min(process, len(tasks)))) as pool:
+        # the kernels are dispatched one at a time, an idle process takes the next one
+        results = pool.imap_unordered(
+            _compiletask, [(key, j["platform"], json.dumps(j)) for key, j in tasks.items()], chunksize=1)
+        for _ in range(len(tasks)):
+            key, compile_time, error = results.next(timeout=max(0.0, deadline - time.time()))
+            kernel_info = tasks[key]
+            kernel_name = _kernel_name(kernel_info)
+            if error is not None:
+                raise ValueError("{}, kernel {}".format(error, kernel_name))
+            times.append((kernel_name, compile_time))
+            if cache is not None and not cache.save(key, _KERNEL_META_DIRS[kernel_info["platform"]], kernel_name):
+                logger.warning("Kernel {} is not cached, the compiled files are not found.".format(kernel_name))
+    _report_compile_times(times)
     return True
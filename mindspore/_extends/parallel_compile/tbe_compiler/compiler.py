@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """tbe compiler"""
+import importlib.util
 import json
 import os
 import sys
@@ -29,6 +30,12 @@ build_in_impl_path = get_build_in_impl_path()
 op_build = "compile"
 op_pre_build = "pre_build"
 
+# prefix of the result line written by the compile server
+RESULT_PREFIX = "__tbe_compile_result__:"
+
+# the custom op modules imported by the compile server, keyed by the real path of the impl file
+_custom_op_modules = {}
+
 
 def _initialize(impl_path):
     """Initialize"""
@@ -40,7 +47,24 @@ def _initialize(impl_path):
     if not op_module_name:
         raise ValueError("Can not find the env TBE_IMPL_PATH")
 
-    sys.path.insert(0, op_module_name)
+    # the compile server initializes for every kernel, the path is only added once
+    if op_module_name not in sys.path:
+        sys.path.insert(0, op_module_name)
+
+
+def _import_custom_op(impl_file, op_name):
+    """
+    Import the module of a custom op by the path of its impl file.
+
+    The custom ops of the same file name under different impl paths are imported as different modules.
+    """
+    op_module = _custom_op_modules.get(impl_file)
+    if op_module is None:
+        spec = importlib.util.spec_from_file_location(op_name, impl_file)
+        op_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(op_module)
+        _custom_op_modules[impl_file] = op_module
+    return op_module
 
 
 def build_op(build_type, json_str):
@@ -65,6 +89,7 @@ def build_op(build_type, json_str):
         if 'impl_path' in kernel_info and kernel_info['impl_path'] is not None:
             impl_path = os.path.realpath(kernel_info['impl_path'])
             if os.path.isfile(impl_path):
+                impl_file = impl_path
                 path, file_name = os.path.split(impl_path)
                 op_name, _ = os.path.splitext(file_name)
                 impl_path = path
@@ -79,7 +104,7 @@ def build_op(build_type, json_str):
         kernel_name = kernel_info['op_info']['kernel_name']
 
         if custom_flag:
-            op_module = __import__(op_name)
+            op_module = _import_custom_op(impl_file, op_name)
         else:
             op_module = __import__("impl."+op_name, globals(), locals(), [op_name], 0)
         # get function
@@ -161,6 +186,24 @@ def compile_with_json(json_str):
     return ret
 
 
+def compile_server():
+    """
+    Compile the kernels of the json lines read from stdin until it is closed, writing the result of each kernel
+    to stdout after the result prefix.
+    """
+    for json_str in sys.stdin:
+        try:
+            compile_with_json(json_str)
+            result = "Success"
+        except Exception as e:  # pylint: disable=broad-except
+            result = "{}: {}".format(type(e).__name__, e)
+        sys.stdout.write(RESULT_PREFIX + json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
 if __name__ == "__main__":
-    in_args = sys.stdin.readline()
-    compile_with_json(in_args)
+    if len(sys.argv) > 1 and sys.argv[1] == "--server":
+        compile_server()
+    else:
+        in_args = sys.stdin.readline()
+        compile_with_json(in_args)
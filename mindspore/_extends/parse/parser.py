@@ -17,8 +17,10 @@
 """The module of parser python object, called by c++."""
 
 import ast
+import time
 import types
 import inspect
+from collections import namedtuple
 from textwrap import dedent
 from dataclasses import is_dataclass
 import asttokens
@@ -27,6 +29,7 @@ from mindspore import log as logger
 from mindspore import ops
 from mindspore.common.dtype import pytype_to_dtype
 from mindspore.common.api import _MindSporeFunction
+from mindspore.common import _compile_cache
 from .namespace import CellNamespace, ClosureNamespace, ClassMemberNamespace
 from .resources import parse_object_map, convert_object_map, trope_ns, SYMBOL_UNDEFINE, NO_IMPLEMENT
 
@@ -63,6 +66,89 @@ AST_SUB_TYPE_SUBSCRIPT = 7             # ast.Subscript
 AST_SUB_TYPE_STARRED = 8               # ast.Starred
 AST_SUB_TYPE_UNKNOWN = 0xFF            # unknown
 
+# the parse result of a function, `stamp` is the modification time and size of its source file
+_ParseResult = namedtuple("_ParseResult", ["stamp", "line_offset", "col_offset", "source", "tree", "parse_time"])
+
+# the parse results of the functions, keyed by the code objects. A `construct` shared by many cell instances,
+# e.g. the layers of a deep network, is only parsed once.
+_parse_results = {}
+
+
+class _ParseStatistics:
+    """The statistics of the parsing in the front end of compile, for the compile time breakdown."""
+    def __init__(self):
+        self.parsed_num = 0
+        self.cached_num = 0
+        self.source_time = 0.0
+        self.tokenize_time = 0.0
+
+    @property
+    def total_time(self):
+        return self.source_time + self.tokenize_time
+
+    def snapshot(self):
+        """Get a copy of the current statistics."""
+        stats = _ParseStatistics()
+        stats.__dict__.update(self.__dict__)
+        return stats
+
+    def since(self, snapshot):
+        """Get the statistics accumulated after the snapshot."""
+        stats = _ParseStatistics()
+        for name, value in self.__dict__.items():
+            setattr(stats, name, value - getattr(snapshot, name))
+        return stats
+
+
+parse_statistics = _ParseStatistics()
+
+
+def _parse_function(fn):
+    """
+    Parse the function, the result is reused until the source file is modified.
+
+    Args:
+        fn (Union[FunctionType, MethodType]): The function.
+
+    Returns:
+        _ParseResult, the parse result.
+    """
+    code = fn.__code__
+    stamp = _compile_cache.file_stamp(code.co_filename)
+    result = _parse_results.get(code)
+    if result is not None and result.stamp == stamp:
+        parse_statistics.cached_num += 1
+        # credit the persistent compile cache entry of the network being compiled, or complete it
+        if _compile_cache.get_parsed(fn) is None:
+            _compile_cache.put_parsed(fn, *result[1:])
+        return result
+
+    cached = _compile_cache.get_parsed(fn)
+    if cached is not None:
+        parse_statistics.cached_num += 1
+        result = _ParseResult(stamp, *cached)
+        _parse_results[code] = result
+        return result
+
+    start = time.perf_counter()
+    lines, line_offset = inspect.getsourcelines(fn)
+    original_src = ''.join(lines)
+    src = dedent(original_src)
+    col_offset = len(original_src.split('\n')[0]) - len(src.split('\n')[0])
+    logger.debug("get source = %s", src)
+    source_end = time.perf_counter()
+    tree = asttokens.ASTTokens(src, parse=True).tree
+    end = time.perf_counter()
+
+    parse_statistics.parsed_num += 1
+    parse_statistics.source_time += source_end - start
+    parse_statistics.tokenize_time += end - source_end
+    result = _ParseResult(stamp, line_offset, col_offset, src, tree, end - start)
+    _parse_results[code] = result
+    _compile_cache.put_parsed(fn, *result[1:])
+    return result
+
+
 # Process expr statement white list
 # add as needed, eg: "clear", "extend", "insert", "remove", "reverse"
 parse_expr_statement_white_list = (
@@ -313,7 +399,8 @@ class Parser:
     def __init__(self, fn: (types.FunctionType, types.MethodType), parse_method=None) -> None:
         self.fn = fn
         self.parse_method = parse_method
-        _, self.line_offset = inspect.getsourcelines(self.fn)
+        # the line offset is got with the source in parse
+        self.line_offset = 0
         self.filename: str = inspect.getfile(self.fn)
 
         # Used to resolve the function's globals Namespace.
@@ -329,12 +416,10 @@ class Parser:
         logger.debug("fn = %r", self.fn)
         tree = None
         if isinstance(self.fn, (types.FunctionType, types.MethodType)):
-            original_src = inspect.getsource(self.fn)
-            src = dedent(original_src)
-            self.col_offset = \
-                len(original_src.split('\n')[0]) - len(src.split('\n')[0])
-            logger.debug("get source = %s", src)
-            tree = asttokens.ASTTokens(src, parse=True).tree
+            result = _parse_function(self.fn)
+            self.line_offset = result.line_offset
+            self.col_offset = result.col_offset
+            tree = result.tree
         else:
             logger.error("Fn type is invalid")
         return tree
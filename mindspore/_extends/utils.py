@@ -18,6 +18,7 @@ import hashlib
 import logging
 import os
 import inspect
+import queue
 from functools import wraps
 
 
@@ -99,3 +100,24 @@ def cell_attr_register(fn=None, attrs=None):
     if fn is not None:
         return wrap_cell(fn)
     return wrap_cell
+
+
+def put_unless_stopped(item_queue, item, stop):
+    """
+    Put the item into the bounded queue of a producer thread, waiting for free space until it is stopped.
+
+    Args:
+        item_queue (queue.Queue): The queue read by the consumer.
+        item (object): The item to put.
+        stop (threading.Event): Set when the consumer stops reading the queue.
+
+    Returns:
+        bool, False if it is stopped before the item is put.
+    """
+    while not stop.is_set():
+        try:
+            item_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
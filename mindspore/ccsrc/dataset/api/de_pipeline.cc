@@ -15,6 +15,7 @@
  */
 #include "dataset/api/de_pipeline.h"
 
+#include <algorithm>
 #include <set>
 #include <map>
 
@@ -166,6 +167,18 @@ Status DEPipeline::GetNextAsList(py::list *output) {
   return Status::OK();
 }
 
+Status DEPipeline::GetColumnNames(py::list *output) {
+  std::vector<std::pair<int32_t, std::string>> columns;
+  for (const auto &column : iterator_->col_name_id_map()) {
+    columns.emplace_back(column.second, column.first);
+  }
+  std::sort(columns.begin(), columns.end());
+  for (const auto &column : columns) {
+    output->append(column.second);
+  }
+  return Status::OK();
+}
+
 Status DEPipeline::GetOutputShapes(py::list *output) {
   std::vector<TensorShape> shapes;
   Status s;
@@ -87,6 +87,10 @@ class DEPipeline {
   // Get a row of data as list.
   Status GetNextAsList(py::list *output);
 
+  // Get the column names in the order of the column ids, which is the order of GetNextAsList.
+  // The names are known after the first row is fetched.
+  Status GetColumnNames(py::list *output);
+
   Status GetOutputShapes(py::list *output);
 
   Status GetOutputTypes(py::list *output);
@@ -102,6 +102,12 @@ void bindDEPipeline(py::module *m) {
            THROW_IF_ERROR(de.GetNextAsList(&out));
            return out;
          })
+    .def("GetColumnNames",
+         [](DEPipeline &de) {
+           py::list out;
+           THROW_IF_ERROR(de.GetColumnNames(&out));
+           return out;
+         })
     .def("GetOutputShapes",
          [](DEPipeline &de) {
            py::list out;
@@ -418,7 +424,12 @@ void bindInfoObjects(py::module *m) {
 // This is where we externalize the C logic as python modules
 PYBIND11_MODULE(_c_dataengine, m) {
   m.doc() = "pybind11 for _c_dataengine";
-  (void)py::class_<DatasetOp, std::shared_ptr<DatasetOp>>(m, "DatasetOp");
+  (void)py::class_<DatasetOp, std::shared_ptr<DatasetOp>>(m, "DatasetOp")
+    .def("id", &DatasetOp::id)
+    .def("num_workers", &DatasetOp::num_workers)
+    .def("connector_size", &DatasetOp::ConnectorSize)
+    .def("connector_capacity", &DatasetOp::ConnectorCapacity)
+    .def("connector_out_rows", &DatasetOp::ConnectorOutRows);
 
   (void)py::enum_<OpName>(m, "OpName", py::arithmetic())
     .value("STORAGE", OpName::kStorage)
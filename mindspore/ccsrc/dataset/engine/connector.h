@@ -141,6 +141,24 @@ class Connector {
     MS_LOG(INFO) << "Connector counters reset.";
   }
 
+  // Get the number of elements in all the internal queues, used for sampling the queue occupancy.
+  int32_t size() const {
+    int32_t size = 0;
+    for (int i = 0; i < queues_.size(); ++i) {
+      size += queues_[i]->size();
+    }
+    return size;
+  }
+
+  // Get the total capacity of all the internal queues.
+  int32_t capacity() const {
+    int32_t capacity = 0;
+    for (int i = 0; i < queues_.size(); ++i) {
+      capacity += queues_[i]->capacity();
+    }
+    return capacity;
+  }
+
   void Print(std::ostream &out, bool showAll) const {
     out << "\n--------- Connector ------------"
         << "\nConnector Name           : " << my_name_ << "\nNumber of consumers      : " << num_consumers_
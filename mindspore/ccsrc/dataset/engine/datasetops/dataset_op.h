@@ -180,6 +180,18 @@ class DatasetOp : public std::enable_shared_from_this<DatasetOp> {
   // @return T/F if this is an inlined operator
   bool inlined() const { return (oc_queue_size_ == 0); }
 
+  // Getter function
+  // @return The number of buffers in the output connector, 0 if there is no output connector
+  int32_t ConnectorSize() const { return (out_connector_) ? out_connector_->size() : 0; }
+
+  // Getter function
+  // @return The capacity of the output connector, 0 if there is no output connector
+  int32_t ConnectorCapacity() const { return (out_connector_) ? out_connector_->capacity() : 0; }
+
+  // Getter function
+  // @return The number of rows produced into the output connector, 0 if there is no output connector
+  int64_t ConnectorOutRows() const { return (out_connector_) ? out_connector_->out_rows() : 0; }
+
   // Setter function
   // @return Sets the control flags
   void set_control_flag(uint64_t flag) { BitSet(&op_ctrl_flags_, flag); }
@@ -16,6 +16,7 @@
 #ifndef DATASET_ENGINE_DB_CONNECTOR_H_
 #define DATASET_ENGINE_DB_CONNECTOR_H_
 
+#include <atomic>
 #include <memory>
 #include <utility>
 #include "dataset/engine/connector.h"
@@ -35,7 +36,9 @@ class DbConnector : public Connector<std::unique_ptr<DataBuffer>> {
   // @param n_consumers The number of thread consuming data from this DbConnector.
   // @param queue_capacity The number of element (DataBuffer) for each internal queue.
   DbConnector(int32_t n_producers, int32_t n_consumers, int32_t queue_capacity)
-      : Connector<std::unique_ptr<DataBuffer>>(n_producers, n_consumers, queue_capacity), end_of_file_(false) {}
+      : Connector<std::unique_ptr<DataBuffer>>(n_producers, n_consumers, queue_capacity),
+        end_of_file_(false),
+        out_rows_(0) {}
 
   // Destructor of DbConnector
   ~DbConnector() = default;
@@ -45,9 +48,16 @@ class DbConnector : public Connector<std::unique_ptr<DataBuffer>> {
   // @param worker_id The id of a worker thread calling this method.
   // @param el A rvalue reference to an element to be passed/added/pushed.
   Status Add(int32_t worker_id, std::unique_ptr<DataBuffer> &&el) noexcept {
+    if (el != nullptr) {
+      out_rows_ += el->NumRows();
+    }
     return (Connector<std::unique_ptr<DataBuffer>>::Push(worker_id, std::move(el)));
   }
 
+  // Getter function
+  // @return The number of rows added into the DbConnector, used for sampling the throughput.
+  int64_t out_rows() const { return out_rows_; }
+
   // Get a unique_ptr<DataBuffer> from the DbConnector.
   // @note After the first EOF Buffer is encountered, subsequent pop()s will return EOF Buffer.
   // This will provide/propagate the EOF to all consumer threads of this Connector.
@@ -90,6 +100,9 @@ class DbConnector : public Connector<std::unique_ptr<DataBuffer>> {
  private:
   // A flag to indicate the end of stream has been encountered.
   bool end_of_file_;
+
+  // The number of rows added by the producers.
+  std::atomic<int64_t> out_rows_;
 };
 }  // namespace dataset
 }  // namespace mindspore
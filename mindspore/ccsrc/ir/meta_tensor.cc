@@ -527,6 +527,18 @@ REGISTER_PYBIND_DEFINE(Tensor, ([](const py::module* m) {
                                  >>> data.set_dtype(mindspore.int32)
                                  mindspore.int32
                              )mydelimiter")
+                           .def("set_dirty", &Tensor::set_dirty, py::arg("dirty") = true, R"mydelimiter(
+                             Mark whether the data of the tensor is modified, the modified data is copied to the
+                             device before the tensor is used.
+
+                             Arg:
+                                 dirty (bool): Whether the data is modified. Default: True.
+
+                             Examples:
+                                 >>> data = mindspore.Tensor(np.ones((1, 2), np.float32))
+                                 >>> data.asnumpy()[0, 0] = 2
+                                 >>> data.set_dirty()
+                             )mydelimiter")
                            .def("shape", &Tensor::GetPyTupleShape, R"mydelimiter(
                              Get the tensor's shape.
 
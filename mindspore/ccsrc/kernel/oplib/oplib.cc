@@ -17,13 +17,19 @@
 #include "kernel/oplib/oplib.h"
 #include <pybind11/pybind11.h>
 #include <unordered_map>
+#include <unordered_set>
 #include <memory>
+#include <mutex>
 #include "utils/log_adapter.h"
 #include "kernel/oplib/opinfo.h"
 #include "utils/context/ms_context.h"
 
+namespace py = pybind11;
+
 namespace mindspore {
 namespace kernel {
+constexpr auto kOpImplModule = "mindspore.ops._op_impl";
+constexpr auto kRegisterOp = "register_op";
 constexpr auto kImplyType = "imply_type";
 constexpr auto kOpName = "op_name";
 constexpr auto kTbe = "TBE";
@@ -49,6 +55,8 @@ constexpr auto kFormat = "format";
 constexpr auto kNeedCompile = "need_compile";
 constexpr auto kShape = "shape";
 std::vector<std::shared_ptr<OpInfo>> OpLib::op_info_;
+std::unordered_set<std::string> OpLib::lazy_op_names_;
+std::mutex OpLib::lazy_op_mutex_;
 
 string ImplTypeToStr(OpImplyType impl_type) {
   switch (impl_type) {
@@ -210,11 +218,43 @@ std::shared_ptr<OpInfo> OpLib::FindOp(const std::string& op_name, OpImplyType im
       return op_info;
     }
   }
+  // the built-in op info is registered on its first lookup
+  if (RegLazyOp(op_name, imply_type)) {
+    for (const auto& op_info : op_info_) {
+      MS_EXCEPTION_IF_NULL(op_info);
+      if (op_info->op_name() == op_name && op_info->imply_type() == imply_type) {
+        return op_info;
+      }
+    }
+  }
   MS_LOG(DEBUG) << "FindOp failed: opname:" << op_name << "imply_type:" << ImplTypeToStr(imply_type)
                 << "current op num:" << op_info_.size();
   return nullptr;
 }
 
+bool OpLib::RegLazyOp(const std::string& op_name, OpImplyType imply_type) {
+  std::string imply_type_string = (imply_type == kTBE) ? kTbe : kAutodiff;
+  {
+    // each op is tried only once, the op info module registers all the op info it has
+    std::lock_guard<std::mutex> lock(lazy_op_mutex_);
+    if (!lazy_op_names_.insert(op_name + "_" + imply_type_string).second) {
+      return false;
+    }
+  }
+  if (!Py_IsInitialized()) {
+    return false;
+  }
+  py::gil_scoped_acquire acquire;
+  try {
+    py::object registered = py::module::import(kOpImplModule).attr(kRegisterOp)(op_name, imply_type_string);
+    return py::cast<bool>(registered);
+  } catch (const std::exception& e) {
+    MS_LOG(WARNING) << "Register op info failed, op name:" << op_name << " imply_type:" << imply_type_string
+                    << " error:" << e.what();
+  }
+  return false;
+}
+
 bool OpLib::GetRefInfo(const std::shared_ptr<OpInfo>& op_info) {
   MS_EXCEPTION_IF_NULL(op_info);
   const auto& output_infos = op_info->outputs_ptr();
@@ -19,6 +19,8 @@
 #include <vector>
 #include <string>
 #include <memory>
+#include <mutex>
+#include <unordered_set>
 #include <nlohmann/json.hpp>
 #include "kernel/oplib/opinfo.h"
 
@@ -42,6 +44,9 @@ class OpLib {
                                 const std::shared_ptr<OpInfo>& op_info);
   static bool GetRefInfo(const std::shared_ptr<OpInfo>& op_info);
   static bool CheckRepetition(const std::shared_ptr<OpInfo>& op_info);
+  static bool RegLazyOp(const std::string& op_name, OpImplyType imply_type);
+  static std::unordered_set<std::string> lazy_op_names_;
+  static std::mutex lazy_op_mutex_;
 };
 }  // namespace kernel
 }  // namespace mindspore
@@ -78,6 +78,9 @@ void BindShardWriter(py::module *m) {
     .def("write_raw_data",
          (MSRStatus(ShardWriter::*)(std::map<uint64_t, std::vector<py::handle>> &, vector<vector<uint8_t>> &, bool)) &
            ShardWriter::WriteRawData)
+    .def("write_raw_buffer_data",
+         (MSRStatus(ShardWriter::*)(std::map<uint64_t, std::vector<py::handle>> &, std::vector<py::buffer> &, bool)) &
+           ShardWriter::WriteRawData)
     .def("write_raw_nlp_data", (MSRStatus(ShardWriter::*)(std::map<uint64_t, std::vector<py::handle>> &,
                                                           std::map<uint64_t, std::vector<py::handle>> &, bool)) &
                                  ShardWriter::WriteRawData)
@@ -95,6 +98,7 @@ void BindShardReader(const py::module *m) {
     .def("get_blob_fields", &ShardReader::get_blob_fields)
     .def("get_next",
          (std::vector<std::tuple<std::vector<uint8_t>, pybind11::object>>(ShardReader::*)()) & ShardReader::GetNextPy)
+    .def("get_next_buffer", &ShardReader::GetNextBufferPy)
     .def("finish", &ShardReader::Finish)
     .def("close", &ShardReader::Close);
 }
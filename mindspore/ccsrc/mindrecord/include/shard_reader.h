@@ -180,6 +180,11 @@ class ShardReader {
   /// \return a batch of images and image data
   std::vector<std::tuple<std::vector<uint8_t>, pybind11::object>> GetNextPy();
 
+  /// \brief return a batch, given that one is ready, python API, the blob data is returned as bytes
+  ///        and the GIL is released while waiting for the batch
+  /// \return a batch of images and image data
+  std::vector<std::tuple<pybind11::bytes, pybind11::object>> GetNextBufferPy();
+
   /// \brief  get blob filed list
   /// \return blob field list
   std::pair<ShardType, std::vector<std::string>> get_blob_fields();
@@ -105,6 +105,14 @@ class ShardWriter {
   MSRStatus WriteRawData(std::map<uint64_t, std::vector<py::handle>> &raw_data,
                          std::map<uint64_t, std::vector<py::handle>> &blob_data, bool sign = true);
 
+  /// \brief write raw data by group size for call from python, blob data is passed by buffer protocol
+  /// \param[in] raw_data the vector of raw json data, python-handle format
+  /// \param[in] blob_data the vector of contiguous python buffers(bytes, memoryview, numpy.ndarray), one per row
+  /// \param[in] sign validate data or not
+  /// \return MSRStatus the status of MSRStatus to judge if write successfully
+  MSRStatus WriteRawData(std::map<uint64_t, std::vector<py::handle>> &raw_data, std::vector<py::buffer> &blob_data,
+                         bool sign = true);
+
  private:
   /// \brief write shard header data to disk
   MSRStatus WriteShardHeader();
@@ -1162,6 +1162,22 @@ std::vector<std::tuple<std::vector<uint8_t>, pybind11::object>> ShardReader::Get
   return jsonData;
 }
 
+std::vector<std::tuple<pybind11::bytes, pybind11::object>> ShardReader::GetNextBufferPy() {
+  std::vector<std::tuple<std::vector<uint8_t>, json>> res;
+  {
+    pybind11::gil_scoped_release release;
+    res = GetNext();
+  }
+  std::vector<std::tuple<pybind11::bytes, pybind11::object>> bufferData;
+  bufferData.reserve(res.size());
+  for (const auto &item : res) {
+    const auto &blob = std::get<0>(item);
+    pybind11::bytes bytes(reinterpret_cast<const char *>(blob.data()), blob.size());
+    bufferData.emplace_back(std::move(bytes), nlohmann::detail::FromJsonImpl(std::get<1>(item)));
+  }
+  return bufferData;
+}
+
 void ShardReader::Reset() {
   {
     std::lock_guard<std::mutex> lck(mtx_delivery_);
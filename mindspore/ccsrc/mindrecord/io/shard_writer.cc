@@ -550,6 +550,29 @@ MSRStatus ShardWriter::WriteRawData(std::map<uint64_t, std::vector<py::handle>>
   return WriteRawData(raw_data_json, blob_data, sign);
 }
 
+MSRStatus ShardWriter::WriteRawData(std::map<uint64_t, std::vector<py::handle>> &raw_data,
+                                    std::vector<py::buffer> &blob_data, bool sign) {
+  std::vector<std::vector<uint8_t>> bin_blob_data;
+  bin_blob_data.reserve(blob_data.size());
+  for (auto &buffer : blob_data) {
+    py::buffer_info info = buffer.request();
+    auto data = static_cast<const uint8_t *>(info.ptr);
+    (void)bin_blob_data.emplace_back(data, data + info.size * info.itemsize);
+  }
+  std::map<uint64_t, std::vector<json>> raw_data_json;
+  (void)std::transform(raw_data.begin(), raw_data.end(), std::inserter(raw_data_json, raw_data_json.end()),
+                       [](const std::pair<uint64_t, std::vector<py::handle>> &pair) {
+                         auto &py_raw_data = pair.second;
+                         std::vector<json> json_raw_data;
+                         (void)std::transform(py_raw_data.begin(), py_raw_data.end(), std::back_inserter(json_raw_data),
+                                              [](const py::handle &obj) { return nlohmann::detail::ToJsonImpl(obj); });
+                         return std::make_pair(pair.first, std::move(json_raw_data));
+                       });
+  // all the python objects have been converted, let the other python threads run while writing
+  py::gil_scoped_release release;
+  return WriteRawData(raw_data_json, bin_blob_data, sign);
+}
+
 MSRStatus ShardWriter::ParallelWriteData(const std::vector<std::vector<uint8_t>> &blob_data,
                                          const std::vector<std::vector<uint8_t>> &bin_raw_data) {
   auto shards = BreakIntoShards();
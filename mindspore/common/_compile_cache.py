@@ -0,0 +1,292 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Persistent compile cache.
+
+The cache is enabled by `context.set_context(compile_cache_path=...)`. Each compiled network has an entry
+keyed by the signature of the network: the source files of its cells, the shapes and dtypes of its arguments,
+the context settings affecting the compilation and the framework version. The entry keeps the front-end results
+of the functions parsed while compiling, so a restarted job or another worker compiling the same network does
+not parse the source again.
+"""
+import os
+import time
+import pickle
+import hashlib
+import inspect
+import threading
+from contextlib import contextmanager
+
+from mindspore import log as logger
+from mindspore import context
+from .tensor import MetaTensor
+
+_CACHE_VERSION = 2
+_ENTRY_SUFFIX = ".mscache"
+
+# the context settings which change the compiled graph
+_CONTEXT_KEYS = ("mode", "device_target", "enable_ir_fusion", "enable_auto_mixed_precision",
+                 "enable_reduce_precision", "enable_loop_sink", "enable_task_sink", "enable_mem_reuse")
+_AUTO_PARALLEL_CONTEXT_KEYS = ("parallel_mode", "device_num", "global_rank", "mirror_mean", "cast_before_mirror",
+                               "loss_repeated_mean")
+
+
+def _framework_version():
+    """Get the version of the framework, empty if it is not built."""
+    try:
+        from mindspore.version import __version__
+    except ImportError:
+        return ""
+    return __version__
+
+
+def file_stamp(file_name):
+    """Get the stamp of a source file, which changes when the file is modified."""
+    try:
+        stat = os.stat(file_name)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _SourceHasher:
+    """The hashes of the source files, recomputed only when a file is modified."""
+    def __init__(self):
+        self._hashes = {}
+
+    def __call__(self, file_name):
+        stamp = file_stamp(file_name)
+        cached = self._hashes.get(file_name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        with open(file_name, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self._hashes[file_name] = (stamp, digest)
+        return digest
+
+
+def _arg_signature(arg):
+    """Get the part of an argument which affects the compiled graph."""
+    if isinstance(arg, MetaTensor):
+        return "tensor", tuple(arg.shape()), str(arg.dtype())
+    if isinstance(arg, (tuple, list)):
+        return type(arg).__name__, tuple(_arg_signature(item) for item in arg)
+    if isinstance(arg, (bool, int, float, str)) or arg is None:
+        return type(arg).__name__, arg
+    return type(arg).__module__ + "." + type(arg).__qualname__
+
+
+def _source_files(obj):
+    """Get the source files of the network: the files defining the classes of all its cells, or the function."""
+    if hasattr(obj, "cells_and_names"):
+        classes = set()
+        for _, cell in obj.cells_and_names():
+            classes.update(cls for cls in type(cell).__mro__ if cls is not object)
+        objects = classes
+    else:
+        objects = [obj]
+    files = set()
+    for item in objects:
+        try:
+            files.add(inspect.getsourcefile(item))
+        except TypeError:
+            continue
+    files.discard(None)
+    return sorted(files)
+
+
+class _ActiveEntry:
+    """The cache entry of the network being compiled, with the statistics of this compilation."""
+    def __init__(self, entry):
+        self.entry = entry
+        self.reused = 0
+        self.saved_time = 0.0
+        self.modified = False
+
+
+class _CompileCache:
+    """
+    The persistent compile cache.
+
+    Args:
+        path (str): The directory of the cache entries.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.saved_time = 0.0
+        self._hash_source = _SourceHasher()
+        self._local = threading.local()
+
+    def signature(self, obj, args, phase):
+        """
+        Compute the key of the network compiled with the arguments.
+
+        Args:
+            obj (Union[Cell, function]): The network.
+            args (tuple): The arguments of the network.
+            phase (str): The name of the compile phase, without the parts which differ between processes.
+
+        Returns:
+            str, the key.
+        """
+        sha = hashlib.sha256()
+        sha.update(repr((_CACHE_VERSION, _framework_version(), phase)).encode())
+        sha.update(repr([context.get_context(key) for key in _CONTEXT_KEYS]).encode())
+        sha.update(repr([context.get_auto_parallel_context(key) for key in _AUTO_PARALLEL_CONTEXT_KEYS]).encode())
+        sha.update(repr(_arg_signature(tuple(args))).encode())
+        for file_name in _source_files(obj):
+            sha.update(file_name.encode())
+            sha.update(self._hash_source(file_name).encode())
+        return sha.hexdigest()
+
+    def _entry_file(self, key):
+        return os.path.join(self.path, key + _ENTRY_SUFFIX)
+
+    def _load(self, key):
+        """Load the entry of the key, None if it does not exist or is broken."""
+        entry_file = self._entry_file(key)
+        if not os.path.isfile(entry_file):
+            return None
+        try:
+            with open(entry_file, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning("Failed to load compile cache entry %s: %s.", entry_file, e)
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != _CACHE_VERSION:
+            return None
+        return entry
+
+    def _save(self, key, entry):
+        """Write the entry of the key atomically, so concurrent workers never read a partial entry."""
+        entry_file = self._entry_file(key)
+        tmp_file = "{}.{}.{}.tmp".format(entry_file, os.getpid(), threading.get_ident())
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, entry_file)
+        except (OSError, pickle.PicklingError, RecursionError, TypeError) as e:
+            logger.warning("Failed to save compile cache entry %s: %s.", entry_file, e)
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    @contextmanager
+    def compiling(self, obj, args, phase):
+        """Make the entry of the network the active one while it is compiled in this thread."""
+        key = self.signature(obj, args, phase)
+        entry = self._load(key)
+        hit = entry is not None
+        if not hit:
+            entry = {"version": _CACHE_VERSION, "phase": phase, "parsed": {}}
+        active = _ActiveEntry(entry)
+        self._local.active = active
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._local.active = None
+        compile_time = time.perf_counter() - start
+
+        if hit:
+            self.hits += 1
+            self.saved_time += active.saved_time
+            logger.info("Compile cache hit for %r: %d parsed functions reused, %.3fs saved, compiled in %.3fs "
+                        "(hits %d, misses %d, %.3fs saved in total).", phase, active.reused, active.saved_time,
+                        compile_time, self.hits, self.misses, self.saved_time)
+        else:
+            self.misses += 1
+            logger.info("Compile cache miss for %r: compiled in %.3fs (hits %d, misses %d).", phase, compile_time,
+                        self.hits, self.misses)
+        if active.modified:
+            self._save(key, entry)
+
+    def get_parsed(self, fn):
+        """
+        Get the parse result of the function from the active entry.
+
+        Returns:
+            tuple, the line offset, the column offset, the dedented source, the ast tree and the time of parsing,
+            or None if the function is not cached or its source file has been modified.
+        """
+        active = getattr(self._local, "active", None)
+        if active is None:
+            return None
+        code = fn.__code__
+        cached = active.entry["parsed"].get((code.co_filename, code.co_firstlineno, code.co_name))
+        if cached is None or cached["stamp"] != file_stamp(code.co_filename):
+            return None
+        active.reused += 1
+        active.saved_time += cached["parse_time"]
+        return cached["line_offset"], cached["col_offset"], cached["source"], cached["tree"], cached["parse_time"]
+
+    def put_parsed(self, fn, line_offset, col_offset, source, tree, parse_time):
+        """Add the parse result of the function to the active entry."""
+        active = getattr(self._local, "active", None)
+        if active is None:
+            return
+        code = fn.__code__
+        key = (code.co_filename, code.co_firstlineno, code.co_name)
+        stamp = file_stamp(code.co_filename)
+        cached = active.entry["parsed"].get(key)
+        if cached is not None and cached["stamp"] == stamp:
+            return
+        active.entry["parsed"][key] = {
+            "stamp": stamp, "line_offset": line_offset, "col_offset": col_offset,
+            "source": source, "tree": tree, "parse_time": parse_time}
+        active.modified = True
+
+
+_compile_cache = None
+
+
+def get_compile_cache():
+    """Get the compile cache of the path set in the context, None if it is disabled."""
+    global _compile_cache
+    path = context.get_context("compile_cache_path")
+    if not path:
+        return None
+    path = os.path.realpath(path)
+    if _compile_cache is None or _compile_cache.path != path:
+        _compile_cache = _CompileCache(path)
+    return _compile_cache
+
+
+@contextmanager
+def compiling(obj, args, phase):
+    """Activate the compile cache entry of the network while it is compiled, if the cache is enabled."""
+    cache = get_compile_cache()
+    if cache is None:
+        yield
+        return
+    with cache.compiling(obj, args, phase):
+        yield
+
+
+def get_parsed(fn):
+    """Get the parse result of the function from the compile cache, None if it is not cached."""
+    cache = _compile_cache
+    if cache is None:
+        return None
+    return cache.get_parsed(fn)
+
+
+def put_parsed(fn, line_offset, col_offset, source, tree, parse_time):
+    """Put the parse result of the function into the compile cache."""
+    cache = _compile_cache
+    if cache is not None:
+        cache.put_parsed(fn, line_offset, col_offset, source, tree, parse_time)
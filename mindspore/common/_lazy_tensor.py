@@ -0,0 +1,51 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Tensor data which is materialized on first use."""
+
+
+class LazyTensor:
+    """
+    Base class of the tensor data which is only materialized when it is used the first time.
+
+    A `Parameter` holding a LazyTensor keeps only the shape and dtype, the data is created by
+    `to_tensor` when `Parameter.default_input` is accessed.
+
+    Args:
+        shape (tuple): The shape of the tensor.
+        dtype (:class:`mindspore.dtype`): The data type of the tensor.
+    """
+    def __init__(self, shape, dtype):
+        self._shape = tuple(shape)
+        self._dtype = dtype
+
+    def __repr__(self):
+        return "{}(shape={}, dtype={})".format(type(self).__name__, self._shape, self._dtype)
+
+    def shape(self):
+        """Get the shape of the tensor."""
+        return self._shape
+
+    def dtype(self):
+        """Get the data type of the tensor."""
+        return self._dtype
+
+    def to_tensor(self):
+        """
+        Materialize the data.
+
+        Returns:
+            Tensor, the materialized tensor.
+        """
+        raise NotImplementedError
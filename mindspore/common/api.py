@@ -15,8 +15,10 @@
 # limitations under the License.
 # ============================================================================
 """Providing interface methods."""
+import time
 import types
 from collections import OrderedDict
+from contextlib import contextmanager
 from functools import wraps
 from mindspore import context
 from mindspore import log as logger
@@ -24,6 +26,7 @@ from mindspore.parallel._utils import _get_parallel_mode
 from .._c_expression import generate_key, Executor_, Tensor, MetaTensor
 from .._c_expression import verify_inputs_signature, init_exec_dataset, export_graph, _set_dataset_mode_config, init_ge
 from .tensor import Tensor as MsTensor
+from . import _compile_cache
 
 # store ms_function class compiled pipeline cache
 ms_compile_cache = {}
@@ -81,6 +84,21 @@ def _wrap_func(fn):
     return wrapper
 
 
+@contextmanager
+def _compile_time_breakdown(phase):
+    """Log the time of compiling the phase, with the time of parsing the python source in it."""
+    from mindspore._extends.parse.parser import parse_statistics
+    snapshot = parse_statistics.snapshot()
+    start = time.perf_counter()
+    yield
+    compile_time = time.perf_counter() - start
+    stats = parse_statistics.since(snapshot)
+    logger.info("Compile %r in %.3fs, parse %.3fs (get source %.3fs, tokenize %.3fs) for %d functions, "
+                "%d parse results reused, other stages %.3fs.", phase, compile_time, stats.total_time,
+                stats.source_time, stats.tokenize_time, stats.parsed_num, stats.cached_num,
+                compile_time - stats.total_time)
+
+
 def _exec_init_graph(obj, init_phase):
     """Execute the parameter initializer graph."""
     inst_executor = Executor_.get_instance()
@@ -167,10 +185,13 @@ class _MindSporeFunction:
         phase = str(key[1]) + generate_name
         if key not in ms_compile_cache.keys():
             is_compile = False
+            cache_phase = self.fn.__module__ + "." + self.fn.__qualname__ + "." + method_name
             if self.obj is None:
-                is_compile = self._executor.compile(self.fn, args_list, phase, True)
+                with _compile_time_breakdown(phase), _compile_cache.compiling(self.fn, args_list, cache_phase):
+                    is_compile = self._executor.compile(self.fn, args_list, phase, True)
             else:
-                is_compile = self._executor.compile(self.obj, args_list, phase, True)
+                with _compile_time_breakdown(phase), _compile_cache.compiling(self.obj, args_list, cache_phase):
+                    is_compile = self._executor.compile(self.obj, args_list, phase, True)
             if not is_compile:
                 raise RuntimeError("Executor compile failed.")
             if context.get_context("enable_ge"):
@@ -347,6 +368,7 @@ class _Executor:
         dic = dict(zip(args_names, args_list))
         key = generate_key(phase, dic)
         self.phase_prefix = str(key[1])
+        cache_phase = phase
         if phase == 'export':
             phase = phase + '.' + str(obj.create_time)
         else:
@@ -360,7 +382,8 @@ class _Executor:
             logger.debug("%r graph has existed.", phase)
             return phase, False
 
-        result = self._executor.compile(obj, args_list, phase, use_vm)
+        with _compile_time_breakdown(phase), _compile_cache.compiling(obj, args_list, cache_phase):
+            result = self._executor.compile(obj, args_list, phase, use_vm)
         self.compile_cache[phase] = phase
         if not result:
             raise RuntimeError("Executor compile failed.")
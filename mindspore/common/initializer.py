@@ -13,19 +13,24 @@
 # limitations under the License.
 # ============================================================================
 """Initializer for cell parameters."""
+import os
 import numbers
 import math
 
 from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from scipy.stats import truncnorm
 from mindspore import log as logger
 
 from . import dtype as mstype
 from .tensor import Tensor
+from ._lazy_tensor import LazyTensor
 
 _INITIALIZER_ALIAS = dict()
 
+# the random values are generated in chunks of this number of elements, each chunk by its own generator
+_RANDOM_CHUNK_SIZE = 1 << 20
+
 
 class Initializer:
     """
@@ -64,6 +69,78 @@ def _register(*aliases):
     return alias_reg
 
 
+class _RandomInitializer(Initializer):
+    """
+    The base class of the initializers of random values.
+
+    The values are generated from a seed in chunks, which are filled in parallel. If the seed is not given, it is
+    drawn from the global numpy random state, so the values are reproducible by `numpy.random.seed`.
+    """
+    def __call__(self, arr, seed=None):
+        if seed is None:
+            seed = _draw_seed()
+        return self._initialize(arr, seed)
+
+
+def _draw_seed():
+    """Draw a seed for the random initialization from the global numpy random state."""
+    return int(np.random.randint(0, np.iinfo(np.int64).max, dtype=np.int64))
+
+
+def _random_fill(arr, fill, seed):
+    """
+    Fill the array with random values generated by `fill(generator, out)` on each chunk of the flattened array.
+
+    Each chunk has its own generator spawned from the seed, so the values only depend on the seed, not on the
+    number of threads. The generators release the GIL while filling, so the chunks are filled in parallel.
+    The values are generated in the dtype of the array if it is float32 or float64, otherwise in float32 and cast.
+    """
+    if arr.dtype in (np.float32, np.float64) and arr.flags['C_CONTIGUOUS']:
+        buffer = arr
+    else:
+        buffer = np.empty(arr.shape, np.float32)
+    flat = buffer.reshape(-1)
+    num_chunks = max(1, (flat.size + _RANDOM_CHUNK_SIZE - 1) // _RANDOM_CHUNK_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(num_chunks)
+
+    def fill_chunk(index):
+        generator = np.random.Generator(np.random.PCG64(seeds[index]))
+        fill(generator, flat[index * _RANDOM_CHUNK_SIZE:(index + 1) * _RANDOM_CHUNK_SIZE])
+
+    if num_chunks == 1:
+        fill_chunk(0)
+    else:
+        with ThreadPoolExecutor(min(num_chunks, os.cpu_count() or 1)) as executor:
+            list(executor.map(fill_chunk, range(num_chunks)))
+    if buffer is not arr:
+        _assignment(arr, buffer)
+
+
+def _uniform_fill(arr, low, high, seed):
+    """Fill the array with values from U(low, high)."""
+    def fill(generator, out):
+        generator.random(dtype=out.dtype, out=out)
+        out *= high - low
+        out += low
+
+    _random_fill(arr, fill, seed)
+
+
+def _normal_fill(arr, sigma, seed, truncated=False):
+    """Fill the array with values from N(0, sigma), which are within [-2 * sigma, 2 * sigma] if truncated."""
+    def fill(generator, out):
+        generator.standard_normal(dtype=out.dtype, out=out)
+        if truncated:
+            # redraw the values out of the bound, which are about 4.6% of all
+            outside = np.abs(out) > 2
+            while outside.any():
+                out[outside] = generator.standard_normal(int(outside.sum()), dtype=out.dtype)
+                outside = np.abs(out) > 2
+        out *= sigma
+
+    _random_fill(arr, fill, seed)
+
+
 def _assignment(arr, num):
     """Assign the value of `num` to `arr`."""
     if arr.shape == ():
@@ -133,7 +210,7 @@ def _calculate_in_and_out(arr):
 
 
 @_register('xavier_uniform')
-class XavierUniform(Initializer):
+class XavierUniform(_RandomInitializer):
     r"""
     Initialize the array with xavier uniform algorithm, and from a uniform distribution collect samples within
     U[-boundary, boundary] where :math:`boundary = gain * \sqrt{\frac{6}{n_{in} + n_{out}}}`.
@@ -148,17 +225,15 @@ class XavierUniform(Initializer):
         super(XavierUniform, self).__init__(gain=gain)
         self.gain = gain
 
-    def _initialize(self, arr):
+    def _initialize(self, arr, seed):
         n_in, n_out = _calculate_in_and_out(arr)
 
         boundary = self.gain * math.sqrt(6.0 / (n_in + n_out))
-        data = np.random.uniform(-boundary, boundary, arr.shape)
-
-        _assignment(arr, data)
+        _uniform_fill(arr, -boundary, boundary, seed)
 
 
 @_register('he_uniform')
-class HeUniform(Initializer):
+class HeUniform(_RandomInitializer):
     r"""
     Initialize the array with He kaiming uniform algorithm, and from a uniform distribution collect samples within
     U[-boundary, boundary] where :math:`boundary = \sqrt{\frac{6}{n_{in}}}` where :math:`n_{in}` is the number of
@@ -171,13 +246,11 @@ class HeUniform(Initializer):
         Array, assigned array.
     """
 
-    def _initialize(self, arr):
+    def _initialize(self, arr, seed):
         n_in, _ = _calculate_in_and_out(arr)
 
         boundary = math.sqrt(6.0 / n_in)
-        data = np.random.uniform(-boundary, boundary, arr.shape)
-
-        _assignment(arr, data)
+        _uniform_fill(arr, -boundary, boundary, seed)
 
 
 class _Constant(Initializer):
@@ -199,7 +272,7 @@ class _Constant(Initializer):
 
 
 @_register()
-class Uniform(Initializer):
+class Uniform(_RandomInitializer):
     """
     Initialize a uniform array, and obtain values U(-scale, scale) from the uniform distribution
     to fill the input tensor.
@@ -214,13 +287,12 @@ class Uniform(Initializer):
         super(Uniform, self).__init__(scale=scale)
         self.scale = scale
 
-    def _initialize(self, arr):
-        tmp = np.random.uniform(-self.scale, self.scale, arr.shape)
-        _assignment(arr, tmp)
+    def _initialize(self, arr, seed):
+        _uniform_fill(arr, -self.scale, self.scale, seed)
 
 
 @_register()
-class Normal(Initializer):
+class Normal(_RandomInitializer):
     """
     Initialize a normal array, and obtain values N(0, sigma) from the uniform distribution
     to fill the input tensor.
@@ -235,13 +307,12 @@ class Normal(Initializer):
         super(Normal, self).__init__(sigma=sigma)
         self.sigma = sigma
 
-    def _initialize(self, arr):
-        tmp = np.random.normal(0, self.sigma, arr.shape)
-        _assignment(arr, tmp)
+    def _initialize(self, arr, seed):
+        _normal_fill(arr, self.sigma, seed)
 
 
 @_register()
-class TruncatedNormal(Initializer):
+class TruncatedNormal(_RandomInitializer):
     """
     Initialize a truncated normal distribution which is a bounded normal distribution within N(low, high).
 
@@ -255,12 +326,40 @@ class TruncatedNormal(Initializer):
         super(TruncatedNormal, self).__init__(sigma=sigma)
         self.sigma = sigma
 
-    def _initialize(self, arr):
-        tmp = truncnorm.rvs(-2, 2, loc=0, scale=self.sigma, size=arr.shape, random_state=None)
-        _assignment(arr, tmp)
+    def _initialize(self, arr, seed):
+        _normal_fill(arr, self.sigma, seed, truncated=True)
+
 
+class _InitializerTensor(LazyTensor):
+    """
+    The tensor data of an initializer, which is generated in the target dtype when it is materialized.
+
+    The seed of a random initializer is drawn when the tensor is created, so the values do not depend on the
+    order of materialization. The materialized tensor is kept, the clones of a parameter share it.
 
-def initializer(init, shape=None, dtype=mstype.float32):
+    Args:
+        init_obj (Initializer): The initializer.
+        shape (tuple): The shape of the tensor.
+        dtype (:class:`mindspore.dtype`): The data type of the tensor.
+    """
+    def __init__(self, init_obj, shape, dtype):
+        super(_InitializerTensor, self).__init__(shape, dtype)
+        self._init_obj = init_obj
+        self._seed = _draw_seed() if isinstance(init_obj, _RandomInitializer) else None
+        self._tensor = None
+
+    def to_tensor(self):
+        if self._tensor is None:
+            arr = np.empty(self._shape, mstype.dtype_to_nptype(self._dtype))
+            if self._seed is None:
+                self._init_obj(arr)
+            else:
+                self._init_obj(arr, self._seed)
+            self._tensor = Tensor(arr, dtype=self._dtype)
+        return self._tensor
+
+
+def initializer(init, shape=None, dtype=mstype.float32, lazy=False):
     """
     Create and initialize a tensor.
 
@@ -269,12 +368,16 @@ def initializer(init, shape=None, dtype=mstype.float32):
         shape (Union[tuple, list, int]): A list of integers, a tuple of integers or an integer as the shape of
                                          output. Default: None.
         dtype (:class:`mindspore.dtype`): The type of data in initialized tensor. Default: mstype.float32.
+        lazy (bool): Whether to defer the initialization. If True, a `LazyTensor` recording the initializer, shape
+                     and dtype is returned for a `Parameter`, the data is only generated when the parameter is used
+                     the first time, and never if the parameter is loaded from a checkpoint before. Default: False.
 
     Returns:
-        Tensor, initialized tensor.
+        Tensor, initialized tensor, or a `LazyTensor` if lazy is True and init is not a Tensor.
 
     Examples:
         >>> tensor = initializer('ones', [1, 2, 3], mstype.float32)
+        >>> weight = Parameter(initializer('normal', [1024, 1024], mstype.float32, lazy=True), name='weight')
     """
     if not isinstance(init, (Tensor, numbers.Number, str, Initializer)):
         raise TypeError('Unsupported init type.')
@@ -288,7 +391,7 @@ def initializer(init, shape=None, dtype=mstype.float32):
         return init
 
     try:
-        arr = np.ndarray(shape)
+        shape = np.empty(shape, np.bool_).shape
     except ValueError:
         msg = "Error shape={}".format(shape)
         logger.error(msg)
@@ -301,8 +404,10 @@ def initializer(init, shape=None, dtype=mstype.float32):
     else:
         init_obj = init
 
-    init_obj(arr)
-    return Tensor(arr, dtype=dtype)
+    tensor = _InitializerTensor(init_obj, shape, dtype)
+    if lazy:
+        return tensor
+    return tensor.to_tensor()
 
 
 __all__ = [
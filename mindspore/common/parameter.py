@@ -18,6 +18,7 @@ from copy import copy
 import numpy as np
 from .initializer import initializer
 from .tensor import Tensor
+from ._lazy_tensor import LazyTensor
 from .._checkparam import _check_str_by_regular
 from ..parallel._utils import _set_clone_info, _CloneInfo
 
@@ -42,7 +43,8 @@ class Parameter:
         Each parameter of Cell is represented by Parameter class.
 
     Args:
-        default_input (Tensor): A parameter tensor.
+        default_input (Tensor): A parameter tensor. It can also be a `LazyTensor`, whose data is only
+            materialized when `default_input` is accessed the first time.
         name (str): Name of the child parameter.
         requires_grad (bool): True if the parameter requires gradient. Default: True.
         layerwise_parallel (bool): A kind of model parallel mode. When layerwise_parallel is true in paralle mode,
@@ -122,9 +124,9 @@ class Parameter:
         x.name = prefix + '.' + x.name
         x.is_init = False
         if init != 'same':
-            shape = self.default_input.shape()
-            dtype = self.default_input.dtype()
-            x.default_input = initializer(init, shape=shape, dtype=dtype)
+            shape = self.lazy_data.shape()
+            dtype = self.lazy_data.dtype()
+            x.default_input = initializer(init, shape=shape, dtype=dtype, lazy=True)
 
         x.clone_info = copy(self.clone_info)
         _set_clone_info(self.clone_info, x.clone_info)
@@ -155,9 +157,32 @@ class Parameter:
     def data(self):
         return self.default_input
 
+    @property
+    def default_input(self):
+        """Get the data of the parameter, the lazy data is materialized here."""
+        if isinstance(self._default_input, LazyTensor):
+            self._default_input = self._default_input.to_tensor()
+        return self._default_input
+
+    @default_input.setter
+    def default_input(self, data):
+        self._default_input = data
+
+    @property
+    def lazy_data(self):
+        """Get the data of the parameter without materializing it, which may be a `LazyTensor`."""
+        return self._default_input
+
+    @property
+    def is_lazy(self):
+        """Whether the data of the parameter has not been materialized yet."""
+        return isinstance(self._default_input, LazyTensor)
+
     def set_parameter_data(self, data):
-        if isinstance(data, (Tensor, list, int, float,
-                             np.float16, np.float32, np.int32, np.int16, np.ndarray)) and not isinstance(data, bool):
+        if isinstance(data, LazyTensor):
+            self.default_input = data
+        elif isinstance(data, (Tensor, list, int, float,
+                               np.float16, np.float32, np.int32, np.int16, np.ndarray)) and not isinstance(data, bool):
             if isinstance(data, Tensor):
                 # make a copy of Tensor to init the parameter
                 data = Tensor(data.asnumpy().copy())
@@ -103,6 +103,7 @@ class _Context:
         self._thread_local_info = _ThreadLocalInfo()
         self._context_switches = _ContextSwitchInfo(True)
         self._context_handle = MSContext.get_instance()
+        self._compile_cache_path = ""
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -342,6 +343,16 @@ class _Context:
         thread_info = self._thread_local_info
         thread_info.debug_runtime = enable
 
+    @property
+    def compile_cache_path(self):
+        """Gets the directory of the persistent compile cache, empty if it is disabled."""
+        return self._compile_cache_path
+
+    @compile_cache_path.setter
+    def compile_cache_path(self, compile_cache_path):
+        """Sets the directory of the persistent compile cache, empty to disable it."""
+        self._compile_cache_path = compile_cache_path
+
 
 def check_input_fotmat(x):
     import re
@@ -457,7 +468,7 @@ def reset_auto_parallel_context():
                  enable_mem_reuse=bool, save_ms_model=bool, save_ms_model_path=str, enable_gpu_summary=bool,
                  enable_auto_mixed_precision=bool, enable_dump=bool, save_dump_path=str,
                  enable_reduce_precision=bool, enable_dynamic_memory=bool, graph_memory_max_size=str,
-                 variable_memory_max_size=str)
+                 variable_memory_max_size=str, compile_cache_path=str)
 def set_context(**kwargs):
     """
     Set context for running environment.
@@ -501,6 +512,9 @@ def set_context(**kwargs):
         enable_dynamic_memory (bool): Whether to enable dynamic memory. Default: False.
         graph_memory_max_size (str): Set graph memory max size. Default: "26GB".
         variable_memory_max_size (str): Set variable memory max size. Default: "5GB".
+        compile_cache_path (str): Path of the persistent compile cache, which keeps the front-end results of the
+            compiled networks for the restarted jobs and the other workers compiling the same networks. An empty
+            path disables the cache. Default: "".
 
     Raises:
         ValueError: If input key is not an attribute in context.
@@ -521,6 +535,7 @@ def set_context(**kwargs):
         >>> context.set_context(enable_dynamic_memory=True)
         >>> context.set_context(graph_memory_max_size="25GB")
         >>> context.set_context(variable_memory_max_size="6GB")
+        >>> context.set_context(compile_cache_path="./compile_cache")
         >>> context.set_context(mode=context.GRAPH_MODE,
         >>>                     device_target="Ascend",device_id=0, save_graphs=True,
         >>>                     save_graphs_path="/mindspore")
@@ -16,11 +16,16 @@
 The configuration manager.
 """
 
+from multiprocessing import cpu_count
+
 import mindspore._c_dataengine as cde
 
 INT32_MAX = 2147483647
 UINT32_MAX = 4294967295
 
+# autotune is a python side setting shared by all the ConfigurationManager instances
+_AUTOTUNE = {"enable": False, "cpu_budget": None}
+
 
 class ConfigurationManager:
     """The configuration manager"""
@@ -115,6 +120,58 @@ class ConfigurationManager:
         """
         return self.config.get_num_parallel_workers()
 
+    def set_autotune(self, enable, cpu_budget=None):
+        """
+        Enable or disable the autotune of the dataset pipelines.
+
+        When enabled, every iterator samples the output queues of its operators, and when the iterator is
+        exhausted or released, the num_parallel_workers of the map, batch and source operators and the prefetch
+        size are rebalanced for the next launch of the pipeline. The total number of workers stays within
+        cpu_budget. The final settings are logged so that they can be pinned.
+
+        Args:
+            enable (bool): Whether to enable the autotune.
+            cpu_budget (int, optional): Total number of workers of the tuned operators (default=None, means
+                the number of CPU cores).
+
+        Raises:
+            TypeError: If enable is not bool.
+            ValueError: If cpu_budget is invalid (<= 0 or > number of CPU cores).
+
+        Examples:
+            >>> import mindspore.dataset as ds
+            >>> con = ds.engine.ConfigurationManager()
+            >>> # tunes the pipelines with 16 workers in total
+            >>> con.set_autotune(True, 16)
+        """
+        if not isinstance(enable, bool):
+            raise TypeError("Autotune enable should be bool")
+        if cpu_budget is not None and (isinstance(cpu_budget, bool) or not isinstance(cpu_budget, int)
+                                       or cpu_budget <= 0 or cpu_budget > cpu_count()):
+            raise ValueError("Autotune cpu budget given is not within the required range")
+        _AUTOTUNE["enable"] = enable
+        _AUTOTUNE["cpu_budget"] = cpu_budget
+
+    def get_autotune(self):
+        """
+        Get whether the autotune is enabled.
+
+        Returns:
+            Bool, whether the autotune is enabled.
+        """
+        return _AUTOTUNE["enable"]
+
+    def get_autotune_cpu_budget(self):
+        """
+        Get the total number of workers of the tuned operators.
+
+        Returns:
+            Int, the cpu budget of the autotune.
+        """
+        if _AUTOTUNE["cpu_budget"] is None:
+            return cpu_count()
+        return _AUTOTUNE["cpu_budget"]
+
     def __str__(self):
         """
         String representation of the configurations.
@@ -0,0 +1,115 @@
+# Copyright 2019 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Autotune of the dataset pipeline.
+
+The operators of an execution tree get their number of workers when the tree is launched, so the autotune
+rebalances the settings of the python nodes from the profile of a run, and they take effect in the next
+launch of the pipeline, e.g. the iterator of the next epoch or the next training.
+"""
+from mindspore import log as logger
+from . import datasets as de
+from .profiling import _EMPTY_OCCUPANCY, _FULL_OCCUPANCY
+from ..core.configuration import config
+
+# the limit of the prefetch size the autotune sets
+_MAX_PREFETCH_SIZE = 128
+# the consumer waiting longer than this ratio of the run asks for a deeper prefetch
+_CONSUMER_WAIT_RATIO = 0.1
+
+
+def _is_tunable(node):
+    """Whether the num_parallel_workers of the node is applied when the tree is launched."""
+    if isinstance(node, (de.GeneratorDataset, de.CacheDataset)):
+        # the workers of generator are created with the dataset, and the cache is a generator source
+        return False
+    return isinstance(node, (de.MapDataset, de.BatchDataset, de.SourceDataset))
+
+
+class AutoTune:
+    """
+    Rebalance the num_parallel_workers of the nodes and the prefetch size from a profiled run.
+
+    An operator whose output queue is mostly empty while its input queues are mostly full gets more workers,
+    and an operator whose output queue is mostly full gives workers back, as its consumer is slower. The
+    prefetch size is doubled when the consumer of the pipeline waits for the rows.
+
+    Args:
+        nodes (list[Dataset]): Python nodes in pre-order, in the same order as the operators of the profile.
+        cpu_budget (int): Total number of workers of the tunable nodes.
+    """
+
+    def __init__(self, nodes, cpu_budget):
+        self.nodes = nodes
+        self.cpu_budget = cpu_budget
+
+    def tune(self, profile):
+        """
+        Tune the nodes and the prefetch size with the profile.
+
+        Args:
+            profile (dict): Result of PipelineProfiler.to_dict.
+
+        Returns:
+            Dict, the final num_parallel_workers of the tunable nodes and the prefetch size.
+        """
+        ops = profile["ops"]
+        default_workers = config.get_num_parallel_workers()
+        workers = {}
+        scores = {}
+        for i, node in enumerate(self.nodes):
+            if not _is_tunable(node) or ops[i]["avg_queue_occupancy"] is None:
+                continue
+            workers[i] = node.num_parallel_workers if node.num_parallel_workers is not None else default_workers
+            inputs = [op["avg_queue_occupancy"] for op in ops
+                      if op["parent"] == i and op["avg_queue_occupancy"] is not None]
+            # a source is never waiting for its input
+            scores[i] = (min(inputs) if inputs else 1.0) - ops[i]["avg_queue_occupancy"]
+
+        # give back the workers of the operators waiting for their consumer first
+        new_workers = dict(workers)
+        for i in workers:
+            if ops[i]["avg_queue_occupancy"] >= _FULL_OCCUPANCY and ops[i]["parent"] >= 0:
+                new_workers[i] = max(1, workers[i] - 1)
+
+        # then grow the starving operators from the slowest one, within the budget
+        total = sum(new_workers.values())
+        for i in sorted(scores, key=lambda i: scores[i], reverse=True):
+            starving = ops[i]["avg_queue_occupancy"] < _EMPTY_OCCUPANCY and scores[i] >= _FULL_OCCUPANCY - \
+                _EMPTY_OCCUPANCY
+            if not starving:
+                continue
+            grow = min(max(1, workers[i] // 2), self.cpu_budget - total)
+            if grow <= 0:
+                break
+            new_workers[i] += grow
+            total += grow
+
+        for i, num in new_workers.items():
+            self.nodes[i].num_parallel_workers = num
+
+        prefetch_size = config.get_prefetch_size()
+        if profile["consumer"]["wait_ratio"] > _CONSUMER_WAIT_RATIO and prefetch_size < _MAX_PREFETCH_SIZE:
+            prefetch_size = min(prefetch_size * 2, _MAX_PREFETCH_SIZE)
+            config.set_prefetch_size(prefetch_size)
+
+        settings = {"num_parallel_workers": {"{}({})".format(ops[i]["name"], ops[i]["id"]): num
+                                             for i, num in new_workers.items()},
+                    "prefetch_size": prefetch_size}
+        changes = ["{}({}) {} -> {}".format(ops[i]["name"], ops[i]["id"], workers[i], num)
+                   for i, num in new_workers.items() if num != workers[i]]
+        logger.info("Dataset autotune changed: [{}], final settings: {}, pin them with num_parallel_workers of the "
+                    "operators and ds.config.set_prefetch_size.".format(", ".join(changes), settings))
+        return settings
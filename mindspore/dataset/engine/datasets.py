@@ -19,10 +19,18 @@ high performance and parse data precisely. It also provides the following
 operations for users to preprocess data: shuffle, batch, repeat, map, and zip.
 """
 import glob
+import collections
 import json
 import math
+import mmap
+import multiprocessing
 import os
+import pickle
+import queue
 import random
+import tempfile
+import threading
+import traceback
 import uuid
 from enum import Enum
 from importlib import import_module
@@ -38,7 +46,7 @@ from .iterators import DictIterator, TupleIterator
 from .validators import check, check_batch, check_shuffle, check_map, check_repeat, check_zip, check_rename, \
     check_project, check_imagefolderdatasetv2, check_mnist_cifar_dataset, check_manifestdataset, \
     check_tfrecorddataset, check_vocdataset, check_celebadataset, check_minddataset, check_generatordataset, \
-    check_zip_dataset
+    check_zip_dataset, check_cache
 from ..core.datatypes import mstype_to_detype, mstypelist_to_detypelist
 
 try:
@@ -499,6 +507,44 @@ class Dataset:
 
         return ProjectDataset(self, columns)
 
+    @check_cache
+    def cache(self, memory_budget=1 << 30, spill_dir=None):
+        """
+        Caches the rows of this dataset, so that the pipeline before the cache only runs once.
+
+        The first pass reads the rows from the input pipeline and stores them, the later epochs and repeat
+        passes are served from the cache in the same order. The rows are kept in memory up to memory_budget
+        bytes, the least recently used rows beyond the budget are spilled to a memory-mapped file.
+
+        Note:
+            The random operations before the cache, such as shuffle, are only applied once. Put them after
+            the cache to get a different order in each epoch.
+
+        Args:
+            memory_budget (int, optional): Number of bytes of the rows kept in memory (default=1 << 30).
+            spill_dir (str, optional): Directory of the spill file (default=None, means the system temporary
+                directory). The spill file is deleted when the cache is released.
+
+        Returns:
+            CacheDataset, dataset cached.
+
+        Examples:
+            >>> import mindspore.dataset as ds
+            >>> import mindspore.dataset.transforms.vision.c_transforms as c_vision
+            >>> # data is an instance of ImageFolderDatasetV2 object.
+            >>> # decode and resize the images once, keep 2GB of them in memory and spill the rest to /tmp
+            >>> data = data.map(input_columns="image", operations=[c_vision.Decode(), c_vision.Resize((224, 224))])
+            >>> data = data.cache(memory_budget=2 << 30, spill_dir="/tmp")
+            >>> data = data.shuffle(1000).batch(32).repeat(10)
+            >>> iterator = data.create_dict_iterator()
+            >>> for item in iterator:
+            >>>     pass
+            >>> # hit/miss statistics of the caches in the pipeline
+            >>> print(iterator.get_cache_statistics())
+        """
+
+        return CacheDataset(self, memory_budget, spill_dir)
+
     def device_que(self, prefetch_size=None):
         """
         Returns a transferredDataset that transfer data through tdt.
@@ -584,7 +630,7 @@ class Dataset:
 
         return TransferDataset(self, queue_name, device_id, device_type, num_batch)
 
-    def create_tuple_iterator(self, columns=None):
+    def create_tuple_iterator(self, columns=None, profile=False):
         """
         Create an Iterator over the dataset. The data retrieved will be a list of ndarray of data.
 
@@ -594,6 +640,8 @@ class Dataset:
         Args:
             columns (list[str], optional): List of columns to be used to specify the order of columns
                 (defaults=None, means all columns).
+            profile (bool, optional): Sample the throughput and queue occupancy of each operator, the
+                result is available from iterator.profiler (default=False).
 
         Returns:
             Iterator, list of ndarray.
@@ -607,16 +655,27 @@ class Dataset:
             >>> for item in iterator:
             >>>     # convert the returned tuple to a list and print
             >>>     print(list(item))
+            >>>
+            >>> # profiles the pipeline, and dumps the result as a Chrome trace
+            >>> iterator = data.create_tuple_iterator(profile=True)
+            >>> for item in iterator:
+            >>>     pass
+            >>> print(iterator.profiler.summary())
+            >>> iterator.profiler.dump("pipeline_trace.json", "chrome")
         """
-        return TupleIterator(self, columns)
+        return TupleIterator(self, columns, profile)
 
-    def create_dict_iterator(self):
+    def create_dict_iterator(self, profile=False):
         """
         Create an Iterator over the dataset.
 
         The data retrieved will be a dictionary. The order
         of the columns in the dictionary may not be the same as the original order.
 
+        Args:
+            profile (bool, optional): Sample the throughput and queue occupancy of each operator, the
+                result is available from iterator.profiler (default=False).
+
         Returns:
             Iterator, dictionary of column_name-ndarray pair.
 
@@ -631,7 +690,7 @@ class Dataset:
             >>>     print(item["column1"])
 
         """
-        return DictIterator(self)
+        return DictIterator(self, profile)
 
     def __iter__(self):
         """Create an Iterator over the dataset."""
@@ -1140,6 +1199,230 @@ class ProjectDataset(DatasetOp):
         return args
 
 
+class _RowCache:
+    """
+    Rows of CacheDataset, kept in memory within the budget and spilled to a memory-mapped file beyond it.
+
+    Args:
+        memory_budget (int): Number of bytes of the rows kept in memory.
+        spill_dir (str): Directory of the spill file, None means the system temporary directory.
+    """
+
+    def __init__(self, memory_budget, spill_dir):
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.column_names = None
+        self.complete = False
+        # index -> row, ordered from the least recently used
+        self._memory = collections.OrderedDict()
+        self._memory_bytes = 0
+        # index -> list of (dtype, shape, offset) of the arrays or (None, offset, length) of the pickled row
+        self._spilled = {}
+        self._spill_file = None
+        self._spill_bytes = 0
+        self._mmap = None
+        self._num_rows = 0
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return self._num_rows
+
+    def reset(self):
+        """Drop the rows of an incomplete pass."""
+        self.complete = False
+        self._memory.clear()
+        self._memory_bytes = 0
+        self._spilled.clear()
+        self._num_rows = 0
+        self._close_spill_file()
+
+    def put(self, row):
+        """Append a row read from the input pipeline."""
+        self.misses += 1
+        self._add_to_memory(self._num_rows, row)
+        self._num_rows += 1
+
+    def get(self, index):
+        """Get the row of the index, the spilled row is loaded back to memory."""
+        row = self._memory.get(index)
+        if row is not None:
+            self._memory.move_to_end(index)
+            self.hits += 1
+            return row
+        self.spill_hits += 1
+        row = self._load(index)
+        self._add_to_memory(index, row)
+        return row
+
+    def statistics(self):
+        """Get the statistics of the cache."""
+        return {"num_rows": self._num_rows,
+                "complete": self.complete,
+                "hits": self.hits,
+                "spill_hits": self.spill_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory_bytes": self._memory_bytes,
+                "spill_bytes": self._spill_bytes}
+
+    @staticmethod
+    def _row_bytes(row):
+        return sum([x.nbytes for x in row])
+
+    def _add_to_memory(self, index, row):
+        self._memory[index] = row
+        self._memory_bytes += self._row_bytes(row)
+        while self._memory_bytes > self.memory_budget and self._memory:
+            evicted, evicted_row = self._memory.popitem(last=False)
+            self._memory_bytes -= self._row_bytes(evicted_row)
+            self.evictions += 1
+            # the row never changes, so it is written to the spill file only once
+            if evicted not in self._spilled:
+                self._spill(evicted, evicted_row)
+
+    def _spill(self, index, row):
+        """Append the row to the spill file."""
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="mindspore_cache_", dir=self.spill_dir)
+        self._spill_file.seek(0, os.SEEK_END)
+        if any([x.dtype.hasobject for x in row]):
+            data = pickle.dumps(row)
+            self._spilled[index] = (None, self._spill_bytes, len(data))
+            self._spill_file.write(data)
+            self._spill_bytes += len(data)
+            return
+        meta = []
+        for x in row:
+            meta.append((x.dtype.str, x.shape, self._spill_bytes))
+            self._spill_file.write(np.ascontiguousarray(x).tobytes())
+            self._spill_bytes += x.nbytes
+        self._spilled[index] = meta
+
+    def _load(self, index):
+        """Read the row from the spill file, remap the file if it has grown."""
+        if self._mmap is None or len(self._mmap) < self._spill_bytes:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._spill_file.flush()
+            self._mmap = mmap.mmap(self._spill_file.fileno(), self._spill_bytes, access=mmap.ACCESS_READ)
+        meta = self._spilled[index]
+        if meta[0] is None:
+            _, offset, length = meta
+            return pickle.loads(self._mmap[offset:offset + length])
+        # copy the arrays out so that the mapping can be closed when the file grows
+        return tuple([np.frombuffer(self._mmap, np.dtype(dtype), int(np.prod(shape)), offset).reshape(shape).copy()
+                      for dtype, shape, offset in meta])
+
+    def _close_spill_file(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._spill_file is not None:
+            # the temporary file is deleted on close
+            self._spill_file.close()
+            self._spill_file = None
+        self._spill_bytes = 0
+
+    def __del__(self):
+        self._close_spill_file()
+
+
+class CacheDataset(DatasetOp):
+    """
+    The result of applying Cache operator to the input Dataset.
+
+    The input pipeline runs in a separate pipeline during the first pass, and this node becomes a generator
+    source of the pipeline after it, which replays the cached rows in the later passes.
+
+    Args:
+        input_dataset (Dataset): Input Dataset to be cached.
+        memory_budget (int): Number of bytes of the rows kept in memory.
+        spill_dir (str): Directory of the spill file, None means the system temporary directory.
+    """
+
+    def __init__(self, input_dataset, memory_budget, spill_dir):
+        super().__init__()
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.input.append(input_dataset)
+        input_dataset.output.append(self)
+        self._input_indexs = input_dataset.input_indexs
+        self._cache = _RowCache(memory_budget, spill_dir)
+        # the iterator of the input pipeline and its first row, started to get the column names
+        self._pending = None
+
+    def get_args(self):
+        args = super().get_args()
+        args["memory_budget"] = self.memory_budget
+        args["spill_dir"] = self.spill_dir
+        return args
+
+    def get_source_args(self):
+        """
+        Get the arguments of the generator source which replaces this node in the execution tree.
+
+        Returns:
+            Python dictionary.
+        """
+        if self._cache.column_names is None:
+            self._start_input_pipeline()
+        args = super().get_args()
+        args["generator_function"] = self._generate
+        args["column_names"] = self._cache.column_names
+        args["column_types"] = None
+        args["prefetch_size"] = None
+        args["sampler"] = None
+        return args
+
+    def cache_statistics(self):
+        """
+        Get the statistics of the cache.
+
+        Return:
+            Dict, the number of rows, whether the first pass is complete, the number of rows served from
+            memory (hits), from the spill file (spill_hits) and from the input pipeline (misses), the number of
+            evicted rows and the bytes in memory and in the spill file.
+        """
+        return self._cache.statistics()
+
+    def _start_input_pipeline(self):
+        """Start reading the input pipeline, the column names are taken in column order with its first row."""
+        iterator = self.input[0].create_tuple_iterator()
+        first_row = iterator.get_next()
+        if not first_row:
+            iterator.release()
+            raise RuntimeError("The input of cache is empty.")
+        self._cache.column_names = iterator.get_column_names()
+        self._pending = (iterator, first_row)
+
+    def _generate(self):
+        """Yield the rows of one pass, from the cache when the first pass has been completed."""
+        if self._cache.complete:
+            for index in range(len(self._cache)):
+                yield self._cache.get(index)
+            return
+
+        # a previous pass may be stopped early, drop its rows and read again
+        self._cache.reset()
+        if self._pending is None:
+            self._start_input_pipeline()
+        iterator, row = self._pending
+        self._pending = None
+        try:
+            while row:
+                cached_row = tuple(row)
+                self._cache.put(cached_row)
+                yield cached_row
+                row = iterator.get_next()
+        finally:
+            iterator.release()
+        self._cache.complete = True
+        logger.info("Cache of {} rows is complete: {}".format(len(self._cache), self._cache.statistics()))
+
+
 class TransferDataset(DatasetOp):
     """
     The result of applying TDT operator to the input Dataset.
@@ -1171,10 +1454,10 @@ class TransferDataset(DatasetOp):
         args["num_batch"] = self.__num_batch
         return args
 
-    def create_dict_iterator(self):
+    def create_dict_iterator(self, profile=False):
         raise RuntimeError("TransferDataset is not iterable")
 
-    def create_tuple_iterator(self, columns=None):
+    def create_tuple_iterator(self, columns=None, profile=False):
         raise RuntimeError("TransferDataset is not iterable")
 
     def __iter__(self):
@@ -1695,6 +1978,157 @@ def sampler_fn(sampler, dataset):
         yield tuple([np.array(x) for x in val])
 
 
+def sampler_fn_mp(sampler, dataset, num_worker, multi_process):
+    """Yield the rows of the sampler indices in order, the rows are fetched by parallel workers."""
+    sample_fn = _SamplerFn(dataset, num_worker, multi_process)
+    return sample_fn.process(iter(sampler))
+
+
+# number of rows in flight for each generator worker
+_GENERATOR_WORKER_SLOTS = 2
+# bytes of the shared memory for one row, the larger rows are sent through the result queue
+_GENERATOR_WORKER_ROW_SIZE = 16 * 1024 * 1024
+
+
+def _copy_row_to_shm(row, shm):
+    """Copy the arrays of a row to the shared memory, return their meta or None if the row does not fit."""
+    if any([x.dtype.hasobject for x in row]):
+        return None
+    # keep every array aligned, the padded total must fit before anything is written
+    offsets = []
+    offset = 0
+    for x in row:
+        offsets.append(offset)
+        offset += (x.nbytes + 7) // 8 * 8
+    if offset > len(shm):
+        return None
+    meta = []
+    for x, offset in zip(row, offsets):
+        shm[offset:offset + x.nbytes] = np.ascontiguousarray(x).reshape(-1).view(np.uint8)
+        meta.append((x.dtype.str, x.shape, offset))
+    return meta
+
+
+def _generator_worker_loop(dataset, idx_queue, result_queue, shms):
+    """
+    The loop of a generator worker, fetch the rows of the received indices until None is received.
+
+    The row is written to the shared memory slot given with the index when the slot is available, otherwise
+    the row itself is put into the result queue.
+    """
+    while True:
+        item = idx_queue.get()
+        if item is None:
+            return
+        slot, idx = item
+        try:
+            row = tuple([np.array(x) for x in dataset[idx]])
+            meta = _copy_row_to_shm(row, shms[slot]) if shms is not None else None
+            if meta is None:
+                result_queue.put(("row", row))
+            else:
+                result_queue.put(("shm", meta))
+        except Exception:
+            result_queue.put(("error", traceback.format_exc()))
+
+
+class _GeneratorWorkerMt(threading.Thread):
+    """Worker thread that fetches the rows of the received indices."""
+    def __init__(self, dataset):
+        self.idx_queue = queue.Queue()
+        self.res_queue = queue.Queue()
+        self.shms = None
+        super().__init__(target=_generator_worker_loop, args=(dataset, self.idx_queue, self.res_queue, None))
+        self.daemon = True
+
+
+class _GeneratorWorkerMp(multiprocessing.Process):
+    """Worker process that fetches the rows of the received indices and returns them over shared memory."""
+    def __init__(self, dataset):
+        self.idx_queue = multiprocessing.Queue()
+        self.res_queue = multiprocessing.Queue()
+        self.shms = [np.frombuffer(multiprocessing.RawArray('B', _GENERATOR_WORKER_ROW_SIZE), np.uint8)
+                     for _ in range(_GENERATOR_WORKER_SLOTS)]
+        super().__init__(target=_generator_worker_loop, args=(dataset, self.idx_queue, self.res_queue, self.shms))
+        self.daemon = True
+
+
+class _SamplerFn:
+    """
+    Fetch the rows of the sampler indices by parallel workers.
+
+    The indices are assigned to the workers round-robin, so every worker gets a disjoint slice of the
+    indices and the results are read back in the sampler order.
+
+    Args:
+        dataset (object): The random-accessible source of GeneratorDataset.
+        num_worker (int): Number of the workers.
+        multi_process (bool): Use processes instead of threads as workers.
+    """
+    def __init__(self, dataset, num_worker, multi_process):
+        self.num_worker = num_worker
+        if multi_process:
+            self.workers = [_GeneratorWorkerMp(dataset) for _ in range(num_worker)]
+        else:
+            self.workers = [_GeneratorWorkerMt(dataset) for _ in range(num_worker)]
+        for worker in self.workers:
+            worker.start()
+
+    def process(self, indices):
+        """Yield the rows of the indices in order."""
+        try:
+            # the i-th index is sent to the (i % num_worker)-th worker with the (i // num_worker % slots)-th slot
+            sent = 0
+            for _ in range(self.num_worker * _GENERATOR_WORKER_SLOTS):
+                if not self._send(sent, indices):
+                    break
+                sent += 1
+
+            received = 0
+            while received < sent:
+                worker = self.workers[received % self.num_worker]
+                slot = received // self.num_worker % _GENERATOR_WORKER_SLOTS
+                row = self._receive(worker, slot)
+                received += 1
+                # the slot is free after the row is copied out, refill the worker
+                if self._send(sent, indices):
+                    sent += 1
+                yield row
+        finally:
+            self._stop()
+
+    def _send(self, count, indices):
+        """Send the next index, return False when the indices are exhausted."""
+        try:
+            idx = next(indices)
+        except StopIteration:
+            return False
+        worker = self.workers[count % self.num_worker]
+        worker.idx_queue.put((count // self.num_worker % _GENERATOR_WORKER_SLOTS, idx))
+        return True
+
+    @staticmethod
+    def _receive(worker, slot):
+        """Get the next row of the worker."""
+        kind, result = worker.res_queue.get()
+        if kind == "error":
+            raise RuntimeError("Exception in generator worker:\n" + result)
+        if kind == "row":
+            return result
+        shm = worker.shms[slot]
+        return tuple([np.frombuffer(shm, np.dtype(dtype), int(np.prod(shape)), offset).reshape(shape).copy()
+                      for dtype, shape, offset in result])
+
+    def _stop(self):
+        for worker in self.workers:
+            if isinstance(worker, multiprocessing.Process):
+                worker.terminate()
+            else:
+                worker.idx_queue.put(None)
+        for worker in self.workers:
+            worker.join()
+
+
 class GeneratorDataset(SourceDataset):
     """
     A source dataset that generate data from calling generator function each epoch.
@@ -1708,6 +2142,12 @@ class GeneratorDataset(SourceDataset):
             If provided, sanity check will be performed on generator output.
         prefetch_size (int, optional): Prefetch number of records ahead of the user's request (default=None).
         sampler (Sampler, optional): Object used to choose samples from the dataset (default=None).
+        num_parallel_workers (int, optional): Number of workers to fetch the rows in parallel (default=1).
+            It only takes effect when the source is random-accessible, that is, a sampler is given or the
+            source supports `__getitem__` and `__len__`. The rows are returned in the order of the indices.
+        python_multiprocessing (bool, optional): Use processes instead of threads as the parallel workers, the
+            rows are returned over shared memory (default=True). Threads are useful when the source
+            releases the GIL, for example when it decodes in native code.
 
     Examples:
         >>> import mindspore.dataset as ds
@@ -1723,12 +2163,29 @@ class GeneratorDataset(SourceDataset):
         >>>         yield (np.array([i]), np.array([[i, i + 1], [i + 2, i + 3]]))
         >>> # create multi_column_generator_dataset with GeneratorMC() and column names "col1" and "col2"
         >>> multi_column_generator_dataset = ds.GeneratorDataset(generator_mc, ["col1, col2"])
+        >>> # 3) random-accessible source that is read by 4 worker processes
+        >>> class RandomAccessSource:
+        >>>     def __getitem__(self, index):
+        >>>         return (np.array([index]),)
+        >>>     def __len__(self):
+        >>>         return 64
+        >>> parallel_generator_dataset = ds.GeneratorDataset(RandomAccessSource(), ["col1"], num_parallel_workers=4)
     """
 
     @check_generatordataset
-    def __init__(self, generator_function, column_names, column_types=None, prefetch_size=None, sampler=None):
-        super().__init__(1)
-        if sampler is not None:
+    def __init__(self, generator_function, column_names, column_types=None, prefetch_size=None, sampler=None,
+                 num_parallel_workers=1, python_multiprocessing=True):
+        super().__init__(num_parallel_workers)
+        if sampler is None and num_parallel_workers > 1:
+            if hasattr(generator_function, "__getitem__") and hasattr(generator_function, "__len__"):
+                sampler = range(len(generator_function))
+            else:
+                logger.warning("The source of GeneratorDataset is not random-accessible, "
+                               "num_parallel_workers is ignored.")
+        if sampler is not None and num_parallel_workers > 1:
+            self.generator_function = (lambda: sampler_fn_mp(sampler, generator_function, num_parallel_workers,
+                                                             python_multiprocessing))
+        elif sampler is not None:
             self.generator_function = (lambda: sampler_fn(sampler, generator_function))
         else:
             try:
@@ -1750,6 +2207,7 @@ class GeneratorDataset(SourceDataset):
         self.distribution = ""
         self.prefetch_size = prefetch_size
         self.sampler = sampler
+        self.python_multiprocessing = python_multiprocessing
 
     def get_args(self):
         args = super().get_args()
@@ -14,6 +14,7 @@
 # ==============================================================================
 """Built-in iterators.
 """
+import time
 from abc import abstractmethod
 
 from mindspore._c_dataengine import DEPipeline
@@ -21,6 +22,9 @@ from mindspore._c_dataengine import OpName
 
 from mindspore import log as logger
 from . import datasets as de
+from .autotune import AutoTune
+from .profiling import PipelineProfiler
+from ..core.configuration import config
 
 ITERATORS_LIST = list()
 
@@ -32,7 +36,8 @@ def _cleanup():
 
 def alter_tree(node):
     """Traversing the python Dataset tree/graph to perform some alteration to some specific nodes."""
-    if not node.input:
+    # the input of a cache runs in its own pipeline, which alters it when it is created
+    if not node.input or isinstance(node, de.CacheDataset):
         return _alter_node(node)
 
     converted_children = []
@@ -70,11 +75,14 @@ class Iterator:
 
         Attributes:
             dataset: Dataset to be iterated over
+            profiler: PipelineProfiler of the pipeline when profiling or autotune is enabled, otherwise None
 
     """
 
-    def __init__(self, dataset):
+    def __init__(self, dataset, profile=False):
         ITERATORS_LIST.append(self)
+        self.profiler = None
+        self.__autotune = None
         self.dataset = alter_tree(dataset)
         if not self.__is_tree():
             raise ValueError("The data pipeline is not a tree (i.e., one node has 2 consumers)")
@@ -83,9 +91,17 @@ class Iterator:
         # for manifest temporary use
         self.__batch_node(self.dataset, 0)
 
+        # (name, index of the parent, C node) and the python nodes in pre-order, for profiling
+        self.__c_nodes = []
+        self.__py_nodes = []
         root = self.__convert_node_postorder(self.dataset)
         self.depipeline.AssignRootNode(root)
         self.depipeline.LaunchTreeExec()
+        if config.get_autotune():
+            self.__autotune = AutoTune(self.__py_nodes, config.get_autotune_cpu_budget())
+        if profile or self.__autotune is not None:
+            self.profiler = PipelineProfiler(self.__c_nodes)
+            self.profiler.start()
 
     def __is_tree_node(self, node):
         """Check if a node is tree node."""
@@ -153,12 +169,22 @@ class Iterator:
         return op_type
 
     # Convert python node into C node and add to C layer execution tree in postorder traversal.
-    def __convert_node_postorder(self, node):
+    def __convert_node_postorder(self, node, parent=-1):
+        if isinstance(node, de.CacheDataset):
+            # the cache is the source of this tree, its input is read by a separate pipeline
+            c_node = self.depipeline.AddNodeToTree(OpName.GENERATOR, node.get_source_args())
+            self.__c_nodes.append((node.__class__.__name__, parent, c_node))
+            self.__py_nodes.append(node)
+            return c_node
+
         op_type = self.__get_dataset_type(node)
         c_node = self.depipeline.AddNodeToTree(op_type, node.get_args())
+        index = len(self.__c_nodes)
+        self.__c_nodes.append((node.__class__.__name__, parent, c_node))
+        self.__py_nodes.append(node)
 
         for py_child in node.input:
-            c_child = self.__convert_node_postorder(py_child)
+            c_child = self.__convert_node_postorder(py_child, index)
             self.depipeline.AddChildToParentNode(c_child, c_node)
 
         return c_node
@@ -191,7 +217,18 @@ class Iterator:
         """
         self.__print_local(self.dataset, 0)
 
+    def __stop_profiler(self):
+        """Stop the profiler, and tune the python nodes with its result for the next launch."""
+        if self.profiler is None or self.profiler.stopped:
+            return
+        self.profiler.stop()
+        if self.__autotune is not None:
+            self.__autotune.tune(self.profiler.to_dict())
+
     def release(self):
+        # the profiler samples the C nodes, stop it before they are released
+        if getattr(self, 'profiler', None) is not None:
+            self.__stop_profiler()
         if hasattr(self, 'depipeline') and self.depipeline:
             del self.depipeline
 
@@ -200,11 +237,27 @@ class Iterator:
         pass
 
     def __next__(self):
-        data = self.get_next()
+        if self.profiler is not None:
+            start = time.time()
+            data = self.get_next()
+            self.profiler.record_consumer(time.time() - start, bool(data))
+            if not data:
+                self.__stop_profiler()
+        else:
+            data = self.get_next()
         if not data:
             raise StopIteration
         return data
 
+    def get_column_names(self):
+        """
+            Get the names of the output columns in column order, known after the first row is fetched
+
+        Returns:
+            List, the column names in the order of the rows of the tuple iterator.
+        """
+        return list(self.depipeline.GetColumnNames())
+
     def get_output_shapes(self):
         return [t for t in self.depipeline.GetOutputShapes()]
 
@@ -223,6 +276,22 @@ class Iterator:
     def num_classes(self):
         return self.depipeline.GetNumClasses()
 
+    def get_cache_statistics(self):
+        """
+            Get the hit/miss statistics of the caches in the dataset tree
+
+        Returns:
+            List, the statistics dict of each cache in pre-order.
+        """
+        statistics = []
+        nodes = [self.dataset]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, de.CacheDataset):
+                statistics.append(node.cache_statistics())
+            nodes.extend(reversed(node.input))
+        return statistics
+
 
 class DictIterator(Iterator):
     """
@@ -248,12 +317,12 @@ class TupleIterator(Iterator):
     The derived class of Iterator with list type.
     """
 
-    def __init__(self, dataset, columns=None):
+    def __init__(self, dataset, columns=None, profile=False):
         if columns is not None:
             if not isinstance(columns, list):
                 columns = [columns]
             dataset = dataset.project(columns)
-        super().__init__(dataset)
+        super().__init__(dataset, profile)
 
     def __iter__(self):
         return self
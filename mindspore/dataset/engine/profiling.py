@@ -0,0 +1,270 @@
+# Copyright 2019 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Profiling of the dataset pipeline.
+
+The profiler samples the operators of the execution tree while the pipeline is running: the number of rows
+each operator produced, the occupancy of its output connector queue and the CPU time of the process. The
+result can be dumped as json or as a Chrome trace (chrome://tracing), and summarized to find the slowest
+stage of the pipeline.
+"""
+import json
+import os
+import threading
+import time
+
+from mindspore import log as logger
+
+# an output queue is regarded as full or empty with the average occupancy beyond these thresholds
+_FULL_OCCUPANCY = 0.8
+_EMPTY_OCCUPANCY = 0.2
+
+
+class PipelineProfiler:
+    """
+    Sample the operators of a running dataset pipeline.
+
+    Args:
+        ops (list[tuple]): Operators of the execution tree in pre-order, each of them is the tuple of
+            (name, index of the parent, C++ operator), the root has no parent and its parent index is -1.
+        interval (float, optional): Sampling interval in seconds (default=0.1).
+    """
+
+    def __init__(self, ops, interval=0.1):
+        self.interval = interval
+        self._c_ops = [c_op for _, _, c_op in ops]
+        self.ops = [{"id": c_op.id(), "name": name, "parent": parent, "num_workers": c_op.num_workers(),
+                     "queue_capacity": c_op.connector_capacity()}
+                    for name, parent, c_op in ops]
+        # (timestamp, process cpu time, [(queue size, output rows) of each op])
+        self.samples = []
+        self.consumer_rows = 0
+        self.consumer_wait_time = 0.0
+        self._start_time = None
+        self._stop_time = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Start sampling in a background thread."""
+        self._start_time = time.time()
+        self._sample()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def stopped(self):
+        """Whether the sampling has been stopped."""
+        return self._stop_event.is_set()
+
+    def stop(self):
+        """Stop sampling, it must be called before the pipeline is released."""
+        if self._thread is None or self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._sample()
+        self._stop_time = time.time()
+
+    def record_consumer(self, wait_time, has_row):
+        """Record the time the consumer waited for a row of the pipeline."""
+        self.consumer_wait_time += wait_time
+        if has_row:
+            self.consumer_rows += 1
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        cpu_time = sum(os.times()[:2])
+        sample = (time.time(), cpu_time, [(c_op.connector_size(), c_op.connector_out_rows()) for c_op in self._c_ops])
+        with self._lock:
+            self.samples.append(sample)
+
+    def to_dict(self):
+        """
+        Get the profiling result.
+
+        Returns:
+            Dict, the throughput and the average queue occupancy of each operator, the consumer wait time and
+            the CPU utilization of the process, along with the sampled time series.
+        """
+        with self._lock:
+            samples = list(self.samples)
+        stop_time = self._stop_time if self._stop_time is not None else time.time()
+        duration = max(stop_time - self._start_time, 1e-6) if self._start_time is not None else 0.0
+        ops = []
+        for i, op in enumerate(self.ops):
+            sizes = [sample[2][i][0] for sample in samples]
+            # the counter starts with the pipeline, which is launched right before the profiler
+            rows = samples[-1][2][i][1] if samples else 0
+            capacity = op["queue_capacity"]
+            avg_size = sum(sizes) / len(sizes) if sizes else 0.0
+            op_result = dict(op)
+            op_result["rows"] = rows
+            op_result["rows_per_second"] = rows / duration if duration else 0.0
+            op_result["avg_queue_size"] = avg_size
+            # inlined operators have no output queue
+            op_result["avg_queue_occupancy"] = avg_size / capacity if capacity else None
+            ops.append(op_result)
+
+        cpu_time = samples[-1][1] - samples[0][1] if samples else 0.0
+        return {"duration": duration,
+                "interval": self.interval,
+                "ops": ops,
+                "consumer": {"rows": self.consumer_rows,
+                             "wait_time": self.consumer_wait_time,
+                             "wait_ratio": self.consumer_wait_time / duration if duration else 0.0},
+                "cpu": {"process_cpu_time": cpu_time,
+                        "utilization": cpu_time / duration if duration else 0.0,
+                        "cpu_count": os.cpu_count()},
+                "samples": [{"timestamp": timestamp - samples[0][0], "process_cpu_time": cpu - samples[0][1],
+                             "queue_size": [size for size, _ in op_samples],
+                             "rows": [op_rows for _, op_rows in op_samples]}
+                            for timestamp, cpu, op_samples in samples]}
+
+    def to_chrome_trace(self):
+        """
+        Get the profiling result in the Chrome trace event format, which can be loaded by chrome://tracing.
+
+        Returns:
+            Dict, the trace events of the queue sizes and the throughput of each operator.
+        """
+        with self._lock:
+            samples = list(self.samples)
+        events = [{"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "dataset pipeline"}}]
+        for op in self.ops:
+            events.append({"name": "thread_name", "ph": "M", "pid": 0, "tid": op["id"],
+                           "args": {"name": "{}({})".format(op["name"], op["id"])}})
+        for prev, sample in zip(samples, samples[1:]):
+            timestamp = int((sample[0] - samples[0][0]) * 1e6)
+            elapsed = max(sample[0] - prev[0], 1e-6)
+            for i, op in enumerate(self.ops):
+                size, rows = sample[2][i]
+                name = "{}({})".format(op["name"], op["id"])
+                events.append({"name": name + " queue", "ph": "C", "ts": timestamp, "pid": 0, "tid": op["id"],
+                               "args": {"size": size}})
+                events.append({"name": name + " rows/s", "ph": "C", "ts": timestamp, "pid": 0, "tid": op["id"],
+                               "args": {"rows_per_second": (rows - prev[2][i][1]) / elapsed}})
+            events.append({"name": "cpu utilization", "ph": "C", "ts": timestamp, "pid": 0,
+                           "args": {"utilization": (sample[1] - prev[1]) / elapsed}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, file_name, file_format="json"):
+        """
+        Dump the profiling result into a file.
+
+        Args:
+            file_name (str): Path of the file.
+            file_format (str, optional): "json" for the result of to_dict, "chrome" for the Chrome
+                trace (default="json").
+
+        Raises:
+            ValueError: If file_format is not "json" or "chrome".
+        """
+        if file_format == "json":
+            result = self.to_dict()
+            result["summary"] = summarize(result)
+        elif file_format == "chrome":
+            result = self.to_chrome_trace()
+        else:
+            raise ValueError("file_format should be 'json' or 'chrome', but got {}.".format(file_format))
+        with open(file_name, "w") as f:
+            json.dump(result, f, indent=2)
+
+    def summary(self):
+        """
+        Summarize the profiling result, see summarize.
+
+        Returns:
+            Dict, the slowest stage of the pipeline.
+        """
+        return summarize(self.to_dict())
+
+
+def summarize(profile):
+    """
+    Point to the slowest stage of the pipeline from a profiling result.
+
+    An operator whose output queue is mostly empty while the queues of its children are mostly full
+    cannot keep up with its input, and a source operator with a mostly empty output queue cannot keep up
+    with its consumer. If the output queue of the root is mostly full, the pipeline is faster than the
+    consumer.
+
+    Args:
+        profile (dict): Result of PipelineProfiler.to_dict, or loaded from the json file it dumped.
+
+    Returns:
+        Dict, the name and id of the slowest stage, the reason and a suggestion.
+
+    Examples:
+        >>> import json
+        >>> from mindspore.dataset.engine.profiling import summarize
+        >>> with open("pipeline_profile.json") as f:
+        >>>     print(summarize(json.load(f)))
+    """
+    ops = profile["ops"]
+    if not ops:
+        return {"bottleneck": None, "id": None, "reason": "no operator is profiled.", "suggestion": ""}
+
+    def occupancy(index):
+        return ops[index]["avg_queue_occupancy"]
+
+    root_occupancy = occupancy(0)
+    if root_occupancy is not None and root_occupancy >= _FULL_OCCUPANCY:
+        return {"bottleneck": "consumer", "id": None,
+                "reason": "the output queue of {} is {:.0%} full.".format(ops[0]["name"], root_occupancy),
+                "suggestion": "the dataset pipeline is faster than the consumer, no tuning is needed."}
+
+    children = [[] for _ in ops]
+    for i, op in enumerate(ops):
+        if op["parent"] >= 0:
+            children[op["parent"]].append(i)
+
+    best, best_score, best_input = None, None, None
+    for i, op in enumerate(ops):
+        out = occupancy(i)
+        if out is None:
+            continue
+        inputs = [occupancy(child) for child in children[i] if occupancy(child) is not None]
+        # a source is never waiting for its input
+        input_occupancy = min(inputs) if inputs else 1.0
+        score = input_occupancy - out
+        if best_score is None or score > best_score:
+            best, best_score, best_input = i, score, input_occupancy
+
+    if best is None:
+        return {"bottleneck": None, "id": None, "reason": "no operator has an output queue.", "suggestion": ""}
+
+    op = ops[best]
+    out = occupancy(best)
+    if out >= _EMPTY_OCCUPANCY and best_input < _FULL_OCCUPANCY:
+        suggestion = "no single stage stands out, try a larger prefetch_size to absorb the jitter."
+    elif children[best]:
+        suggestion = "increase num_parallel_workers of {} (currently {}).".format(op["name"], op["num_workers"])
+    else:
+        suggestion = "increase num_parallel_workers of the source {} (currently {}), or cache the " \
+                     "pipeline after it.".format(op["name"], op["num_workers"])
+    if children[best]:
+        reason = "the output queue of {} is {:.0%} full while its input is {:.0%} full, {:.1f} rows/s.".format(
+            op["name"], out, best_input, op["rows_per_second"])
+    else:
+        reason = "the output queue of the source {} is {:.0%} full, {:.1f} rows/s.".format(
+            op["name"], out, op["rows_per_second"])
+    logger.info("The slowest stage of the dataset pipeline is {}: {}".format(op["name"], reason))
+    return {"bottleneck": op["name"], "id": op["id"], "reason": reason, "suggestion": suggestion}
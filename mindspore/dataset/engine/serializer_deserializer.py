@@ -309,8 +309,7 @@ def create_node(node):
         pyobj = de.Dataset().batch(node['batch_size'], node.get('drop_remainder'))
 
     elif dataset_op == 'CacheDataset':
-        # Member function cache() is not defined in class Dataset yet.
-        raise RuntimeError(dataset_op + " is not yet supported")
+        pyobj = de.Dataset().cache(node['memory_budget'], node.get('spill_dir'))
 
     elif dataset_op == 'FilterDataset':
         # Member function filter() is not defined in class Dataset yet.
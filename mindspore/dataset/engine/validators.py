@@ -519,8 +519,9 @@ def check_generatordataset(method):
     def new_method(*args, **kwargs):
         param_dict = make_param_dict(method, args, kwargs)
 
-        nreq_param_int = ['prefetch_size']
+        nreq_param_int = ['prefetch_size', 'num_parallel_workers']
         nreq_param_list = ['column_names', 'column_types']
+        nreq_param_bool = ['python_multiprocessing']
 
         # check generator_function; required argument
         generator_function = param_dict.get('generator_function')
@@ -536,6 +537,8 @@ def check_generatordataset(method):
 
         check_param_type(nreq_param_list, param_dict, list)
 
+        check_param_type(nreq_param_bool, param_dict, bool)
+
         return method(*args, **kwargs)
 
     return new_method
@@ -661,6 +664,29 @@ def check_repeat(method):
     return new_method
 
 
+def check_cache(method):
+    """check the input arguments of cache."""
+    @wraps(method)
+    def new_method(*args, **kwargs):
+        param_dict = make_param_dict(method, args, kwargs)
+
+        memory_budget = param_dict.get('memory_budget')
+        if memory_budget is None:
+            raise ValueError("memory_budget is not provided.")
+        check_type(memory_budget, 'memory_budget', int)
+        if memory_budget < 0:
+            raise ValueError("memory_budget should not be negative.")
+
+        spill_dir = param_dict.get('spill_dir')
+        if spill_dir is not None:
+            check_type(spill_dir, 'spill_dir', str)
+            check_dataset_dir(spill_dir)
+
+        return method(*args, **kwargs)
+
+    return new_method
+
+
 def check_zip(method):
     """check the input arguments of zip."""
     @wraps(method)
@@ -73,6 +73,15 @@ class ComposeOp:
         >>>                                      py_transforms.RandomErasing()])
         >>> # apply the transform to the dataset through dataset.map()
         >>> dataset = dataset.map(input_columns="image", operations=transform())
+        >>>
+        >>> # or apply the transforms to whole batches of decoded images of shape (H, W, C)
+        >>> batch_transform = py_transforms.ComposeOp([py_transforms.RandomCrop(224),
+        >>>                                            py_transforms.RandomHorizontalFlip(0.5),
+        >>>                                            py_transforms.ToTensor(),
+        >>>                                            py_transforms.Normalize((0.491, 0.482, 0.447),
+        >>>                                                                    (0.247, 0.243, 0.262)),
+        >>>                                            py_transforms.RandomErasing()])
+        >>> dataset = dataset.batch(32, input_columns=["image"], per_batch_map=batch_transform.batch_map(is_hwc=True))
     """
 
     def __init__(self, transforms):
@@ -87,6 +96,48 @@ class ComposeOp:
         """
         return lambda img: util.compose(img, self.transforms)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Apply the transforms to a batch of images.
+
+        The transforms with a batch_call method, like RandomCrop, RandomHorizontalFlip, Normalize or RandomErasing,
+        are applied to the whole batch with array operations, their random parameters are drawn for each image.
+        The other transforms, like Resize or RandomColorAdjust, are applied to the PIL Image of each image of
+        the batch, which is converted back to a Numpy array of shape (H, W, C).
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be transformed.
+            is_hwc (bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W) (default=False).
+                The images are (N, C, H, W) after ToTensor or HWC2CHW.
+
+        Returns:
+            np_imgs (numpy.ndarray), Transformed images.
+        """
+        for transform in self.transforms:
+            if hasattr(transform, "batch_call"):
+                np_imgs = transform.batch_call(np_imgs, is_hwc)
+            else:
+                if not is_hwc:
+                    np_imgs = np_imgs.transpose(0, 2, 3, 1)
+                np_imgs = np.stack([np.asarray(transform(util.to_pil(img))) for img in np_imgs])
+                is_hwc = True
+            if isinstance(transform, (ToTensor, HWC2CHW)):
+                is_hwc = False
+        return np.ascontiguousarray(np_imgs)
+
+    def batch_map(self, is_hwc=False):
+        """
+        Get the per_batch_map of dataset.batch() which applies the transforms to the batches of a column.
+
+        Args:
+            is_hwc (bool): If True, the images are of shape (H, W, C), otherwise (C, H, W) (default=False).
+
+        Returns:
+            lambda function, Lambda function that takes in the list of images of a batch and the BatchInfo,
+            to apply the transforms on the whole batch by batch_call.
+        """
+        return lambda imgs, batch_info: (list(self.batch_call(np.stack(imgs), is_hwc)),)
+
 
 class ToTensor:
     """
@@ -121,6 +172,19 @@ class ToTensor:
         """
         return util.to_tensor(img, self.output_type)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be converted.
+            is_hwc (bool): Whether np_imgs is (N, H, W, C) and is transposed to (N, C, H, W) (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Converted images of shape (N, C, H, W).
+        """
+        return util.to_tensors(np_imgs, self.output_type, is_hwc)
+
 
 class ToType:
     """
@@ -152,6 +216,19 @@ class ToType:
         """
         return util.to_type(img, self.output_type)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images.
+
+        Args:
+            np_imgs (numpy.ndarray): Images to be type swapped.
+            is_hwc (bool): Not used, the type is cast whatever the layout is (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Converted images.
+        """
+        return util.to_type(np_imgs, self.output_type)
+
 
 class HWC2CHW:
     """
@@ -170,6 +247,21 @@ class HWC2CHW:
         """
         return util.hwc_to_chw(img)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images, images of shape (N, C, H, W) are returned unchanged.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) to have channels swapped.
+            is_hwc (bool): If False, np_imgs is already (N, C, H, W) and is returned as is (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Images of shape (N, C, H, W).
+        """
+        if not is_hwc:
+            return np_imgs
+        return util.hwc_to_chws(np_imgs)
+
 
 class ToPIL:
     """
@@ -252,6 +344,20 @@ class Normalize:
         """
         return util.normalize(img, self.mean, self.std)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be normalized.
+            is_hwc (bool): Whether the channels, which mean and std apply to, are the last axis of np_imgs
+                (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Normalized images.
+        """
+        return util.normalizes(np_imgs, self.mean, self.std, is_hwc)
+
 
 class RandomCrop:
     """
@@ -312,6 +418,21 @@ class RandomCrop:
         return util.random_crop(img, self.size, self.padding, self.pad_if_needed,
                                 self.fill_value, self.padding_mode)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images, the location is drawn for each image.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be randomly cropped.
+            is_hwc (bool): Whether the height and width of np_imgs are the axes 1 and 2 rather than 2 and 3
+                (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Cropped images.
+        """
+        return util.random_crops(np_imgs, self.size, self.padding, self.pad_if_needed,
+                                 self.fill_value, self.padding_mode, is_hwc)
+
 
 class RandomHorizontalFlip:
     """
@@ -342,6 +463,19 @@ class RandomHorizontalFlip:
         """
         return util.random_horizontal_flip(img, self.prob)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images, the flip is drawn for each image.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be flipped horizontally.
+            is_hwc (bool): Whether the width of np_imgs, which is flipped, is the axis 2 rather than 3 (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Randomly flipped images.
+        """
+        return util.random_horizontal_flips(np_imgs, self.prob, is_hwc)
+
 
 class RandomVerticalFlip:
     """
@@ -372,6 +506,19 @@ class RandomVerticalFlip:
         """
         return util.random_vertical_flip(img, self.prob)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images, the flip is drawn for each image.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be flipped vertically.
+            is_hwc (bool): Whether the height of np_imgs, which is flipped, is the axis 1 rather than 2 (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Randomly flipped images.
+        """
+        return util.random_vertical_flips(np_imgs, self.prob, is_hwc)
+
 
 class Resize:
     """
@@ -498,6 +645,20 @@ class CenterCrop:
         """
         return util.center_crop(img, self.size)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be center cropped.
+            is_hwc (bool): Whether np_imgs is (N, H, W, C) rather than (N, C, H, W) when the center is located
+                (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Cropped images.
+        """
+        return util.center_crops(np_imgs, self.size, is_hwc)
+
 
 class RandomColorAdjust:
     """
@@ -990,6 +1151,21 @@ class RandomErasing:
             return util.erase(np_img, i, j, erase_h, erase_w, erase_value, self.inplace)
         return np_img
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images, the erase parameters are drawn for each image.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be randomly erased.
+            is_hwc (bool): Whether np_imgs is (N, H, W, C), the erased area covers all the channels either way
+                (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Erased images.
+        """
+        return util.random_erasings(np_imgs, self.prob, self.scale, self.ratio, self.value, self.inplace,
+                                    self.max_attempts, is_hwc)
+
 
 class Cutout:
     """
@@ -1034,6 +1210,20 @@ class Cutout:
             np_img = util.erase(np_img, i, j, erase_h, erase_w, erase_value)
         return np_img
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images, the patches are drawn for each image.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be cut out.
+            is_hwc (bool): Whether np_imgs is (N, H, W, C), the patches cover all the channels either way
+                (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Images with square patches cut out.
+        """
+        return util.cutouts(np_imgs, self.length, self.num_patches, is_hwc)
+
 
 class LinearTransformation:
     """
@@ -1071,6 +1261,20 @@ class LinearTransformation:
         """
         return util.linear_transform(np_img, self.transformation_matrix, self.mean_vector)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images.
+
+        Args:
+            np_imgs (numpy.ndarray): Images of shape (N, C, H, W) to be linear transformed.
+            is_hwc (bool): Not used, each image is flattened to match transformation_matrix whatever the layout is
+                (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Linear transformed images.
+        """
+        return util.linear_transforms(np_imgs, self.transformation_matrix, self.mean_vector)
+
 
 class RandomAffine:
     """
@@ -1287,6 +1491,19 @@ class RgbToHsv:
         """
         return util.rgb_to_hsvs(rgb_imgs, self.is_hwc)
 
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images, the shape is given by the is_hwc of the op.
+
+        Args:
+            np_imgs (numpy.ndarray): Numpy RGB images to be converted.
+            is_hwc (bool): Not used, the layout is given by the is_hwc the op is created with (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Numpy HSV images.
+        """
+        return util.rgb_to_hsvs(np_imgs, self.is_hwc)
+
 
 class HsvToRgb:
     """
@@ -1312,3 +1529,16 @@ class HsvToRgb:
             rgb_imgs (numpy.ndarray), Numpy RGB image with same shape of hsv_imgs.
         """
         return util.hsv_to_rgbs(hsv_imgs, self.is_hwc)
+
+    def batch_call(self, np_imgs, is_hwc=False):
+        """
+        Call method on a batch of images, the shape is given by the is_hwc of the op.
+
+        Args:
+            np_imgs (numpy.ndarray): Numpy HSV images to be converted.
+            is_hwc (bool): Ignored in favor of the is_hwc the op is created with (default=False).
+
+        Returns:
+            np_imgs (numpy.ndarray), Numpy RGB images.
+        """
+        return util.hsv_to_rgbs(np_imgs, self.is_hwc)
@@ -18,7 +18,6 @@ import io
 import math
 import numbers
 import random
-import colorsys
 
 import numpy as np
 from PIL import Image, ImageOps, ImageEnhance, __version__
@@ -561,15 +560,14 @@ def adjust_hue(img, hue_factor):
     if input_mode in {'L', '1', 'I', 'F'}:
         return img
 
-    h, s, v = img.convert('HSV').split()
+    np_img = np.asarray(img.convert('RGB'), dtype=np.float32) / 255
+    np_hsv = rgb_to_hsv(np_img, True)
+    np_hsv[..., 0] = (np_hsv[..., 0] + hue_factor) % 1.0
+    np_img = hsv_to_rgb(np_hsv, True)
 
-    np_h = np.array(h, dtype=np.uint8)
-
-    with np.errstate(over='ignore'):
-        np_h += np.uint8(hue_factor * 255)
-    h = Image.fromarray(np_h, 'L')
-
-    img = Image.merge('HSV', (h, s, v)).convert(input_mode)
+    img = Image.fromarray(np.clip(np.rint(np_img * 255), 0, 255).astype(np.uint8), 'RGB')
+    if input_mode != 'RGB':
+        img = img.convert(input_mode)
     return img
 
 
@@ -1275,31 +1273,88 @@ def mix_up_muti(tmp, batch_size, img, label, alpha=0.2):
     return mix_img, mix_label
 
 
+def _rgb_to_hsv(r, g, b):
+    """
+    Convert the RGB channels to HSV channels element-wise, the same as colorsys.rgb_to_hsv.
+
+    The hue is computed from the differences of the channels directly, rather than the differences of
+    the scaled distances to the max channel as colorsys does, to keep the precision in float32.
+    """
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    delta = maxc - minc
+    gray = delta == 0
+    # the division results of the gray pixels are not used, avoid dividing by zero for them
+    safe_delta = np.where(gray, 1, delta)
+    safe_maxc = np.where(gray, 1, maxc)
+    s = np.where(gray, 0, delta / safe_maxc)
+    h = np.where(r == maxc, (g - b) / safe_delta,
+                 np.where(g == maxc, 2.0 + (b - r) / safe_delta, 4.0 + (r - g) / safe_delta))
+    h = np.where(gray, 0, (h / 6.0) % 1.0)
+    return h.astype(maxc.dtype, copy=False), s.astype(maxc.dtype, copy=False), maxc
+
+
+def _hsv_to_rgb(h, s, v):
+    """Convert the HSV channels to RGB channels element-wise, the same as colorsys.hsv_to_rgb."""
+    i = np.trunc(h * 6.0)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i.astype(np.int64) % 6
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    return r, g, b
+
+
+def _split_channels(np_img, is_hwc):
+    """Split the 3 channels of image(s) of shape (..., H, W, C) or (..., C, H, W) into float arrays."""
+    np_img = np.asarray(np_img)
+    np_img = np_img.astype(np.result_type(np_img.dtype, np.float32), copy=False)
+    if is_hwc:
+        return np_img[..., 0], np_img[..., 1], np_img[..., 2]
+    return np_img[..., 0, :, :], np_img[..., 1, :, :], np_img[..., 2, :, :]
+
+
 def rgb_to_hsv(np_rgb_img, is_hwc):
     """
     Convert RGB img to HSV img.
 
     Args:
-        np_rgb_img (numpy.ndarray): Numpy RGB image array of shape (H, W, C) or (C, H, W) to be converted.
+        np_rgb_img (numpy.ndarray): Numpy RGB image array of shape (H, W, C) or (C, H, W) to be converted,
+            a batch of shape (N, H, W, C) or (N, C, H, W) is converted as a whole.
         is_hwc (Bool): If True, the shape of np_hsv_img is (H, W, C), otherwise must be (C, H, W).
 
     Returns:
-        np_hsv_img (numpy.ndarray), Numpy HSV image with same type of np_rgb_img.
+        np_hsv_img (numpy.ndarray), Numpy HSV image, float32 unless np_rgb_img is float64.
     """
-    if is_hwc:
-        r, g, b = np_rgb_img[:, :, 0], np_rgb_img[:, :, 1], np_rgb_img[:, :, 2]
-    else:
-        r, g, b = np_rgb_img[0, :, :], np_rgb_img[1, :, :], np_rgb_img[2, :, :]
-    to_hsv = np.vectorize(colorsys.rgb_to_hsv)
-    h, s, v = to_hsv(r, g, b)
-    if is_hwc:
-        axis = 2
-    else:
-        axis = 0
+    h, s, v = _rgb_to_hsv(*_split_channels(np_rgb_img, is_hwc))
+    axis = -1 if is_hwc else -3
     np_hsv_img = np.stack((h, s, v), axis=axis)
     return np_hsv_img
 
 
+def _check_channels(np_imgs, is_hwc):
+    """Check the images are 3 channels images of shape (H, W, C)/(N, H, W, C)/(C,H,W)/(N,C,H,W)."""
+    if not is_numpy(np_imgs):
+        raise TypeError('img should be Numpy Image. Got {}'.format(type(np_imgs)))
+
+    shape_size = len(np_imgs.shape)
+
+    if not shape_size in (3, 4):
+        raise TypeError('img shape should be (H, W, C)/(N, H, W, C)/(C,H,W)/(N,C,H,W). \
+                         Got {}'.format(np_imgs.shape))
+
+    if is_hwc:
+        num_channels = np_imgs.shape[-1]
+    else:
+        num_channels = np_imgs.shape[-3]
+
+    if num_channels != 3:
+        raise TypeError('img should be 3 channels RGB img. Got {} channels'.format(num_channels))
+
+
 def rgb_to_hsvs(np_rgb_imgs, is_hwc):
     """
     Convert RGB imgs to HSV imgs.
@@ -1311,35 +1366,10 @@ def rgb_to_hsvs(np_rgb_imgs, is_hwc):
                        If False, the shape of np_rgb_imgs is (C, H, W) or (N, C, H, W).
 
     Returns:
-        np_hsv_imgs (numpy.ndarray), Numpy HSV images with same type of np_rgb_imgs.
+        np_hsv_imgs (numpy.ndarray), Numpy HSV images, float32 unless np_rgb_imgs is float64.
     """
-    if not is_numpy(np_rgb_imgs):
-        raise TypeError('img should be Numpy Image. Got {}'.format(type(np_rgb_imgs)))
-
-    shape_size = len(np_rgb_imgs.shape)
-
-    if not shape_size in (3, 4):
-        raise TypeError('img shape should be (H, W, C)/(N, H, W, C)/(C,H,W)/(N,C,H,W). \
-                         Got {}'.format(np_rgb_imgs.shape))
-
-    if shape_size == 3:
-        batch_size = 0
-        if is_hwc:
-            num_channels = np_rgb_imgs.shape[2]
-        else:
-            num_channels = np_rgb_imgs.shape[0]
-    else:
-        batch_size = np_rgb_imgs.shape[0]
-        if is_hwc:
-            num_channels = np_rgb_imgs.shape[3]
-        else:
-            num_channels = np_rgb_imgs.shape[1]
-
-    if num_channels != 3:
-        raise TypeError('img should be 3 channels RGB img. Got {} channels'.format(num_channels))
-    if batch_size == 0:
-        return rgb_to_hsv(np_rgb_imgs, is_hwc)
-    return np.array([rgb_to_hsv(img, is_hwc) for img in np_rgb_imgs])
+    _check_channels(np_rgb_imgs, is_hwc)
+    return rgb_to_hsv(np_rgb_imgs, is_hwc)
 
 
 def hsv_to_rgb(np_hsv_img, is_hwc):
@@ -1347,23 +1377,16 @@ def hsv_to_rgb(np_hsv_img, is_hwc):
     Convert HSV img to RGB img.
 
     Args:
-        np_hsv_img (numpy.ndarray): Numpy HSV image array of shape (H, W, C) or (C, H, W) to be converted.
+        np_hsv_img (numpy.ndarray): Numpy HSV image array of shape (H, W, C) or (C, H, W) to be converted,
+            a batch of shape (N, H, W, C) or (N, C, H, W) is converted as a whole.
         is_hwc (Bool): If True, the shape of np_hsv_img is (H, W, C), otherwise must be (C, H, W).
 
     Returns:
-        np_rgb_img (numpy.ndarray), Numpy HSV image with same shape of np_hsv_img.
+        np_rgb_img (numpy.ndarray), Numpy RGB image with same shape of np_hsv_img, float32 unless np_hsv_img
+        is float64.
     """
-    if is_hwc:
-        h, s, v = np_hsv_img[:, :, 0], np_hsv_img[:, :, 1], np_hsv_img[:, :, 2]
-    else:
-        h, s, v = np_hsv_img[0, :, :], np_hsv_img[1, :, :], np_hsv_img[2, :, :]
-    to_rgb = np.vectorize(colorsys.hsv_to_rgb)
-    r, g, b = to_rgb(h, s, v)
-
-    if is_hwc:
-        axis = 2
-    else:
-        axis = 0
+    r, g, b = _hsv_to_rgb(*_split_channels(np_hsv_img, is_hwc))
+    axis = -1 if is_hwc else -3
     np_rgb_img = np.stack((r, g, b), axis=axis)
     return np_rgb_img
 
@@ -1379,32 +1402,385 @@ def hsv_to_rgbs(np_hsv_imgs, is_hwc):
                        If False, the shape of np_hsv_imgs is (C, H, W) or (N, C, H, W).
 
     Returns:
-        np_rgb_imgs (numpy.ndarray), Numpy RGB images with same type of np_hsv_imgs.
+        np_rgb_imgs (numpy.ndarray), Numpy RGB images, float32 unless np_hsv_imgs is float64.
     """
-    if not is_numpy(np_hsv_imgs):
-        raise TypeError('img should be Numpy Image. Got {}'.format(type(np_hsv_imgs)))
+    _check_channels(np_hsv_imgs, is_hwc)
+    return hsv_to_rgb(np_hsv_imgs, is_hwc)
 
-    shape_size = len(np_hsv_imgs.shape)
 
-    if not shape_size in (3, 4):
-        raise TypeError('img shape should be (H, W, C)/(N, H, W, C)/(C,H,W)/(N,C,H,W). \
-                         Got {}'.format(np_hsv_imgs.shape))
+def _check_batch(np_imgs):
+    """Check the images are a batch of Numpy images of shape (N, H, W, C) or (N, C, H, W)."""
+    if not is_numpy(np_imgs):
+        raise TypeError('imgs should be a batch of Numpy images. Got {}'.format(type(np_imgs)))
+    if np_imgs.ndim != 4:
+        raise TypeError('imgs shape should be (N, H, W, C)/(N, C, H, W). Got {}'.format(np_imgs.shape))
 
-    if shape_size == 3:
-        batch_size = 0
-        if is_hwc:
-            num_channels = np_hsv_imgs.shape[2]
-        else:
-            num_channels = np_hsv_imgs.shape[0]
+
+def _hw_axes(is_hwc):
+    """The axes of height and width of a batch of images."""
+    return (1, 2) if is_hwc else (2, 3)
+
+
+def to_tensors(np_imgs, output_type, is_hwc):
+    """
+    Change a batch of images to a batch of (N, C, H, W) in range [0.0, 1.0], the same as to_tensor on each image.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be converted.
+        output_type: The datatype of the numpy output. e.g. np.float32
+        is_hwc (Bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W).
+
+    Returns:
+        np_imgs (numpy.ndarray), Converted images of shape (N, C, H, W).
+    """
+    _check_batch(np_imgs)
+    if is_hwc:
+        np_imgs = np_imgs.transpose(0, 3, 1, 2)
+    return (np_imgs / 255.).astype(output_type)
+
+
+def hwc_to_chws(np_imgs):
+    """
+    Transpose a batch of images from (N, H, W, C) to (N, C, H, W).
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C).
+
+    Returns:
+        np_imgs (numpy.ndarray), Images of shape (N, C, H, W).
+    """
+    _check_batch(np_imgs)
+    return np.ascontiguousarray(np_imgs.transpose(0, 3, 1, 2))
+
+
+def normalizes(np_imgs, mean, std, is_hwc):
+    """
+    Normalize a batch of images with respect to mean and standard deviation, the same as normalize on each image.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be normalized.
+        mean (list): List of mean values for each channel, w.r.t channel order.
+        std (list): List of standard deviations for each channel, w.r.t. channel order.
+        is_hwc (Bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W).
+
+    Returns:
+        np_imgs (numpy.ndarray), Normalized images.
+    """
+    _check_batch(np_imgs)
+    num_channels = np_imgs.shape[3] if is_hwc else np_imgs.shape[1]
+
+    if len(mean) != len(std):
+        raise ValueError("Length of mean and std must be equal")
+    if len(mean) == 1:
+        mean = [mean[0]] * num_channels
+        std = [std[0]] * num_channels
+    elif len(mean) != num_channels:
+        raise ValueError("Length of mean and std must both be 1 or equal to the number of channels({0})"
+                         .format(num_channels))
+
+    mean = np.array(mean, dtype=np_imgs.dtype)
+    std = np.array(std, dtype=np_imgs.dtype)
+    if not is_hwc:
+        mean, std = mean[:, None, None], std[:, None, None]
+    return (np_imgs - mean) / std
+
+
+def _random_flips(np_imgs, prob, axis):
+    """Flip each image of the batch along the axis with the probability."""
+    _check_batch(np_imgs)
+    flips = np.random.random(np_imgs.shape[0]) < prob
+    np_imgs = np_imgs.copy()
+    np_imgs[flips] = np.flip(np_imgs[flips], axis)
+    return np_imgs
+
+
+def random_horizontal_flips(np_imgs, prob, is_hwc):
+    """
+    Randomly flip each image of a batch horizontally, the flips are drawn for each image.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be flipped.
+        prob (float): Probability of each image being flipped.
+        is_hwc (Bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W).
+
+    Returns:
+        np_imgs (numpy.ndarray), Randomly flipped images.
+    """
+    return _random_flips(np_imgs, prob, _hw_axes(is_hwc)[1])
+
+
+def random_vertical_flips(np_imgs, prob, is_hwc):
+    """
+    Randomly flip each image of a batch vertically, the flips are drawn for each image.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be flipped.
+        prob (float): Probability of each image being flipped.
+        is_hwc (Bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W).
+
+    Returns:
+        np_imgs (numpy.ndarray), Randomly flipped images.
+    """
+    return _random_flips(np_imgs, prob, _hw_axes(is_hwc)[0])
+
+
+def _crops(np_imgs, top, left, height, width, is_hwc):
+    """Crop each image of the batch at its own top left corner, top and left are arrays of the batch size."""
+    np_hwc = np_imgs if is_hwc else np_imgs.transpose(0, 2, 3, 1)
+    rows = top[:, None] + np.arange(height)
+    cols = left[:, None] + np.arange(width)
+    index = np.arange(np_imgs.shape[0])[:, None, None]
+    cropped = np_hwc[index, rows[:, :, None], cols[:, None, :]]
+    if is_hwc:
+        return cropped
+    return np.ascontiguousarray(cropped.transpose(0, 3, 1, 2))
+
+
+def _get_crop_size(size):
+    """Get the (height, width) of the crop size."""
+    if isinstance(size, int):
+        return size, size
+    if isinstance(size, (tuple, list)) and len(size) == 2:
+        return tuple(size)
+    raise TypeError("Size should be a single integer or a list/tuple (h, w) of length 2.")
+
+
+def center_crops(np_imgs, size, is_hwc):
+    """
+    Crop each image of a batch at the center to the given size.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be cropped.
+        size (int or tuple): The size of the crop box, (height, width) if it is a sequence.
+        is_hwc (Bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W).
+
+    Returns:
+        np_imgs (numpy.ndarray), Cropped images.
+    """
+    _check_batch(np_imgs)
+    crop_height, crop_width = _get_crop_size(size)
+    h_axis, w_axis = _hw_axes(is_hwc)
+    img_height, img_width = np_imgs.shape[h_axis], np_imgs.shape[w_axis]
+    if crop_height > img_height or crop_width > img_width:
+        raise ValueError("Crop size {} is larger than the image size {}.".format(size, (img_height, img_width)))
+    crop_top = int(round((img_height - crop_height) / 2.))
+    crop_left = int(round((img_width - crop_width) / 2.))
+    index = [slice(None)] * 4
+    index[h_axis] = slice(crop_top, crop_top + crop_height)
+    index[w_axis] = slice(crop_left, crop_left + crop_width)
+    return np_imgs[tuple(index)].copy()
+
+
+def _pad_batch(np_imgs, padding, fill_value, padding_mode, is_hwc):
+    """Pad the height and width of a batch of images, with the same padding as pad."""
+    if isinstance(padding, numbers.Number):
+        top = bottom = left = right = padding
+    elif isinstance(padding, (tuple, list)) and len(padding) == 2:
+        left = right = padding[0]
+        top = bottom = padding[1]
+    elif isinstance(padding, (tuple, list)) and len(padding) == 4:
+        left, top, right, bottom = padding
     else:
-        batch_size = np_hsv_imgs.shape[0]
-        if is_hwc:
-            num_channels = np_hsv_imgs.shape[3]
-        else:
-            num_channels = np_hsv_imgs.shape[1]
+        raise ValueError("Padding can be any of: a number, a tuple or list of size 2 or 4.")
+
+    h_axis, w_axis = _hw_axes(is_hwc)
+    pad_width = [(0, 0)] * 4
+    pad_width[h_axis] = (top, bottom)
+    pad_width[w_axis] = (left, right)
+    if padding_mode != 'constant':
+        return np.pad(np_imgs, pad_width, padding_mode)
+
+    shape = list(np_imgs.shape)
+    shape[h_axis] += top + bottom
+    shape[w_axis] += left + right
+    fill_value = np.array(fill_value, dtype=np_imgs.dtype)
+    if fill_value.ndim == 1 and not is_hwc:
+        fill_value = fill_value[:, None, None]
+    padded = np.empty(shape, np_imgs.dtype)
+    padded[...] = fill_value
+    index = [slice(None)] * 4
+    index[h_axis] = slice(top, top + np_imgs.shape[h_axis])
+    index[w_axis] = slice(left, left + np_imgs.shape[w_axis])
+    padded[tuple(index)] = np_imgs
+    return padded
+
+
+def random_crops(np_imgs, size, padding, pad_if_needed, fill_value, padding_mode, is_hwc):
+    """
+    Crop each image of a batch at its own random location, the same as random_crop on each image.
 
-    if num_channels != 3:
-        raise TypeError('img should be 3 channels RGB img. Got {} channels'.format(num_channels))
-    if batch_size == 0:
-        return hsv_to_rgb(np_hsv_imgs, is_hwc)
-    return np.array([hsv_to_rgb(img, is_hwc) for img in np_hsv_imgs])
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be cropped.
+        size (int or sequence): The output size of the cropped images, (height, width) if it is a sequence.
+        padding (int or sequence, optional): The number of pixels to pad the images, see random_crop.
+        pad_if_needed (bool): Pad the images if either side is smaller than the given output size.
+        fill_value (int or tuple): The pixel intensity of the borders if the padding_mode is 'constant'.
+        padding_mode (str): The method of padding. Can be any of ['constant', 'edge', 'reflect', 'symmetric'].
+        is_hwc (Bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W).
+
+    Returns:
+        np_imgs (numpy.ndarray), Cropped images.
+    """
+    _check_batch(np_imgs)
+    height, width = _get_crop_size(size)
+    h_axis, w_axis = _hw_axes(is_hwc)
+
+    if padding is not None:
+        np_imgs = _pad_batch(np_imgs, padding, fill_value, padding_mode, is_hwc)
+    if pad_if_needed and np_imgs.shape[w_axis] < width:
+        np_imgs = _pad_batch(np_imgs, (width - np_imgs.shape[w_axis], 0), fill_value, padding_mode, is_hwc)
+    if pad_if_needed and np_imgs.shape[h_axis] < height:
+        np_imgs = _pad_batch(np_imgs, (0, height - np_imgs.shape[h_axis]), fill_value, padding_mode, is_hwc)
+
+    img_height, img_width = np_imgs.shape[h_axis], np_imgs.shape[w_axis]
+    if height == img_height and width == img_width:
+        return np_imgs
+    if height > img_height or width > img_width:
+        raise ValueError("Crop size {} is larger than the image size {}.".format(size, (img_height, img_width)))
+    batch_size = np_imgs.shape[0]
+    top = np.random.randint(0, img_height - height + 1, batch_size)
+    left = np.random.randint(0, img_width - width + 1, batch_size)
+    return _crops(np_imgs, top, left, height, width, is_hwc)
+
+
+def _erase_boxes(np_imgs, top, left, height, width, erase_value, inplace=False):
+    """
+    Erase a box of each image of a batch of (N, C, H, W), the boxes are arrays of the batch size.
+
+    The erase value is a number, a sequence of a value for each channel, or None for values drawn from the
+    standard normal distribution.
+    """
+    image_h, image_w = np_imgs.shape[2], np_imgs.shape[3]
+    rows = np.arange(image_h)
+    cols = np.arange(image_w)
+    in_rows = (rows >= top[:, None]) & (rows < (top + height)[:, None])
+    in_cols = (cols >= left[:, None]) & (cols < (left + width)[:, None])
+    mask = (in_rows[:, :, None] & in_cols[:, None, :])[:, None, :, :]
+
+    if not inplace:
+        np_imgs = np_imgs.copy()
+    if erase_value is None:
+        for k in np.nonzero(height * width)[0]:
+            box = np_imgs[k, :, top[k]:top[k] + height[k], left[k]:left[k] + width[k]]
+            box[...] = np.random.normal(loc=0.0, scale=1.0, size=box.shape)
+        return np_imgs
+    erase_value = np.array(erase_value, dtype=np_imgs.dtype)
+    if erase_value.ndim == 1:
+        erase_value = erase_value[:, None, None]
+    np.copyto(np_imgs, erase_value, where=mask)
+    return np_imgs
+
+
+def _to_chw_batch(np_imgs, is_hwc):
+    """View a batch of images as (N, C, H, W)."""
+    return np_imgs.transpose(0, 3, 1, 2) if is_hwc else np_imgs
+
+
+def _from_chw_batch(np_imgs, is_hwc):
+    """View a batch of (N, C, H, W) images in the original layout."""
+    return np_imgs.transpose(0, 2, 3, 1) if is_hwc else np_imgs
+
+
+def random_erasings(np_imgs, prob, scale, ratio, value, inplace, max_attempts, is_hwc):
+    """
+    Randomly erase a box of each image of a batch, the same as RandomErasing on each image.
+
+    The erase parameters are drawn for each image, the attempts of all the images are drawn together.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be erased.
+        prob (float): Probability of erasing each image.
+        scale (sequence of floats): Range of the relative erase area to the original image.
+        ratio (sequence of floats): Range of the aspect ratio of the erase area.
+        value (int or sequence or str): Erasing value, a str means values from the standard normal distribution.
+        inplace (bool): Apply this transform inplace.
+        max_attempts (int): The maximum number of attempts to propose a valid erase area.
+        is_hwc (Bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W).
+
+    Returns:
+        np_imgs (numpy.ndarray), Erased images.
+    """
+    _check_batch(np_imgs)
+    np_chw = _to_chw_batch(np_imgs, is_hwc)
+    batch_size, _, image_h, image_w = np_chw.shape
+    area = image_h * image_w
+
+    if isinstance(value, numbers.Number):
+        erase_value = value
+    elif isinstance(value, (str, bytes)):
+        erase_value = None
+    elif isinstance(value, (tuple, list)) and len(value) == 3:
+        erase_value = value
+    else:
+        raise ValueError("The value for erasing should be either a single value, or a string "
+                         "'random', or a sequence of 3 elements for RGB respectively.")
+
+    erase_area = np.random.uniform(scale[0], scale[1], (max_attempts, batch_size)) * area
+    aspect_ratio = np.random.uniform(ratio[0], ratio[1], (max_attempts, batch_size))
+    erase_w = np.rint(np.sqrt(erase_area * aspect_ratio)).astype(np.int64)
+    erase_h = np.rint(erase_w / aspect_ratio).astype(np.int64)
+    valid = (erase_h < image_h) & (erase_w < image_w)
+    # use the first valid attempt of each image, the images without valid attempt or not drawn are unchanged
+    attempt = np.argmax(valid, axis=0)
+    samples = np.arange(batch_size)
+    erased = valid[attempt, samples] & (np.random.random(batch_size) < prob)
+    height = np.where(erased, erase_h[attempt, samples], 0)
+    width = np.where(erased, erase_w[attempt, samples], 0)
+    top = np.floor(np.random.random(batch_size) * (image_h - height + 1)).astype(np.int64)
+    left = np.floor(np.random.random(batch_size) * (image_w - width + 1)).astype(np.int64)
+
+    np_chw = _erase_boxes(np_chw, top, left, height, width, erase_value, inplace)
+    return _from_chw_batch(np_chw, is_hwc)
+
+
+def cutouts(np_imgs, length, num_patches, is_hwc):
+    """
+    Randomly cut out square patches of each image of a batch, the same as Cutout on each image.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be cut out.
+        length (int): The side length of each square patch.
+        num_patches (int): Number of patches to be cut out of each image.
+        is_hwc (Bool): If True, the shape of np_imgs is (N, H, W, C), otherwise (N, C, H, W).
+
+    Returns:
+        np_imgs (numpy.ndarray), Images with square patches cut out.
+    """
+    _check_batch(np_imgs)
+    np_chw = _to_chw_batch(np_imgs, is_hwc)
+    batch_size, _, image_h, image_w = np_chw.shape
+    # a patch not smaller than the image is not valid, the same as get_erase_params
+    if length >= image_h or length >= image_w:
+        return np_imgs.copy()
+
+    inplace = False
+    for _ in range(num_patches):
+        center_x = np.random.randint(0, image_w + 1, batch_size)
+        center_y = np.random.randint(0, image_h + 1, batch_size)
+        left = np.clip(center_x - length // 2, 0, image_w)
+        right = np.clip(center_x + length // 2, 0, image_w)
+        top = np.clip(center_y - length // 2, 0, image_h)
+        bottom = np.clip(center_y + length // 2, 0, image_h)
+        np_chw = _erase_boxes(np_chw, top, left, bottom - top, right - left, 0, inplace)
+        inplace = True
+    return _from_chw_batch(np_chw, is_hwc)
+
+
+def linear_transforms(np_imgs, transformation_matrix, mean_vector):
+    """
+    Apply linear transformation to each image of a batch, the same as linear_transform on each image.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, C, H, W) to be linear transformed.
+        transformation_matrix (numpy.ndarray): a square transformation matrix of shape (D, D), D = C x H x W.
+        mean_vector (numpy.ndarray): a numpy ndarray of shape (D,) where D = C x H x W.
+
+    Returns:
+        np_imgs (numpy.ndarray), Linear transformed images.
+    """
+    _check_batch(np_imgs)
+    if np.prod(np_imgs.shape[1:]) != transformation_matrix.shape[0]:
+        raise ValueError("transformation_matrix shape {0} not compatible with "
+                         "Numpy Image shape {1}.".format(transformation_matrix.shape, np_imgs.shape[1:]))
+    zero_centered_imgs = np_imgs.reshape(np_imgs.shape[0], -1) - mean_vector
+    return np.dot(zero_centered_imgs, transformation_matrix).reshape(np_imgs.shape)
@@ -21,9 +21,10 @@ import stat
 import time
 import fcntl
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import traceback
 import threading
+import queue
 
 __all__ = ['get_level', 'get_log_config']
 
@@ -63,7 +64,7 @@ _gloglevel_to_name = {
 
 # The mapping of logger configurations to glog configurations
 _confmap_dict = {'level': 'GLOG_v', 'console': 'GLOG_logtostderr', 'filepath': 'GLOG_log_dir',
-                 'maxBytes': 'logger_maxBytes', 'backupCount': 'logger_backupCount'}
+                 'maxBytes': 'logger_maxBytes', 'backupCount': 'logger_backupCount', 'async': 'logger_async'}
 
 
 class _MultiCompatibleRotatingFileHandler(RotatingFileHandler):
@@ -110,6 +111,57 @@ class _MultiCompatibleRotatingFileHandler(RotatingFileHandler):
             self.stream = self._open()
 
 
+class _AsyncHandler(QueueHandler):
+    """
+    Put the log records into a queue, the records are formatted and written by a writer thread.
+
+    The caller only merges the message with its arguments, the file rotation is done by the writer thread with
+    the target handlers, which is still locked across processes. The writer thread is started again in a forked
+    process, where the thread of the parent process does not exist.
+
+    Args:
+        target_handlers (list[Handler]): The handlers writing the records.
+    """
+
+    def __init__(self, target_handlers):
+        super(_AsyncHandler, self).__init__(None)
+        self.target_handlers = target_handlers
+        self._listener = None
+        self._pid = None
+        self._start()
+
+    def _start(self):
+        """Start the writer thread of the current process."""
+        self.queue = queue.Queue()
+        self._listener = QueueListener(self.queue, *self.target_handlers)
+        self._listener.start()
+        self._pid = os.getpid()
+
+    def prepare(self, record):
+        """Merge the message and the exception of the record, which may not be valid later, in the caller."""
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        """Put the record into the queue, starting the writer thread if it is not running in this process."""
+        if self._pid != os.getpid() or self._listener is None:
+            self._start()
+        self.queue.put_nowait(record)
+
+    def close(self):
+        """Write the records in the queue and stop the writer thread."""
+        if self._listener is not None and self._pid == os.getpid():
+            self._listener.stop()
+        self._listener = None
+        for handler in self.target_handlers:
+            handler.close()
+        super(_AsyncHandler, self).close()
+
+
 class _DataFormatter(logging.Formatter):
     """Log formatter"""
 
@@ -195,6 +247,7 @@ def _adapt_cfg(kwargs):
             - filepath (str): The path for saving logs, if console is false, a file path must be assigned.
             - maxBytes (str): The Maximum value of a log file for rotating, only valid if console is false.
             - backupCount (str): The count of rotating backup log files, only valid if console is false.
+            - async (str): Whether to write the logs in a writer thread.
 
     Returns:
         Dict, the input parameter dictionary.
@@ -203,6 +256,7 @@ def _adapt_cfg(kwargs):
     kwargs['console'] = not kwargs.get('console') == _std_off
     kwargs['maxBytes'] = int(kwargs.get('maxBytes', _logger_def_max_bytes))
     kwargs['backupCount'] = int(kwargs.get('backupCount', _logger_def_backup_count))
+    kwargs['async'] = kwargs.get('async') == _std_on
     return kwargs
 
 
@@ -297,12 +351,19 @@ def _verify_config(kwargs):
             - filepath (str): The path for saving logs, if console is false, a file path must be assigned.
             - maxBytes (str): The Maximum value of a log file for rotating, only valid if console is false.
             - backupCount (str): The count of rotating backup log files, only valid if console is false.
+            - async (str): Whether to write the logs in a writer thread.
     """
     # Check the input value of level
     level = kwargs.get('level', None)
     if level is not None:
         _verify_level(level)
 
+    # Check the input value of async
+    async_mode = kwargs.get('async', None)
+    if async_mode is not None and async_mode not in (_std_off, _std_on):
+        raise ValueError(f'Incorrect value, The value of {_confmap_dict["async"]} must be 0 or 1,'
+                         f' Write log in a writer thread, configure to 1.')
+
     # Check the input value of console
     console = kwargs.get('console', None)
     file_path = kwargs.get('filepath', None)
@@ -375,6 +436,9 @@ def get_log_config():
     config_dict = {}
     config_dict['GLOG_v'] = get_level()
     config_dict['GLOG_logtostderr'] = _std_on
+    if isinstance(handler, _AsyncHandler):
+        config_dict['logger_async'] = _std_on
+        handler = handler.target_handlers[0]
 
     if handler.name == 'FileHandler':
         config_dict['GLOG_logtostderr'] = _std_off
@@ -388,8 +452,9 @@ def get_log_config():
 
 def _clear_handler(logger):
     """Clear the handlers that has been set, avoid repeated loading"""
-    for handler in logger.handlers:
+    for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        handler.close()
 
 
 def _find_caller(stack_info=False):
@@ -454,6 +519,8 @@ def _setup_logger(kwargs):
             - maxBytes (int): The Maximum value of a log file for rotating, only valid if console is false.
               Default: 52428800.
             - backupCount (int): The count of rotating backup log files, only valid if console is false. Default: 30.
+            - async (bool): Whether to write the logs in a writer thread, the log calls only put the records
+              into a queue. Default: False.
 
     Returns:
         Logger, well-configured logger.
@@ -491,7 +558,7 @@ def _setup_logger(kwargs):
             console_handler = logging.StreamHandler(sys.stderr)
             console_handler.name = 'StreamHandler'
             console_handler.formatter = _DataFormatter(sub_module, formatter)
-            logger.addHandler(console_handler)
+            handler = console_handler
 
         # Set rotatingFileHandler for the file appender
         else:
@@ -508,7 +575,13 @@ def _setup_logger(kwargs):
             )
             logfile_handler.name = 'FileHandler'
             logfile_handler.formatter = _DataFormatter(sub_module, formatter)
-            logger.addHandler(logfile_handler)
+            handler = logfile_handler
+
+        # Set the handler writing in a writer thread for the async mode
+        if kwargs.get('async', False):
+            handler = _AsyncHandler([handler])
+            handler.name = 'AsyncHandler'
+        logger.addHandler(handler)
 
         _global_logger = logger
 
@@ -15,14 +15,80 @@
 """
 This module is to read data from mindrecord.
 """
+import queue
+import threading
+
+import numpy as np
+
+from .._extends.utils import put_unless_stopped
 from .shardreader import ShardReader
 from .shardheader import ShardHeader
-from .shardutils import populate_data
+from .shardutils import populate_data, split_blob, VALID_ARRAY_ATTRIBUTES
 from .shardutils import MIN_CONSUMER_COUNT, MAX_CONSUMER_COUNT, check_filename
-from .common.exceptions import ParamValueError, ParamTypeError
+from .common.exceptions import ParamValueError, ParamTypeError, MRMUnsupportedSchemaError
 
 __all__ = ['FileReader']
 
+def _object_array(values):
+    """Create a 1-D object array of the values, which are not converted even if they are sequences."""
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+class _ColumnBatcher:
+    """
+    Collect the rows and convert them into a batch of columns.
+
+    Args:
+        columns (list[str]): List of fields in the batch, None means all the fields.
+        blob_fields (list[str]): Fields stored in the blob data.
+        schema (dict): Schema of the MindRecord File.
+    """
+    def __init__(self, columns, blob_fields, schema):
+        self._schema = schema
+        self._blob_fields = blob_fields
+        self._blob_index = {field: i for i, field in enumerate(blob_fields)}
+        self._fields = [field for field in schema if not columns or field in columns]
+        self._data = {field: [] for field in self._fields}
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, blob, raw):
+        """Add a row, the blob fields are kept as memoryview slices of the blob data."""
+        blob_data = split_blob(blob, len(self._blob_fields)) if self._blob_fields else []
+        for field in self._fields:
+            index = self._blob_index.get(field)
+            self._data[field].append(raw.get(field) if index is None else blob_data[index])
+        self._size += 1
+
+    def flush(self):
+        """Return the collected rows as a batch of columns and start a new batch."""
+        batch = {field: self._to_array(field, values) for field, values in self._data.items()}
+        self._data = {field: [] for field in self._fields}
+        self._size = 0
+        return batch
+
+    def _to_array(self, field, values):
+        """Convert the values of a field in the rows to an array."""
+        data_type = self._schema[field]['type']
+        data_shape = self._schema[field].get('shape')
+        if field in self._blob_index and data_shape:
+            try:
+                arrays = [np.reshape(np.frombuffer(value, dtype=data_type), data_shape) for value in values]
+            except ValueError:
+                raise MRMUnsupportedSchemaError('Shape in schema is illegal.')
+            if all(array.shape == arrays[0].shape for array in arrays):
+                return np.stack(arrays)
+            return _object_array(arrays)
+        if data_type in VALID_ARRAY_ATTRIBUTES and not data_shape:
+            return np.array(values, dtype=data_type)
+        return _object_array(values)
+
+
 class FileReader:
     """
     Class to read MindRecord File series.
@@ -79,6 +145,66 @@ class FileReader:
                 yield populate_data(raw, blob, self._columns, self._header.blob_fields, self._header.schema)
             iterator = self._reader.get_next()
 
+    def get_batches(self, batch_size, prefetch_size=2):
+        """
+        Yield the data in batches of columns, which are read ahead by a background thread.
+
+        The rows of all the files of the MindRecord File series are read in order, the background thread keeps
+        `prefetch_size` batches ready while the current one is used. It can not be used together with `get_next`.
+
+        Args:
+            batch_size (int): Number of rows in a batch, the last batch may have less rows.
+            prefetch_size (int, optional): Number of batches read ahead (default=2).
+
+        Yields:
+            dict: keys are the columns, values are numpy.ndarray whose first dimension is the rows of the batch.
+            The ndarray fields of the same shape in all rows are stacked, the int and float fields are 1-D
+            arrays, the other fields are object arrays, where the bytes fields are memoryview slices of the
+            blob data without copying it.
+
+        Raises:
+            ParamValueError: If batch_size or prefetch_size is invalid.
+            MRMUnsupportedSchemaError: If schema is invalid.
+        """
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+            raise ParamValueError("Batch size should be a positive integer.")
+        if not isinstance(prefetch_size, int) or isinstance(prefetch_size, bool) or prefetch_size < 1:
+            raise ParamValueError("Prefetch size should be a positive integer.")
+
+        batches = queue.Queue(prefetch_size)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._read_batches, args=(batch_size, batches, stop))
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    return
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            stop.set()
+
+    def _read_batches(self, batch_size, batches, stop):
+        """Read the rows into batches of columns and put them into the queue, None is put after the last one."""
+        try:
+            batcher = _ColumnBatcher(self._columns, self._header.blob_fields, self._header.schema)
+            rows = self._reader.get_next_buffer()
+            while rows:
+                for blob, raw in rows:
+                    batcher.append(blob, raw)
+                    if len(batcher) == batch_size and not put_unless_stopped(batches, batcher.flush(), stop):
+                        return
+                rows = self._reader.get_next_buffer()
+            if batcher and not put_unless_stopped(batches, batcher.flush(), stop):
+                return
+        except Exception as e:  # pylint: disable=broad-except
+            put_unless_stopped(batches, e, stop)
+            return
+        put_unless_stopped(batches, None, stop)
+
     def finish(self):
         """
         Stop reader worker.
@@ -25,7 +25,7 @@ from .shardreader import ShardReader
 from .shardheader import ShardHeader
 from .shardindexgenerator import ShardIndexGenerator
 from .shardutils import MIN_SHARD_COUNT, MAX_SHARD_COUNT, VALID_ATTRIBUTES, VALID_ARRAY_ATTRIBUTES, \
-    check_filename, VALUE_TYPE_MAP
+    check_filename, VALUE_TYPE_MAP, SUCCESS
 from .common.exceptions import ParamValueError, ParamTypeError, MRMInvalidSchemaError, MRMDefineIndexError, \
     MRMValidateDataError
 
@@ -269,6 +269,129 @@ class FileWriter:
             self._verify_based_on_blob_fields(raw_data)
         return self._writer.write_raw_data(raw_data, validate)
 
+    def write_columns(self, columns, validate=True):
+        """
+        Write columnar data and generate sequential pair of MindRecord File.
+
+        It is the bulk version of `write_raw_data`, the schema is validated once per column and the blob data
+        is passed to the writer without intermediate bytes copies.
+
+        Args:
+           columns (dict): Dict of column name and column data. Column of number or string field is a 1-D
+               ndarray or list, column of ndarray field is a ndarray whose first dimension is the row or a list
+               of ndarray, column of bytes field is a list of bytes-like object or a 2-D uint8 ndarray.
+               All the columns should have the same number of rows.
+           validate (bool, optional): Validate the type of all the fields if it equals to True,
+               or only validate the blob fields (default=True).
+
+        Raises:
+            ParamTypeError: If columns is invalid.
+            MRMValidateDataError: If a column does not match schema.
+            MRMOpenError: If failed to open MindRecord File.
+            MRMSetHeaderError: If failed to set header.
+            MRMWriteDatasetError: If failed to write dataset.
+        """
+        if not isinstance(columns, dict):
+            raise ParamTypeError('columns', 'dict')
+        if not self._writer.is_open:
+            self._writer.open(self._paths)
+        if not self._writer.get_shard_header():
+            self._writer.set_shard_header(self._header)
+
+        schema_content = self._header.schema
+        blob_fields = self._header.blob_fields
+        num_rows = None
+        for field in schema_content:
+            if field not in columns:
+                raise MRMValidateDataError("for schema, there is not '{}' column in the data.".format(field))
+            if num_rows is None:
+                num_rows = len(columns[field])
+            elif len(columns[field]) != num_rows:
+                raise MRMValidateDataError("for schema, column '{}' has {} rows, but {} rows are expected."
+                                           .format(field, len(columns[field]), num_rows))
+        if not num_rows:
+            return SUCCESS
+
+        raw_columns = []
+        for field in schema_content:
+            if field in blob_fields:
+                continue
+            raw_columns.append(self._verify_raw_column(field, columns[field], validate))
+        raw_fields = [field for field in schema_content if field not in blob_fields]
+        raw_data = [dict(zip(raw_fields, row)) for row in zip(*raw_columns)]
+
+        blob_columns = [self._verify_blob_column(field, columns[field], num_rows) for field in blob_fields]
+        blob_data = self._writer.merge_blob_columns(blob_columns, num_rows)
+        return self._writer.write_buffer_data(raw_data, blob_data, validate)
+
+    def _verify_raw_column(self, field, column, validate):
+        """
+        Verify the column of number or string field and convert it to list of python value.
+
+        Args:
+           field (str): Field name.
+           column (Union[list, numpy.ndarray]): Column data.
+           validate (bool): Validate the type of the column.
+
+        Returns:
+            list, the values of the column.
+
+        Raises:
+            MRMValidateDataError: If column does not match schema.
+        """
+        if not validate:
+            return column.tolist() if isinstance(column, np.ndarray) else list(column)
+        array = np.asarray(column)
+        kinds = {"int32": "iu", "int64": "iu", "float32": "f", "float64": "f", "string": "U"}
+        schema_type = self._header.schema[field]["type"]
+        if array.ndim != 1 or schema_type not in kinds or array.dtype.kind not in kinds[schema_type]:
+            raise MRMValidateDataError("for schema, data type for column '{}' is not matched.".format(field))
+        return array.tolist()
+
+    def _verify_blob_column(self, field, column, num_rows):
+        """
+        Verify the column of ndarray or bytes field and convert it to blob column.
+
+        Args:
+           field (str): Field name.
+           column (Union[list, numpy.ndarray]): Column data.
+           num_rows (int): Number of rows.
+
+        Returns:
+            Union[list, numpy.ndarray], 2-D uint8 ndarray of shape (num_rows, row_bytes) or list of
+            1-D uint8 ndarray.
+
+        Raises:
+            MRMValidateDataError: If column does not match schema.
+        """
+        error = MRMValidateDataError("for schema, data type for column '{}' is not matched.".format(field))
+        schema_type = self._header.schema[field]["type"]
+        if schema_type == "bytes":
+            if isinstance(column, np.ndarray):
+                if column.ndim != 2 or column.dtype != np.uint8:
+                    raise error
+                return np.ascontiguousarray(column)
+            try:
+                return [np.frombuffer(x, dtype=np.uint8) for x in column]
+            except TypeError:
+                raise error
+
+        shape = self._header.schema[field]["shape"]
+        try:
+            if isinstance(column, np.ndarray) and column.dtype.kind in "iuf":
+                # the whole column is validated and converted at once
+                column = np.reshape(column, [num_rows] + shape).astype(schema_type, copy=False)
+                return np.ascontiguousarray(column).reshape(num_rows, -1).view(np.uint8)
+            blob_column = []
+            for value in column:
+                if not isinstance(value, np.ndarray) or value.dtype.kind not in "iuf":
+                    raise error
+                value = np.reshape(value, shape).astype(schema_type, copy=False)
+                blob_column.append(np.ascontiguousarray(value).reshape(-1).view(np.uint8))
+            return blob_column
+        except ValueError:
+            raise error
+
     def set_header_size(self, header_size):
         """
         Set the size of header.
@@ -79,6 +79,15 @@ class ShardReader:
         """
         return self._reader.get_next()
 
+    def get_next_buffer(self):
+        """
+        Return a batch of data including blob data and raw data, the blob data is bytes.
+
+        Returns:
+           list of tuple, the blob data and the raw data of each row.
+        """
+        return self._reader.get_next_buffer()
+
     def get_blob_fields(self):
         """
         Return blob fields of MindRecord.
@@ -113,18 +113,30 @@ def populate_data(raw, blob, columns, blob_fields, schema):
         _render_raw(blob_fields[0], blob_bytes)
         return raw
 
-    def _int_from_bytes(xbytes: bytes) -> int:
-        return int.from_bytes(xbytes, 'big')
-
-    def _blob_at_position(pos):
-        start = 0
-        for _ in range(pos):
-            n_bytes = _int_from_bytes(blob_bytes[start : start + 8])
-            start += 8 + n_bytes
-        n_bytes = _int_from_bytes(blob_bytes[start : start + 8])
-        start += 8
-        return blob_bytes[start : start + n_bytes]
-
-    for i, blob_field in enumerate(blob_fields):
-        _render_raw(blob_field, _blob_at_position(i))
+    for blob_field, blob_data in zip(blob_fields, split_blob(blob_bytes, len(blob_fields))):
+        _render_raw(blob_field, blob_data if schema[blob_field].get('shape') else bytes(blob_data))
     return raw
+
+def split_blob(blob, blob_num):
+    """
+    Split the blob data of a row into the data of each blob field, without copying it.
+
+    Args:
+        blob (Union[bytes, memoryview]): Blob data, several blob fields are merged by `ShardWriter._merge_blob`,
+            each one prefixed by its length in 8 bytes.
+        blob_num (int): Number of the blob fields.
+
+    Returns:
+        list[memoryview], slices of the blob data.
+    """
+    view = memoryview(blob)
+    if blob_num == 1:
+        return [view]
+    fields = []
+    start = 0
+    for _ in range(blob_num):
+        n_bytes = int.from_bytes(view[start : start + 8], 'big')
+        start += 8
+        fields.append(view[start : start + n_bytes])
+        start += n_bytes
+    return fields
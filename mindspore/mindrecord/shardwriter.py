@@ -154,47 +154,116 @@ class ShardWriter:
         """
         blob_data = []
         raw_data = []
+        blob_fields = self._header.blob_fields
+        raw_fields = [field for field in self._header.schema if field not in blob_fields]
         # slice data to blob data and raw data
         for item in data:
-            row_blob = self._merge_blob({field: item[field] for field in self._header.blob_fields})
-            if row_blob:
-                blob_data.append(list(row_blob))
+            row_blob = self._merge_blob([item[field] for field in blob_fields])
+            if row_blob is not None:
+                blob_data.append(row_blob)
             # filter raw data according to schema
-            row_raw = {field: item[field]
-                       for field in self._header.schema.keys() - self._header.blob_fields if field in item}
+            row_raw = {field: item[field] for field in raw_fields if field in item}
             if row_raw:
                 raw_data.append(row_raw)
+        return self.write_buffer_data(raw_data, blob_data, validate)
+
+    def write_buffer_data(self, raw_data, blob_data, validate=True):
+        """
+        Write raw data and the merged blob data of each row.
+
+        The blob data is passed to the c++ writer by buffer protocol without converting to python list.
+
+        Args:
+           raw_data (list[dict]): List of raw data without blob fields.
+           blob_data (list): List of merged blob data, each item is a contiguous bytes, memoryview or ndarray.
+           validate (bool, optional): verify data according schema if it equals to True.
+
+        Returns:
+            MSRStatus, SUCCESS or FAILED.
+
+        Raises:
+            MRMWriteCVError: If failed to write cv type dataset.
+        """
         raw_data = {0: raw_data} if raw_data else {}
-        ret = self._writer.write_raw_data(raw_data, blob_data, validate)
+        ret = self._writer.write_raw_buffer_data(raw_data, blob_data, validate)
         if ret != ms.MSRStatus.SUCCESS:
             logger.error("Failed to write dataset.")
             raise MRMWriteDatasetError
         return ret
 
+    @staticmethod
+    def _to_buffer(value):
+        """Convert bytes or ndarray to a contiguous buffer without copy if possible."""
+        if isinstance(value, np.ndarray):
+            return np.ascontiguousarray(value).reshape(-1).view(np.uint8)
+        return value
+
     def _merge_blob(self, blob_data):
         """
         Merge multiple blob data whose type is bytes or ndarray
 
         Args:
-           blob_data (dict): Dict of blob data
+           blob_data (list): List of blob data in the order of blob fields
 
         Returns:
-            bytes, merged blob data
+            bytes, merged blob data, or None if there is no blob field
         """
+        if not blob_data:
+            return None
         if len(blob_data) == 1:
-            values = [v for v in blob_data.values()]
-            return bytes(values[0])
-        # convert int to bytes
-        def int_to_bytes(x: int) -> bytes:
-            return x.to_bytes(8, 'big')
-        merged = bytes()
-        for _, v in blob_data.items():
+            return self._to_buffer(blob_data[0])
+        merged = []
+        for v in blob_data:
             # convert ndarray to bytes
-            if isinstance(v, np.ndarray):
-                v = v.tobytes()
-            merged += int_to_bytes(len(v))
-            merged += v
-        return merged
+            v = self._to_buffer(v)
+            merged.append(len(memoryview(v).cast('B')).to_bytes(8, 'big'))
+            merged.append(v)
+        return b''.join(merged)
+
+    @staticmethod
+    def merge_blob_columns(blob_columns, num_rows):
+        """
+        Merge the blob columns to the blob data of each row.
+
+        The merged blobs of all rows are written into one preallocated buffer. When all columns have fixed
+        row size, every column is copied by one vectorized array assignment.
+
+        Args:
+           blob_columns (list): List of blob columns in the order of blob fields, each column is a 2-D uint8
+               ndarray of shape (num_rows, row_bytes) or a list of 1-D uint8 ndarray.
+           num_rows (int): Number of rows.
+
+        Returns:
+            list[numpy.ndarray], the merged blob of each row, which are views of one buffer.
+        """
+        if not blob_columns:
+            return []
+        if len(blob_columns) == 1:
+            return list(blob_columns[0])
+
+        if all([isinstance(column, np.ndarray) for column in blob_columns]):
+            row_size = sum([8 + column.shape[1] for column in blob_columns])
+            merged = np.empty((num_rows, row_size), dtype=np.uint8)
+            offset = 0
+            for column in blob_columns:
+                merged[:, offset: offset + 8] = np.frombuffer(column.shape[1].to_bytes(8, 'big'), np.uint8)
+                merged[:, offset + 8: offset + 8 + column.shape[1]] = column
+                offset += 8 + column.shape[1]
+            return list(merged)
+
+        lengths = np.array([[column.shape[1]] * num_rows if isinstance(column, np.ndarray)
+                            else [x.size for x in column] for column in blob_columns], dtype=np.int64)
+        row_offsets = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum((lengths + 8).sum(axis=0), out=row_offsets[1:])
+        merged = np.empty(row_offsets[-1], dtype=np.uint8)
+        length_bytes = lengths.astype('>u8').view(np.uint8).reshape(len(blob_columns), num_rows, 8)
+        for i in range(num_rows):
+            offset = row_offsets[i]
+            for j, column in enumerate(blob_columns):
+                merged[offset: offset + 8] = length_bytes[j, i]
+                merged[offset + 8: offset + 8 + lengths[j, i]] = column[i]
+                offset += 8 + lengths[j, i]
+        return [merged[row_offsets[i]: row_offsets[i + 1]] for i in range(num_rows)]
 
     def commit(self):
         """
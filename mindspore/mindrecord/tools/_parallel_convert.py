@@ -0,0 +1,137 @@
+# Copyright 2019 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Parallel pipeline for the MindRecord convert tools.
+"""
+
+import collections
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mindspore import log as logger
+
+# the number of rows of one task, which is also the number of rows of one write_raw_data call
+BATCH_SIZE = 256
+# the number of batches waiting for the writer
+QUEUE_SIZE = 4
+
+
+def check_num_parallel_workers(num_parallel_workers):
+    """Check the num_parallel_workers of the convert tools, None means converting serially."""
+    if num_parallel_workers is None:
+        return
+    if not isinstance(num_parallel_workers, int) or isinstance(num_parallel_workers, bool) \
+            or num_parallel_workers <= 0:
+        raise ValueError("The parameter num_parallel_workers must be positive int")
+
+
+def batch_items(items, batch_size=BATCH_SIZE):
+    """
+    Split the items into batches.
+
+    Args:
+        items (iterable): Items to be split.
+        batch_size (int, optional): Size of batch (default=BATCH_SIZE).
+
+    Yields:
+        list, batch of items.
+    """
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _row_bytes(row):
+    return sum([len(v) for v in row.values() if isinstance(v, bytes)])
+
+
+def write_in_parallel(writer, tasks, task_fn, num_parallel_workers, desc="data"):
+    """
+    Convert the tasks with a thread pool and write the rows with a dedicated writer thread.
+
+    The tasks are read and encoded by `num_parallel_workers` threads while the previous batches are written,
+    the converted batches are kept in order and passed to the writer by a bounded queue. The FileWriter writes
+    all the shards of one batch at the same time.
+
+    Args:
+        writer (FileWriter): The writer whose schema has been added.
+        tasks (iterable): Arguments of task_fn, one for each batch.
+        task_fn (function): Function to convert one task to a list of rows.
+        num_parallel_workers (int): Number of threads to convert the tasks.
+        desc (str, optional): Description of the data in the progress log (default="data").
+
+    Returns:
+        SUCCESS/FAILED, whether successfully written into MindRecord.
+    """
+    batch_queue = queue.Queue(QUEUE_SIZE)
+    progress = {"rows": 0, "bytes": 0, "error": None}
+    start_time = time.time()
+
+    def _write():
+        while True:
+            rows = batch_queue.get()
+            if rows is None:
+                return
+            if progress["error"] is not None:
+                # drain the queue so the producer is not blocked
+                continue
+            try:
+                writer.write_raw_data(rows)
+            except Exception as e:
+                progress["error"] = e
+                continue
+            progress["rows"] += len(rows)
+            progress["bytes"] += sum([_row_bytes(row) for row in rows])
+            cost = max(time.time() - start_time, 1e-6)
+            logger.info("transformed {} {} record, {:.1f} records/s, {:.2f} MB/s...".format(
+                progress["rows"], desc, progress["rows"] / cost, progress["bytes"] / cost / (1 << 20)))
+
+    writer_thread = threading.Thread(target=_write)
+    writer_thread.daemon = True
+    writer_thread.start()
+    try:
+        with ThreadPoolExecutor(max_workers=num_parallel_workers) as executor:
+            # keep the results in the order of tasks and bound the number of tasks in flight
+            futures = collections.deque()
+            for task in tasks:
+                futures.append(executor.submit(task_fn, task))
+                if len(futures) >= num_parallel_workers * 2:
+                    batch_queue.put(futures.popleft().result())
+                if progress["error"] is not None:
+                    break
+            while futures and progress["error"] is None:
+                batch_queue.put(futures.popleft().result())
+            for future in futures:
+                future.cancel()
+    finally:
+        batch_queue.put(None)
+        writer_thread.join()
+
+    if progress["error"] is not None:
+        raise progress["error"]
+    ret = writer.commit()
+    cost = max(time.time() - start_time, 1e-6)
+    logger.info("--------------------------------------------")
+    logger.info("END. Total {} records of {}, time: {:.2f}s, {:.1f} records/s, {:.2f} MB/s".format(
+        progress["rows"], desc, cost, progress["rows"] / cost, progress["bytes"] / cost / (1 << 20)))
+    logger.info("--------------------------------------------")
+    return ret
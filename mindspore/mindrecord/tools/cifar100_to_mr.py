@@ -25,6 +25,7 @@ from .cifar100 import Cifar100
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
 from ..shardutils import check_filename
+from ._parallel_convert import BATCH_SIZE, check_num_parallel_workers, write_in_parallel
 try:
     cv2 = import_module("cv2")
 except ModuleNotFoundError:
@@ -39,11 +40,13 @@ class Cifar100ToMR:
     Args:
         source (str): the cifar100 directory to be transformed.
         destination (str): the MindRecord file path to transform into.
+        num_parallel_workers (int, optional): number of threads to encode the images while writing,
+            None means encoding and writing serially (default=None).
 
     Raises:
-        ValueError: If source or destination is invalid.
+        ValueError: If source, destination or num_parallel_workers is invalid.
     """
-    def __init__(self, source, destination):
+    def __init__(self, source, destination, num_parallel_workers=None):
         check_filename(source)
         self.source = source
 
@@ -65,6 +68,9 @@ class Cifar100ToMR:
         self.destination = destination
         self.writer = None
 
+        check_num_parallel_workers(num_parallel_workers)
+        self.num_parallel_workers = num_parallel_workers
+
     def transform(self, fields=None):
         """
         Executes transformation from cifar100 to MindRecord.
@@ -95,13 +101,34 @@ class Cifar100ToMR:
         test_coarse_labels = cifar100_data.Test.coarse_labels
         logger.info("test images coarse label: {}".format(coarse_labels.shape))
 
-        data_list = _construct_raw_data(images, fine_labels, coarse_labels)
-        test_data_list = _construct_raw_data(test_images, test_fine_labels, test_coarse_labels)
+        if self.num_parallel_workers is not None:
+            data_list = _split_raw_data(images, fine_labels, coarse_labels)
+            test_data_list = _split_raw_data(test_images, test_fine_labels, test_coarse_labels)
+        else:
+            data_list = _construct_raw_data(images, fine_labels, coarse_labels)
+            test_data_list = _construct_raw_data(test_images, test_fine_labels, test_coarse_labels)
 
-        _generate_mindrecord(self.destination, data_list, fields, "img_train")
-        _generate_mindrecord(self.destination + "_test", test_data_list, fields, "img_test")
+        _generate_mindrecord(self.destination, data_list, fields, "img_train", self.num_parallel_workers)
+        _generate_mindrecord(self.destination + "_test", test_data_list, fields, "img_test",
+                             self.num_parallel_workers)
 
-def _construct_raw_data(images, fine_labels, coarse_labels):
+def _split_raw_data(images, fine_labels, coarse_labels):
+    """
+    Split cifar100 data into tasks of _construct_raw_data.
+
+    Args:
+        images (list): image list from cifar100.
+        fine_labels (list): fine label list from cifar100.
+        coarse_labels (list): coarse label list from cifar100.
+
+    Yields:
+        tuple, the images, fine labels, coarse labels and id of the first image.
+    """
+    for start in range(0, len(images), BATCH_SIZE):
+        yield images[start:start + BATCH_SIZE], fine_labels[start:start + BATCH_SIZE], \
+              coarse_labels[start:start + BATCH_SIZE], start
+
+def _construct_raw_data(images, fine_labels, coarse_labels, start=0):
     """
     Construct raw data from cifar100 data.
 
@@ -109,6 +136,7 @@ def _construct_raw_data(images, fine_labels, coarse_labels):
         images (list): image list from cifar100.
         fine_labels (list): fine label list from cifar100.
         coarse_labels (list): coarse label list from cifar100.
+        start (int, optional): id of the first image (default=0).
 
     Returns:
         SUCCESS/FAILED, whether successfully written into MindRecord.
@@ -121,14 +149,17 @@ def _construct_raw_data(images, fine_labels, coarse_labels):
         fine_label = np.int(fine_labels[i][0])
         coarse_label = np.int(coarse_labels[i][0])
         _, img = cv2.imencode(".jpeg", img[..., [2, 1, 0]])
-        row_data = {"id": int(i),
+        row_data = {"id": int(start + i),
                     "data": img.tobytes(),
                     "fine_label": int(fine_label),
                     "coarse_label": int(coarse_label)}
         raw_data.append(row_data)
     return raw_data
 
-def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
+def _construct_raw_data_task(task):
+    return _construct_raw_data(*task)
+
+def _generate_mindrecord(file_name, raw_data, fields, schema_desc, num_parallel_workers=None):
     """
     Generate MindRecord file from raw data.
 
@@ -138,6 +169,8 @@ def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
           could not belong to blob fields and type could not be 'array' or 'bytes'.
         raw_data (dict): Dict of raw data.
         schema_desc (str): String of schema description.
+        num_parallel_workers (int, optional): Number of threads to construct the raw data,
+          raw_data should be the tasks of _construct_raw_data if it is not None (default=None).
 
     Returns:
         SUCCESS/FAILED, whether successfully written into MindRecord.
@@ -151,5 +184,7 @@ def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
     writer.add_schema(schema, schema_desc)
     if fields and isinstance(fields, list):
         writer.add_index(fields)
+    if num_parallel_workers is not None:
+        return write_in_parallel(writer, raw_data, _construct_raw_data_task, num_parallel_workers, schema_desc)
     writer.write_raw_data(raw_data)
     return writer.commit()
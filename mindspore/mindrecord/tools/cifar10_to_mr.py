@@ -25,6 +25,7 @@ from .cifar10 import Cifar10
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
 from ..shardutils import check_filename, SUCCESS, FAILED
+from ._parallel_convert import BATCH_SIZE, check_num_parallel_workers, write_in_parallel
 try:
     cv2 = import_module("cv2")
 except ModuleNotFoundError:
@@ -39,11 +40,13 @@ class Cifar10ToMR:
     Args:
         source (str): the cifar10 directory to be transformed.
         destination (str): the MindRecord file path to transform into.
+        num_parallel_workers (int, optional): number of threads to encode the images while writing,
+            None means encoding and writing serially (default=None).
 
     Raises:
-        ValueError: If source or destination is invalid.
+        ValueError: If source, destination or num_parallel_workers is invalid.
     """
-    def __init__(self, source, destination):
+    def __init__(self, source, destination, num_parallel_workers=None):
         check_filename(source)
         self.source = source
 
@@ -65,6 +68,9 @@ class Cifar10ToMR:
         self.destination = destination
         self.writer = None
 
+        check_num_parallel_workers(num_parallel_workers)
+        self.num_parallel_workers = num_parallel_workers
+
     def transform(self, fields=None):
         """
         Executes transformation from cifar10 to MindRecord.
@@ -91,22 +97,43 @@ class Cifar10ToMR:
         test_labels = cifar10_data.Test.labels
         logger.info("test images label: {}".format(test_labels.shape))
 
-        data_list = _construct_raw_data(images, labels)
-        test_data_list = _construct_raw_data(test_images, test_labels)
+        if self.num_parallel_workers is not None:
+            data_list = _split_raw_data(images, labels)
+            test_data_list = _split_raw_data(test_images, test_labels)
+        else:
+            data_list = _construct_raw_data(images, labels)
+            test_data_list = _construct_raw_data(test_images, test_labels)
 
-        if _generate_mindrecord(self.destination, data_list, fields, "img_train") != SUCCESS:
+        if _generate_mindrecord(self.destination, data_list, fields, "img_train",
+                                self.num_parallel_workers) != SUCCESS:
             return FAILED
-        if _generate_mindrecord(self.destination + "_test", test_data_list, fields, "img_test") != SUCCESS:
+        if _generate_mindrecord(self.destination + "_test", test_data_list, fields, "img_test",
+                                self.num_parallel_workers) != SUCCESS:
             return FAILED
         return SUCCESS
 
-def _construct_raw_data(images, labels):
+def _split_raw_data(images, labels):
+    """
+    Split cifar10 data into tasks of _construct_raw_data.
+
+    Args:
+        images (list): image list from cifar10.
+        labels (list): label list from cifar10.
+
+    Yields:
+        tuple, the images, labels and id of the first image.
+    """
+    for start in range(0, len(images), BATCH_SIZE):
+        yield images[start:start + BATCH_SIZE], labels[start:start + BATCH_SIZE], start
+
+def _construct_raw_data(images, labels, start=0):
     """
     Construct raw data from cifar10 data.
 
     Args:
         images (list): image list from cifar10.
         labels (list): label list from cifar10.
+        start (int, optional): id of the first image (default=0).
 
     Returns:
         SUCCESS/FAILED, whether successfully written into MindRecord.
@@ -118,13 +145,16 @@ def _construct_raw_data(images, labels):
     for i, img in enumerate(images):
         label = np.int(labels[i][0])
         _, img = cv2.imencode(".jpeg", img[..., [2, 1, 0]])
-        row_data = {"id": int(i),
+        row_data = {"id": int(start + i),
                     "data": img.tobytes(),
                     "label": int(label)}
         raw_data.append(row_data)
     return raw_data
 
-def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
+def _construct_raw_data_task(task):
+    return _construct_raw_data(*task)
+
+def _generate_mindrecord(file_name, raw_data, fields, schema_desc, num_parallel_workers=None):
     """
     Generate MindRecord file from raw data.
 
@@ -134,6 +164,8 @@ def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
           could not belong to blob fields and type could not be 'array' or 'bytes'.
         raw_data (dict): dict of raw data.
         schema_desc (str): String of schema description.
+        num_parallel_workers (int, optional): Number of threads to construct the raw data,
+          raw_data should be the tasks of _construct_raw_data if it is not None (default=None).
 
     Returns:
         SUCCESS/FAILED, whether successfully written into MindRecord.
@@ -147,5 +179,7 @@ def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
     writer.add_schema(schema, schema_desc)
     if fields and isinstance(fields, list):
         writer.add_index(fields)
+    if num_parallel_workers is not None:
+        return write_in_parallel(writer, raw_data, _construct_raw_data_task, num_parallel_workers, schema_desc)
     writer.write_raw_data(raw_data)
     return writer.commit()
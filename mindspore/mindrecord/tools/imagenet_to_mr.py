@@ -22,6 +22,7 @@ from mindspore import log as logger
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
 from ..shardutils import check_filename
+from ._parallel_convert import batch_items, check_num_parallel_workers, write_in_parallel
 
 __all__ = ['ImageNetToMR']
 
@@ -43,11 +44,13 @@ class ImageNetToMR:
         image_dir (str): image directory contains n02119789, n02100735, n02110185, n02096294 dir.
         destination (str): the MindRecord file path to transform into.
         partition_number (int, optional): partition size (default=1).
+        num_parallel_workers (int, optional): number of threads to read the images while writing,
+            None means reading and writing serially (default=None).
 
     Raises:
-        ValueError: If map_file, image_dir or destination is invalid.
+        ValueError: If map_file, image_dir, destination or num_parallel_workers is invalid.
     """
-    def __init__(self, map_file, image_dir, destination, partition_number=1):
+    def __init__(self, map_file, image_dir, destination, partition_number=1, num_parallel_workers=None):
         check_filename(map_file)
         self.map_file = map_file
 
@@ -64,14 +67,17 @@ class ImageNetToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        check_num_parallel_workers(num_parallel_workers)
+        self.num_parallel_workers = num_parallel_workers
+
         self.writer = FileWriter(self.destination, self.partition_number)
 
-    def _get_imagenet_as_dict(self):
+    def _get_imagenet_files(self):
         """
-        Get data from imagenet as dict.
+        Get the image files of imagenet.
 
         Yields:
-            data (dict of list): imagenet data list which contains dict.
+            tuple, the file name and label of image.
         """
         if not os.path.exists(self.map_file):
             raise IOError("map file {} not exists".format(self.map_file))
@@ -96,23 +102,40 @@ class ImageNetToMR:
         if not dir_paths:
             raise PathNotExistsError("not valid image dir in {}".format(self.image_dir))
 
-        # get the filename, label and image binary as a dict
         for label in dir_paths:
             for item in os.listdir(dir_paths[label]):
                 file_name = os.path.join(dir_paths[label], item)
                 if not item.endswith("JPEG") and not item.endswith("jpg"):
                     logger.warning("{} file is not suffix with JPEG/jpg, skip it.".format(file_name))
                     continue
-                data = {}
-                data["file_name"] = str(file_name)
-                data["label"] = int(label)
+                yield str(file_name), int(label)
 
-                # get the image data
-                image_file = open(file_name, "rb")
-                image_bytes = image_file.read()
-                image_file.close()
-                data["data"] = image_bytes
-                yield data
+    @staticmethod
+    def _read_image(file_name, label):
+        """Get the filename, label and image binary as a dict."""
+        data = {}
+        data["file_name"] = file_name
+        data["label"] = label
+
+        # get the image data
+        image_file = open(file_name, "rb")
+        image_bytes = image_file.read()
+        image_file.close()
+        data["data"] = image_bytes
+        return data
+
+    def _read_images(self, files):
+        return [self._read_image(file_name, label) for file_name, label in files]
+
+    def _get_imagenet_as_dict(self):
+        """
+        Get data from imagenet as dict.
+
+        Yields:
+            data (dict of list): imagenet data list which contains dict.
+        """
+        for file_name, label in self._get_imagenet_files():
+            yield self._read_image(file_name, label)
 
     def transform(self):
         """
@@ -141,6 +164,10 @@ class ImageNetToMR:
         # add the index
         self.writer.add_index(["label", "file_name"])
 
+        if self.num_parallel_workers is not None:
+            return write_in_parallel(self.writer, batch_items(self._get_imagenet_files()), self._read_images,
+                                     self.num_parallel_workers, "imagenet")
+
         imagenet_iter = self._get_imagenet_as_dict()
         batch_size = 256
         transform_count = 0
@@ -24,6 +24,7 @@ import numpy as np
 from mindspore import log as logger
 from ..filewriter import FileWriter
 from ..shardutils import check_filename, SUCCESS, FAILED
+from ._parallel_convert import batch_items, check_num_parallel_workers, write_in_parallel
 
 try:
     cv2 = import_module("cv2")
@@ -42,12 +43,14 @@ class MnistToMR:
                       train-labels-idx1-ubyte.gz.
         destination (str): the MindRecord file directory to transform into.
         partition_number (int, optional): partition size (default=1).
+        num_parallel_workers (int, optional): number of threads to encode the images while writing,
+            None means encoding and writing serially (default=None).
 
     Raises:
-        ValueError: If source/destination/partition_number is invalid.
+        ValueError: If source/destination/partition_number/num_parallel_workers is invalid.
     """
 
-    def __init__(self, source, destination, partition_number=1):
+    def __init__(self, source, destination, partition_number=1, num_parallel_workers=None):
         self.image_size = 28
         self.num_channels = 1
 
@@ -72,6 +75,9 @@ class MnistToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        check_num_parallel_workers(num_parallel_workers)
+        self.num_parallel_workers = num_parallel_workers
+
         self.writer_train = FileWriter("{}_train.mindrecord".format(destination), self.partition_number)
         self.writer_test = FileWriter("{}_test.mindrecord".format(destination), self.partition_number)
 
@@ -94,6 +100,15 @@ class MnistToMR:
             labels = np.frombuffer(buf, dtype=np.uint8).astype(np.int64)
             return labels
 
+    @staticmethod
+    def _encode_images(items):
+        """Encode a batch of (image, label) as the rows of MindRecord."""
+        rows = []
+        for data, label in items:
+            _, img = cv2.imencode(".jpeg", data)
+            rows.append({"label": int(label), "data": img.tobytes()})
+        return rows
+
     def _mnist_train_iterator(self):
         """
         get data from mnist train data and label file.
@@ -142,6 +157,12 @@ class MnistToMR:
         # add the index
         self.writer_train.add_index(["label"])
 
+        if self.num_parallel_workers is not None:
+            train_data = self._extract_images(self.train_data_filename_, 60000)
+            train_labels = self._extract_labels(self.train_labels_filename_, 60000)
+            return write_in_parallel(self.writer_train, batch_items(zip(train_data, train_labels)),
+                                     self._encode_images, self.num_parallel_workers, "mnist train")
+
         train_iter = self._mnist_train_iterator()
         batch_size = 256
         transform_count = 0
@@ -191,6 +212,12 @@ class MnistToMR:
         # add the index
         self.writer_test.add_index(["label"])
 
+        if self.num_parallel_workers is not None:
+            test_data = self._extract_images(self.test_data_filename_, 10000)
+            test_labels = self._extract_labels(self.test_labels_filename_, 10000)
+            return write_in_parallel(self.writer_test, batch_items(zip(test_data, test_labels)),
+                                     self._encode_images, self.num_parallel_workers, "mnist test")
+
         train_iter = self._mnist_test_iterator()
         batch_size = 256
         transform_count = 0
@@ -60,11 +60,11 @@ class _Conv(Cell):
             raise ValueError("Attr 'out_channels' of 'Conv2D' Op must be divisible by "
                              "attr 'group' of 'Conv2D' Op.")
 
-        self.weight = Parameter(initializer(weight_init, [out_channels, in_channels // group, *kernel_size]),
+        self.weight = Parameter(initializer(weight_init, [out_channels, in_channels // group, *kernel_size], lazy=True),
                                 name='weight')
 
         if check_bool(has_bias):
-            self.bias = Parameter(initializer(bias_init, [out_channels]), name='bias')
+            self.bias = Parameter(initializer(bias_init, [out_channels], lazy=True), name='bias')
         else:
             if bias_init != 'zeros':
                 logger.warning("Value of 'has_bias' is False, value of 'bias_init' will be ignored.")
@@ -319,7 +319,7 @@ class Conv2dTranspose(_Conv):
         self.is_same = self.pad_mode == 'same'
         self.is_pad = self.pad_mode == 'pad'
         if check_bool(has_bias):
-            self.bias = Parameter(initializer(bias_init, [out_channels]), name='bias')
+            self.bias = Parameter(initializer(bias_init, [out_channels], lazy=True), name='bias')
 
         # cause Conv2DBackpropInput's out_channel refers to Conv2D's out_channel.
         self.conv2d_transpose = P.Conv2DBackpropInput(out_channel=in_channels,
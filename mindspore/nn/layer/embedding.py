@@ -63,7 +63,7 @@ class Embedding(Cell):
         self.vocab_size = vocab_size
         self.embedding_size = embedding_size
         self.use_one_hot = use_one_hot
-        self.embedding_table = Parameter(initializer(embedding_table, [vocab_size, embedding_size]),
+        self.embedding_table = Parameter(initializer(embedding_table, [vocab_size, embedding_size], lazy=True),
                                          name='embedding_table')
         self.dtype = dtype
         self.expand = P.ExpandDims()
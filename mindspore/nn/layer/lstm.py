@@ -140,7 +140,7 @@ class LSTM(Cell):
                 increment_size += 2 * gate_size
             weight_size += increment_size * num_directions
 
-        self.weight = Parameter(initializer(0.0, [weight_size, 1, 1]), name='weight')
+        self.weight = Parameter(initializer(0.0, [weight_size, 1, 1], lazy=True), name='weight')
 
         self.fill = P.Fill()
         self.shape = P.Shape()
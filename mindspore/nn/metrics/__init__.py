@@ -24,6 +24,7 @@ from .evaluation import EvaluationBase
 from .metric import Metric
 from .precision import Precision
 from .recall import Recall
+from .confusion_matrix import ConfusionMatrix
 from .fbeta import Fbeta, F1
 from .topk import TopKCategoricalAccuracy, Top1CategoricalAccuracy, Top5CategoricalAccuracy
 from .loss import Loss
@@ -36,6 +37,7 @@ __all__ = [
     "Metric",
     "Precision",
     "Recall",
+    "ConfusionMatrix",
     "Fbeta",
     "F1",
     "TopKCategoricalAccuracy",
@@ -49,6 +51,7 @@ __factory__ = {
     'acc': Accuracy,
     'precision': Precision,
     'recall': Recall,
+    'confusion_matrix': ConfusionMatrix,
     'F1': F1,
     'topk': TopKCategoricalAccuracy,
     'top_1_accuracy': Top1CategoricalAccuracy,
@@ -0,0 +1,158 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""ConfusionMatrix."""
+import numpy as np
+from .metric import Metric
+
+
+class ConfusionMatrix(Metric):
+    r"""
+    Calculates the confusion matrix for classification data.
+
+    The element :math:`(i, j)` of the matrix is the number of samples of class :math:`i` which are predicted as
+    class :math:`j`. The matrix is accumulated by counting the (label, prediction) pairs of each update, which
+    costs :math:`O(N)` for :math:`N` samples, and the classification metrics like `Precision`, `Recall` and
+    `Fbeta` are derived from it. The results of several evaluations, e.g. on different parts of a dataset,
+    can be combined by `merge`.
+
+    Args:
+        class_num (int): The number of classes. If None, it is taken from the first `y_pred`. Default: None.
+
+    Raises:
+        TypeError: If `class_num` is not int.
+        ValueError: If `class_num` is less than 1.
+
+    Examples:
+        >>> x = mindspore.Tensor(np.array([[0.2, 0.5], [0.3, 0.1], [0.9, 0.6]]))
+        >>> y = mindspore.Tensor(np.array([1, 0, 1]))
+        >>> metric = nn.ConfusionMatrix()
+        >>> metric.clear()
+        >>> metric.update(x, y)
+        >>> matrix = metric.eval()
+        [[1 0]
+         [1 1]]
+    """
+    def __init__(self, class_num=None):
+        super(ConfusionMatrix, self).__init__()
+        if class_num is not None:
+            if not isinstance(class_num, int) or isinstance(class_num, bool):
+                raise TypeError('class_num should be integer type, but got {}'.format(type(class_num)))
+            if class_num < 1:
+                raise ValueError('class_num must be at least 1, but got {}'.format(class_num))
+        self._init_class_num = class_num
+        self.clear()
+
+    def clear(self):
+        """Clears the internal evaluation result."""
+        self._class_num = 0
+        self._matrix = None
+        if self._init_class_num is not None:
+            self._set_class_num(self._init_class_num)
+
+    def _set_class_num(self, class_num):
+        """Sets the number of classes on the first update, or checks it on the later ones."""
+        if self._class_num == 0:
+            self._class_num = class_num
+            self._matrix = np.zeros((class_num, class_num), np.int64)
+        elif class_num != self._class_num:
+            raise ValueError('Class number not match, last input data contain {} classes, but current data contain {} '
+                             'classes'.format(self._class_num, class_num))
+
+    @property
+    def class_num(self):
+        """The number of classes, 0 before the first update."""
+        return self._class_num
+
+    @property
+    def true_positives(self):
+        """The number of correctly predicted samples of each class."""
+        return np.diagonal(self._matrix)
+
+    @property
+    def positives(self):
+        """The number of samples predicted as each class."""
+        return self._matrix.sum(axis=0)
+
+    @property
+    def actual_positives(self):
+        """The number of samples of each class."""
+        return self._matrix.sum(axis=1)
+
+    def update(self, *inputs):
+        """
+        Updates the internal evaluation result `y_pred` and `y`.
+
+        Args:
+            inputs: Input `y_pred` and `y`. `y_pred` and `y` are Tensor, list or numpy.ndarray.
+                `y_pred` is in most cases (not strictly) a list of floating numbers in range :math:`[0, 1]`
+                and the shape is :math:`(N, C)`, where :math:`N` is the number of cases and :math:`C`
+                is the number of categories. y contains values of integers. The shape is :math:`(N, C)`
+                if one-hot encoding is used. Shape can also be :math:`(N, 1)` if category index is used.
+
+        Raises:
+            ValueError: If the number of the inputs is not 2, or the inputs do not match.
+        """
+        if len(inputs) != 2:
+            raise ValueError('ConfusionMatrix need 2 inputs (y_pred, y), but got {}'.format(len(inputs)))
+        y_pred = self._convert_data(inputs[0])
+        y = self._convert_data(inputs[1])
+        if y_pred.ndim == y.ndim and self._check_onehot_data(y):
+            y = y.argmax(axis=1)
+        self._set_class_num(y_pred.shape[1])
+
+        indices = y_pred.argmax(axis=1).reshape(-1)
+        y = y.reshape(-1).astype(np.int64)
+        if y.shape != indices.shape:
+            raise ValueError('y_pred contains {} samples but y contains {} samples.'.format(indices.shape[0],
+                                                                                          y.shape[0]))
+        if y.size == 0:
+            return
+        if y.max() + 1 > self._class_num:
+            raise ValueError('y_pred contains {} classes less than y contains {} classes.'.
+                             format(self._class_num, y.max() + 1))
+        if y.min() < 0:
+            raise ValueError('y contains negative class {}.'.format(y.min()))
+
+        # count each (label, prediction) pair in place, repeated pairs are all counted
+        np.add.at(self._matrix, (y, indices), 1)
+
+    def merge(self, other):
+        """
+        Merges the result of another confusion matrix into this one.
+
+        Args:
+            other (ConfusionMatrix): The confusion matrix to merge, e.g. of the evaluation on another device.
+
+        Raises:
+            TypeError: If `other` is not a ConfusionMatrix.
+            ValueError: If the numbers of classes do not match.
+        """
+        if not isinstance(other, ConfusionMatrix):
+            raise TypeError('Only a ConfusionMatrix can be merged, but got {}'.format(type(other)))
+        if other.class_num == 0:
+            return
+        self._set_class_num(other.class_num)
+        self._matrix += other.eval()
+
+    def eval(self):
+        """
+        Computes the confusion matrix.
+
+        Returns:
+            numpy.ndarray, the confusion matrix of shape :math:`(C, C)`.
+        """
+        if self._class_num == 0:
+            raise RuntimeError('Input number of samples can not be 0.')
+        return self._matrix.copy()
@@ -14,9 +14,9 @@
 # ============================================================================
 """Fbeta."""
 import sys
-import numpy as np
 from mindspore._checkparam import ParamValidator as validator
 from .metric import Metric
+from .confusion_matrix import ConfusionMatrix
 
 
 class Fbeta(Metric):
@@ -29,6 +29,8 @@ class Fbeta(Metric):
         F_\beta=\frac{(1+\beta^2) \cdot true positive}
                 {(1+\beta^2) \cdot true positive +\beta^2 \cdot false negative + false positive}
 
+    The fbeta is derived from a `ConfusionMatrix`.
+
     Args:
         beta (float): The weight of precision.
 
@@ -50,10 +52,7 @@ class Fbeta(Metric):
 
     def clear(self):
         """Clears the internal evaluation result."""
-        self._true_positives = 0
-        self._actual_positives = 0
-        self._positives = 0
-        self._class_num = 0
+        self._confusion_matrix = ConfusionMatrix()
 
     def update(self, *inputs):
         """
@@ -68,32 +67,22 @@ class Fbeta(Metric):
         """
         if len(inputs) != 2:
             raise ValueError('Fbeta need 2 inputs (y_pred, y), but got {}'.format(len(inputs)))
-        y_pred = self._convert_data(inputs[0])
-        y = self._convert_data(inputs[1])
-        if y_pred.ndim == y.ndim and self._check_onehot_data(y):
-            y = y.argmax(axis=1)
-
-        if self._class_num == 0:
-            self._class_num = y_pred.shape[1]
-        elif y_pred.shape[1] != self._class_num:
-            raise ValueError('Class number not match, last input data contain {} classes, but current data contain {} '
-                             'classes'.format(self._class_num, y_pred.shape[1]))
-        class_num = self._class_num
-
-        if y.max() + 1 > class_num:
-            raise ValueError('y_pred contains {} classes less than y contains {} classes.'.
-                             format(class_num, y.max() + 1))
-        y = np.eye(class_num)[y.reshape(-1)]
-        indices = y_pred.argmax(axis=1).reshape(-1)
-        y_pred = np.eye(class_num)[indices]
-
-        positives = y_pred.sum(axis=0)
-        actual_positives = y.sum(axis=0)
-        true_positives = (y * y_pred).sum(axis=0)
-
-        self._true_positives += true_positives
-        self._positives += positives
-        self._actual_positives += actual_positives
+        self._confusion_matrix.update(*inputs)
+
+    def merge(self, other):
+        """
+        Merges the result of another fbeta into this one.
+
+        Args:
+            other (Fbeta): The fbeta to merge, e.g. of the evaluation on another device.
+
+        Raises:
+            TypeError: If `other` is not a Fbeta.
+            ValueError: If the numbers of classes do not match.
+        """
+        if not isinstance(other, Fbeta):
+            raise TypeError('Only a Fbeta can be merged, but got {}'.format(type(other)))
+        self._confusion_matrix.merge(other._confusion_matrix)
 
     def eval(self, average=False):
         """
@@ -106,11 +95,12 @@ class Fbeta(Metric):
             Float, computed result.
         """
         validator.check_type("average", average, [bool])
-        if self._class_num == 0:
+        matrix = self._confusion_matrix
+        if matrix.class_num == 0:
             raise RuntimeError('Input number of samples can not be 0.')
 
-        fbeta = (1.0 + self.beta ** 2) * self._true_positives / \
-                (self.beta ** 2 * self._actual_positives + self._positives + self.eps)
+        fbeta = (1.0 + self.beta ** 2) * matrix.true_positives / \
+                (self.beta ** 2 * matrix.actual_positives + matrix.positives + self.eps)
 
         if average:
             return fbeta.mean()
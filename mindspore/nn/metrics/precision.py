@@ -19,6 +19,7 @@ import numpy as np
 
 from mindspore._checkparam import ParamValidator as validator
 from .evaluation import EvaluationBase
+from .confusion_matrix import ConfusionMatrix
 
 
 class Precision(EvaluationBase):
@@ -35,6 +36,7 @@ class Precision(EvaluationBase):
 
     Note:
         In the multi-label cases, the elements of :math:`y` and :math:`y_{pred}` should be 0 or 1.
+        In the classification cases, the precision is derived from a `ConfusionMatrix`.
 
     Args:
         eval_type (str): Metric to calculate accuracy over a dataset, for classification or
@@ -57,14 +59,12 @@ class Precision(EvaluationBase):
     def clear(self):
         """Clears the internal evaluation result."""
         self._class_num = 0
-        if self._type == "multilabel":
-            self._true_positives = np.empty(0)
-            self._positives = np.empty(0)
-            self._true_positives_average = 0
-            self._positives_average = 0
-        else:
-            self._true_positives = 0
-            self._positives = 0
+        self._confusion_matrix = ConfusionMatrix()
+        # the results of the samples of each update in multi-label cases, concatenated in eval
+        self._true_positives = []
+        self._positives = []
+        self._true_positives_average = 0
+        self._positives_average = 0
 
     def update(self, *inputs):
         """
@@ -98,30 +98,48 @@ class Precision(EvaluationBase):
             raise ValueError('Class number not match, last input data contain {} classes, but current data contain {} '
                              'classes'.format(self._class_num, y_pred.shape[1]))
 
-        class_num = self._class_num
         if self._type == "classification":
-            if y.max() + 1 > class_num:
-                raise ValueError('y_pred contains {} classes less than y contains {} classes.'.
-                                 format(class_num, y.max() + 1))
-            y = np.eye(class_num)[y.reshape(-1)]
-            indices = y_pred.argmax(axis=1).reshape(-1)
-            y_pred = np.eye(class_num)[indices]
-        elif self._type == "multilabel":
-            y_pred = y_pred.swapaxes(1, 0).reshape(class_num, -1)
-            y = y.swapaxes(1, 0).reshape(class_num, -1)
+            self._confusion_matrix.update(y_pred, y)
+            return
+
+        class_num = self._class_num
+        y_pred = y_pred.swapaxes(1, 0).reshape(class_num, -1)
+        y = y.swapaxes(1, 0).reshape(class_num, -1)
 
         positives = y_pred.sum(axis=0)
         true_positives = (y * y_pred).sum(axis=0)
 
-        if self._type == "multilabel":
-            self._true_positives_average += np.sum(true_positives / (positives + self.eps))
-            self._positives_average += len(positives)
-            self._true_positives = np.concatenate((self._true_positives, true_positives), axis=0)
-            self._positives = np.concatenate((self._positives, positives), axis=0)
+        self._true_positives_average += np.sum(true_positives / (positives + self.eps))
+        self._positives_average += len(positives)
+        self._true_positives.append(true_positives)
+        self._positives.append(positives)
+
+    def merge(self, other):
+        """
+        Merges the result of another precision into this one.
+
+        Args:
+            other (Precision): The precision to merge, e.g. of the evaluation on another device.
 
+        Raises:
+            TypeError: If `other` is not a Precision of the same evaluation type.
+            ValueError: If the numbers of classes do not match.
+        """
+        if not isinstance(other, Precision) or other._type != self._type:
+            raise TypeError('Only a Precision of {} type can be merged, but got {}'.format(self._type, other))
+        if other._class_num == 0:
+            return
+        if self._class_num not in (0, other._class_num):
+            raise ValueError('Class number not match, this precision contain {} classes, but the other contain {} '
+                             'classes'.format(self._class_num, other._class_num))
+        self._class_num = other._class_num
+        if self._type == "classification":
+            self._confusion_matrix.merge(other._confusion_matrix)
         else:
-            self._true_positives += true_positives
-            self._positives += positives
+            self._true_positives_average += other._true_positives_average
+            self._positives_average += other._positives_average
+            self._true_positives.extend(other._true_positives)
+            self._positives.extend(other._positives)
 
     def eval(self, average=False):
         """
@@ -137,10 +155,12 @@ class Precision(EvaluationBase):
             raise RuntimeError('Input number of samples can not be 0.')
 
         validator.check_type("average", average, [bool])
-        result = self._true_positives / (self._positives + self.eps)
+        if self._type == "multilabel":
+            if average:
+                return self._true_positives_average / (self._positives_average + self.eps)
+            return np.concatenate(self._true_positives) / (np.concatenate(self._positives) + self.eps)
 
+        result = self._confusion_matrix.true_positives / (self._confusion_matrix.positives + self.eps)
         if average:
-            if self._type == "multilabel":
-                result = self._true_positives_average / (self._positives_average + self.eps)
             return result.mean()
         return result
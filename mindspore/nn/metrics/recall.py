@@ -19,6 +19,7 @@ import numpy as np
 
 from mindspore._checkparam import ParamValidator as validator
 from .evaluation import EvaluationBase
+from .confusion_matrix import ConfusionMatrix
 
 
 class Recall(EvaluationBase):
@@ -35,6 +36,7 @@ class Recall(EvaluationBase):
 
     Note:
         In the multi-label cases, the elements of :math:`y` and :math:`y_{pred}` should be 0 or 1.
+        In the classification cases, the recall is derived from a `ConfusionMatrix`.
 
     Args:
         eval_type (str): Metric to calculate the recall over a dataset, for classification or
@@ -57,14 +59,12 @@ class Recall(EvaluationBase):
     def clear(self):
         """Clears the internal evaluation result."""
         self._class_num = 0
-        if self._type == "multilabel":
-            self._true_positives = np.empty(0)
-            self._actual_positives = np.empty(0)
-            self._true_positives_average = 0
-            self._actual_positives_average = 0
-        else:
-            self._true_positives = 0
-            self._actual_positives = 0
+        self._confusion_matrix = ConfusionMatrix()
+        # the results of the samples of each update in multi-label cases, concatenated in eval
+        self._true_positives = []
+        self._actual_positives = []
+        self._true_positives_average = 0
+        self._actual_positives_average = 0
 
     def update(self, *inputs):
         """
@@ -99,29 +99,48 @@ class Recall(EvaluationBase):
             raise ValueError('Class number not match, last input data contain {} classes, but current data contain {} '
                              'classes'.format(self._class_num, y_pred.shape[1]))
 
-        class_num = self._class_num
         if self._type == "classification":
-            if y.max() + 1 > class_num:
-                raise ValueError('y_pred contains {} classes less than y contains {} classes.'.
-                                 format(class_num, y.max() + 1))
-            y = np.eye(class_num)[y.reshape(-1)]
-            indices = y_pred.argmax(axis=1).reshape(-1)
-            y_pred = np.eye(class_num)[indices]
-        elif self._type == "multilabel":
-            y_pred = y_pred.swapaxes(1, 0).reshape(class_num, -1)
-            y = y.swapaxes(1, 0).reshape(class_num, -1)
+            self._confusion_matrix.update(y_pred, y)
+            return
+
+        class_num = self._class_num
+        y_pred = y_pred.swapaxes(1, 0).reshape(class_num, -1)
+        y = y.swapaxes(1, 0).reshape(class_num, -1)
 
         actual_positives = y.sum(axis=0)
         true_positives = (y * y_pred).sum(axis=0)
 
-        if self._type == "multilabel":
-            self._true_positives_average += np.sum(true_positives / (actual_positives + self.eps))
-            self._actual_positives_average += len(actual_positives)
-            self._true_positives = np.concatenate((self._true_positives, true_positives), axis=0)
-            self._actual_positives = np.concatenate((self._actual_positives, actual_positives), axis=0)
+        self._true_positives_average += np.sum(true_positives / (actual_positives + self.eps))
+        self._actual_positives_average += len(actual_positives)
+        self._true_positives.append(true_positives)
+        self._actual_positives.append(actual_positives)
+
+    def merge(self, other):
+        """
+        Merges the result of another recall into this one.
+
+        Args:
+            other (Recall): The recall to merge, e.g. of the evaluation on another device.
+
+        Raises:
+            TypeError: If `other` is not a Recall of the same evaluation type.
+            ValueError: If the numbers of classes do not match.
+        """
+        if not isinstance(other, Recall) or other._type != self._type:
+            raise TypeError('Only a Recall of {} type can be merged, but got {}'.format(self._type, other))
+        if other._class_num == 0:
+            return
+        if self._class_num not in (0, other._class_num):
+            raise ValueError('Class number not match, this recall contain {} classes, but the other contain {} '
+                             'classes'.format(self._class_num, other._class_num))
+        self._class_num = other._class_num
+        if self._type == "classification":
+            self._confusion_matrix.merge(other._confusion_matrix)
         else:
-            self._true_positives += true_positives
-            self._actual_positives += actual_positives
+            self._true_positives_average += other._true_positives_average
+            self._actual_positives_average += other._actual_positives_average
+            self._true_positives.extend(other._true_positives)
+            self._actual_positives.extend(other._actual_positives)
 
     def eval(self, average=False):
         """
@@ -137,10 +156,12 @@ class Recall(EvaluationBase):
             raise RuntimeError('Input number of samples can not be 0.')
 
         validator.check_type("average", average, [bool])
-        result = self._true_positives / (self._actual_positives + self.eps)
+        if self._type == "multilabel":
+            if average:
+                return self._true_positives_average / (self._actual_positives_average + self.eps)
+            return np.concatenate(self._true_positives) / (np.concatenate(self._actual_positives) + self.eps)
 
+        result = self._confusion_matrix.true_positives / (self._confusion_matrix.actual_positives + self.eps)
         if average:
-            if self._type == "multilabel":
-                result = self._true_positives_average / (self._actual_positives_average + self.eps)
             return result.mean()
         return result
@@ -74,11 +74,13 @@ class TopKCategoricalAccuracy(Metric):
         y = self._convert_data(inputs[1])
         if y_pred.ndim == y.ndim and self._check_onehot_data(y):
             y = y.argmax(axis=1)
-        indices = np.argsort(-y_pred, axis=1)[:, :self.k]
-        repeated_y = y.reshape(-1, 1).repeat(self.k, axis=1)
-        correct = np.equal(indices, repeated_y).sum(axis=1)
+        y = y.reshape(-1, 1).astype(np.int64)
+        # the rank of the target in the stably sorted scores, the sample is correct if it is less than k
+        target = np.take_along_axis(y_pred, y, axis=1)
+        ahead = (y_pred > target) | ((y_pred == target) & (np.arange(y_pred.shape[1]) < y))
+        correct = ahead.sum(axis=1) < self.k
         self._correct_num += correct.sum()
-        self._samples_num += repeated_y.shape[0]
+        self._samples_num += y.shape[0]
 
     def eval(self):
         """
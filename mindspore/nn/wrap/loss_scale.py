@@ -44,7 +44,8 @@ class DynamicLossScaleUpdateCell(Cell):
     when there is overflow. And it will be increased by loss scaling value * `scale_factor` if there is no
     overflow for a continuous `scale_window` steps. This cell is used for Graph mode training in which all
     logic will be executed on device side(Another training mode is feed mode in which some logic will be
-    executed on host).
+    executed on host). It is also used in the feed mode if the overflow check of `DynamicLossScaleManager`
+    is deferred, then the loss scale is not fed from host.
 
     Args:
         loss_scale_value (float): Init loss scale.
@@ -12,9 +12,89 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ============================================================================
-"""Operators info register."""
+"""
+Operators info register.
+
+The op info modules are not imported with the package. `OP_INFO_INDEX` maps each (op_name, imply_type) to the
+module registering its op info, and the module is imported when the op info is looked up the first time, which
+is done by the op lib when it does not find the op. Run `scripts/gen_op_info_index.py` to update the index after
+adding an op info module.
+"""
+import os
+import ast
+import json
+import importlib
+import threading
+
+from ._op_info_index import OP_INFO_INDEX
+
+# the modules not registered, as the op info is registered by another module.
+_EXCLUDED_MODULES = ("tbe.resize_nearest_neighbor",)
+
+_register_lock = threading.Lock()
+
+
+def register_op(op_name, imply_type):
+    """
+    Register the op info of the op by importing its module.
+
+    Args:
+        op_name (str): The name of the op.
+        imply_type (str): The implement type of the op, "TBE" or "AutoDiff".
+
+    Returns:
+        bool, whether the op has a built-in op info.
+    """
+    module = OP_INFO_INDEX.get((op_name, imply_type))
+    if module is None:
+        return False
+    with _register_lock:
+        importlib.import_module("." + module, __name__)
+    return True
+
+
+def register_all_ops():
+    """Register the op info of all built-in ops."""
+    for module in sorted(set(OP_INFO_INDEX.values())):
+        with _register_lock:
+            importlib.import_module("." + module, __name__)
+
+
+def build_op_info_index(root=None):
+    """
+    Build the index of the op info modules by scanning their `op_info_register` decorators.
+
+    Args:
+        root (str): The directory of the op info modules. Default: the directory of this package.
+
+    Returns:
+        dict, the module of each (op_name, imply_type), relative to the package.
+
+    Raises:
+        ValueError: If an op info is registered by two modules.
+    """
+    if root is None:
+        root = os.path.dirname(os.path.abspath(__file__))
+    index = {}
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".py") or file_name.startswith("_"):
+                continue
+            module = os.path.relpath(os.path.join(dir_path, file_name[:-3]), root).replace(os.sep, ".")
+            if module in _EXCLUDED_MODULES:
+                continue
+            with open(os.path.join(dir_path, file_name)) as f:
+                tree = ast.parse(f.read())
+            for node in ast.walk(tree):
+                if not isinstance(node, ast.Call) or getattr(node.func, "id", None) != "op_info_register":
+                    continue
+                op_info = json.loads(ast.literal_eval(node.args[0]))
+                key = (op_info["op_name"], op_info["imply_type"])
+                if key in index:
+                    raise ValueError("Op info {} is registered by both {} and {}.".format(key, index[key], module))
+                index[key] = module
+    return index
 
-from .akg.gpu import *
-from .tbe import *
 
 __all__ = []
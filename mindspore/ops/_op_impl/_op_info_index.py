@@ -0,0 +1,143 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The index of the op info modules, generated by scripts/gen_op_info_index.py. Do not edit."""
+
+OP_INFO_INDEX = {
+    ('Cast', 'AutoDiff'): 'akg.gpu.cast',
+    ('Equal', 'AutoDiff'): 'akg.gpu.equal',
+    ('Mul', 'AutoDiff'): 'akg.gpu.mul',
+    ('ReLU6', 'AutoDiff'): 'akg.gpu.relu6',
+    ('ReLU6Grad', 'AutoDiff'): 'akg.gpu.relu6_grad',
+    ('SimpleMean', 'AutoDiff'): 'akg.gpu.mean',
+    ('SimpleMeanGrad', 'AutoDiff'): 'akg.gpu.mean_grad',
+    ('Squeeze', 'AutoDiff'): 'akg.gpu.squeeze',
+    ('SqueezeGrad', 'AutoDiff'): 'akg.gpu.squeeze_grad',
+    ('Tile', 'AutoDiff'): 'akg.gpu.tile',
+    ('Adam', 'TBE'): 'tbe.apply_adam',
+    ('AdamApplyOneWithDecay', 'TBE'): 'tbe.adam_apply_one_with_decay',
+    ('Add', 'TBE'): 'tbe.add',
+    ('AddN', 'TBE'): 'tbe.add_n',
+    ('ApplyMomentum', 'TBE'): 'tbe.apply_momentum',
+    ('ArgMaxWithValue', 'TBE'): 'tbe.arg_max_with_value',
+    ('ArgMinWithValue', 'TBE'): 'tbe.arg_min_with_value',
+    ('Assign', 'TBE'): 'tbe.assign',
+    ('AssignAdd', 'TBE'): 'tbe.assign_add',
+    ('AssignSub', 'TBE'): 'tbe.assign_sub',
+    ('AtomicAddrClean', 'TBE'): 'tbe.atomic_addr_clean',
+    ('BNTrainingReduce', 'TBE'): 'tbe.bn_training_reduce',
+    ('BNTrainingReduceGrad', 'TBE'): 'tbe.bn_training_reduce_grad',
+    ('BNTrainingUpdate', 'TBE'): 'tbe.bn_training_update',
+    ('BNTrainingUpdateGrad', 'TBE'): 'tbe.bn_training_update_grad',
+    ('BatchMatMul', 'TBE'): 'tbe.batch_matmul',
+    ('BatchNorm', 'TBE'): 'tbe.batchnorm',
+    ('BatchNormGrad', 'TBE'): 'tbe.batchnorm_grad',
+    ('BiasAdd', 'TBE'): 'tbe.bias_add',
+    ('BiasAddGrad', 'TBE'): 'tbe.bias_add_grad',
+    ('Cast', 'TBE'): 'tbe.cast',
+    ('ClipByNormNoDivSum', 'TBE'): 'tbe.clip_by_norm_no_div_sum',
+    ('ClipByValue', 'TBE'): 'tbe.clip_by_value',
+    ('Concat', 'TBE'): 'tbe.concat',
+    ('ConfusionSoftmaxGrad', 'TBE'): 'tbe.confusion_softmax_grad',
+    ('ConfusionTransposeD', 'TBE'): 'tbe.confusion_transpose_d',
+    ('Conv2D', 'TBE'): 'tbe.conv2d',
+    ('Conv2DBackpropFilter', 'TBE'): 'tbe.conv2d_backprop_filter',
+    ('Conv2DBackpropInput', 'TBE'): 'tbe.conv2d_backprop_input',
+    ('Div', 'TBE'): 'tbe.div',
+    ('DropoutDoMask', 'TBE'): 'tbe.dropout_do_mask',
+    ('Equal', 'TBE'): 'tbe.equal',
+    ('Exp', 'TBE'): 'tbe.exp',
+    ('ExpandDims', 'TBE'): 'tbe.expand_dims',
+    ('FloorDiv', 'TBE'): 'tbe.floor_div',
+    ('FusedMulAdd', 'TBE'): 'tbe.fused_mul_add',
+    ('FusedMulAddN', 'TBE'): 'tbe.fused_mul_add_n',
+    ('FusedMulApplyMomentum', 'TBE'): 'tbe.fused_mul_apply_momentum',
+    ('GatherV2', 'TBE'): 'tbe.gather_v2',
+    ('Gelu', 'TBE'): 'tbe.gelu',
+    ('GeluGrad', 'TBE'): 'tbe.gelu_grad',
+    ('Greater', 'TBE'): 'tbe.greater',
+    ('LambNextMV', 'TBE'): 'tbe.lamb_next_mv',
+    ('LambNextMVWithDecayV1', 'TBE'): 'tbe.lamb_next_mv_with_decay_v1',
+    ('LambUpdateWithLR', 'TBE'): 'tbe.lamb_update_with_lr',
+    ('LambUpdateWithLrV2', 'TBE'): 'tbe.lamb_update_with_lr_v2',
+    ('LayerNorm', 'TBE'): 'tbe.layer_norm',
+    ('LayerNormBetaGammaBackprop', 'TBE'): 'tbe.layer_norm_beta_gamma_backprop',
+    ('LayerNormGrad', 'TBE'): 'tbe.layer_norm_grad',
+    ('LayerNormXBackprop', 'TBE'): 'tbe.layer_norm_x_backprop',
+    ('Less', 'TBE'): 'tbe.less',
+    ('LessEqual', 'TBE'): 'tbe.less_equal',
+    ('Log', 'TBE'): 'tbe.log',
+    ('LogSoftmax', 'TBE'): 'tbe.logsoftmax',
+    ('LogSoftmaxGrad', 'TBE'): 'tbe.logsoftmax_grad',
+    ('LogicalAnd', 'TBE'): 'tbe.logical_and',
+    ('LogicalNot', 'TBE'): 'tbe.logical_not',
+    ('LogicalOr', 'TBE'): 'tbe.logical_or',
+    ('MatMul', 'TBE'): 'tbe.matmul',
+    ('MaxPool', 'TBE'): 'tbe.max_pool',
+    ('MaxPoolGrad', 'TBE'): 'tbe.max_pool_grad',
+    ('MaxPoolGradWithArgmax', 'TBE'): 'tbe.max_pool_grad_with_argmax',
+    ('MaxPoolWithArgmax', 'TBE'): 'tbe.max_pool_with_argmax',
+    ('Maximum', 'TBE'): 'tbe.maximum',
+    ('MaximumGrad', 'TBE'): 'tbe.maximum_grad',
+    ('Minimum', 'TBE'): 'tbe.minimum',
+    ('MinimumGrad', 'TBE'): 'tbe.minimum_grad',
+    ('Mul', 'TBE'): 'tbe.mul',
+    ('NPUAllocFloatStatus', 'TBE'): 'tbe.npu_alloc_float_status',
+    ('NPUClearFloatStatus', 'TBE'): 'tbe.npu_clear_float_status',
+    ('NPUGetFloatStatus', 'TBE'): 'tbe.npu_get_float_status',
+    ('Neg', 'TBE'): 'tbe.neg',
+    ('OneHot', 'TBE'): 'tbe.one_hot',
+    ('Pad', 'TBE'): 'tbe.pad_d',
+    ('Pow', 'TBE'): 'tbe.pow',
+    ('ReLU', 'TBE'): 'tbe.relu',
+    ('RealDiv', 'TBE'): 'tbe.real_div',
+    ('Reciprocal', 'TBE'): 'tbe.reciprocal',
+    ('ReduceMax', 'TBE'): 'tbe.reduce_max',
+    ('ReduceMean', 'TBE'): 'tbe.reduce_mean',
+    ('ReduceMeanD', 'TBE'): 'tbe.reduce_mean_d',
+    ('ReduceSum', 'TBE'): 'tbe.reduce_sum',
+    ('ReluGrad', 'TBE'): 'tbe.relu_grad',
+    ('Reshape', 'TBE'): 'tbe.reshape',
+    ('ResizeNearestNeighbor', 'TBE'): 'tbe.resize_nearest_neighbor_d',
+    ('ResizeNearestNeighborGrad', 'TBE'): 'tbe.resize_nearest_neighbor_grad_d',
+    ('Rsqrt', 'TBE'): 'tbe.rsqrt',
+    ('ScatterNd', 'TBE'): 'tbe.scatter_nd',
+    ('ScatterNdD', 'TBE'): 'tbe.scatter_nd_d',
+    ('Select', 'TBE'): 'tbe.select',
+    ('Sigmoid', 'TBE'): 'tbe.sigmoid',
+    ('SigmoidCrossEntropyWithLogits', 'TBE'): 'tbe.sigmoid_cross_entropy_with_logits',
+    ('SigmoidCrossEntropyWithLogitsGrad', 'TBE'): 'tbe.sigmoid_cross_entropy_with_logits_grad',
+    ('SigmoidGrad', 'TBE'): 'tbe.sigmoid_grad',
+    ('Slice', 'TBE'): 'tbe.slice',
+    ('Softmax', 'TBE'): 'tbe.softmax',
+    ('SoftmaxCrossEntropyWithLogits', 'TBE'): 'tbe.softmax_cross_entropy_with_logits',
+    ('Split', 'TBE'): 'tbe.split_d',
+    ('Sqrt', 'TBE'): 'tbe.sqrt',
+    ('Square', 'TBE'): 'tbe.square',
+    ('SquareSumV1', 'TBE'): 'tbe.square_sum_v1',
+    ('SquareSumV2', 'TBE'): 'tbe.square_sum_v2',
+    ('Squeeze', 'TBE'): 'tbe.squeeze',
+    ('StridedSlice', 'TBE'): 'tbe.strideslice_d',
+    ('StridedSliceGrad', 'TBE'): 'tbe.strideslicegrad_d',
+    ('Sub', 'TBE'): 'tbe.sub',
+    ('Tanh', 'TBE'): 'tbe.tanh',
+    ('TanhGrad', 'TBE'): 'tbe.tanh_grad',
+    ('TensorAdd', 'TBE'): 'tbe.tensor_add',
+    ('Tile', 'TBE'): 'tbe.tile',
+    ('TopKV2', 'TBE'): 'tbe.topkv2',
+    ('TransData', 'TBE'): 'tbe.trans_data',
+    ('Transpose', 'TBE'): 'tbe.transpose_d',
+    ('UnsortedSegmentSum', 'TBE'): 'tbe.unsorted_segment_sum',
+    ('ZerosLike', 'TBE'): 'tbe.zeros_like',
+}
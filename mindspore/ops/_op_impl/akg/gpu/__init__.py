@@ -12,14 +12,4 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""__init__"""
-from .cast import _cast_akg
-from .equal import _equal_akg
-from .mean import _simple_mean_akg
-from .mean_grad import _simple_mean_grad_akg
-from .mul import _mul_akg
-from .relu6 import _relu6_akg
-from .relu6_grad import _relu6_grad_akg
-from .squeeze import _squeeze_akg
-from .squeeze_grad import _squeeze_grad_akg
-from .tile import _tile_akg
+"""akg gpu ops, registered lazily by `_op_impl.register_op`."""
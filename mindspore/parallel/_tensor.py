@@ -39,25 +39,6 @@ def _get_tensor_strategy(dev_mat, tensor_map):
     return tensor_strategy
 
 
-def _get_tensor_slice_index(device_arrangement, tensor_strategy, tensor_map, rank_index):
-    """
-    Get the tensor slice index for the local device.
-
-    Args:
-        device_arrangement (list): The device matrix.
-        tensor_strategy (list): The split strategy with the same size of np_tensor.
-        tensor_map (list): The map relation between tensor and devices.
-        rank_index (int): The rank of local device.
-
-    Returns:
-        Integer, the index of the local device for tensor slices.
-    """
-    device_coordinate = _rank_to_coordinate(rank_index, device_arrangement)
-    device_coordinate_new = _convert_to_new_device_coordinate(device_coordinate, tensor_map)
-    tensor_slice_index = _coordinate_to_rank(device_coordinate_new, tensor_strategy)
-    return tensor_slice_index
-
-
 def _rank_to_coordinate(rank_index, device_arrangement):
     """
     Convert rank index to device coordinate.
@@ -70,103 +51,136 @@ def _rank_to_coordinate(rank_index, device_arrangement):
         List, the coordinate for local device in the device matrix
     """
     dim_len = len(device_arrangement)
-    device_coordinate = np.zeros(dim_len)
+    device_coordinate = [0] * dim_len
     for i in range(dim_len):
         size = device_arrangement[dim_len - 1 - i]
         device_coordinate[dim_len - 1 - i] = rank_index % size
-        rank_index = int(rank_index / size)
+        rank_index //= size
     return device_coordinate
 
 
-def _coordinate_to_rank(device_coordinate, device_arrangement):
+def _get_slice_region(shape, dev_mat, tensor_map, rank_index):
     """
-    Convert device coordinate to rank index.
+    Get the region of the tensor slice on a device, which is the same slice _load_tensor gets.
 
     Args:
-        device_coordinate (list): The coordinate for local device in the device matrix.
-        device_arrangement (list): The device matrix.
+        shape (list): The shape of the whole tensor.
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+        rank_index (int): The rank of the device.
 
     Returns:
-        Integer, the index of the local device for tensor slices.
-    """
-    rank_index = 0
-    size = 1
-    for i in range(len(device_coordinate)):
-        rank_index += size * device_coordinate[len(device_coordinate) - 1 - i]
-        size *= device_arrangement[len(device_coordinate) - 1 - i]
-    return rank_index
+        Tuple, the offset of the slice in each dimension and the shape of the slice.
 
+    Raises:
+        ValueError: If the tensor can not be split by the layout.
 
-def _convert_to_new_device_coordinate(device_coordinate, tensor_map):
+    Examples:
+        >>> offset, slice_shape = _get_slice_region([32, 16], [2, 4], [1, -1], 5)
+        >>> # offset is [16, 0], slice_shape is [16, 16]
+    """
+    if len(shape) != len(tensor_map):
+        raise ValueError("The length of shape {} does not match the tensor map {}.".format(shape, tensor_map))
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    device_coordinate = _rank_to_coordinate(rank_index, dev_mat)
+    offset = []
+    slice_shape = []
+    for i, dim in enumerate(tensor_map):
+        if shape[i] % tensor_strategy[i] != 0:
+            raise ValueError("The shape {} can not be split by the strategy {}.".format(shape, tensor_strategy))
+        size = shape[i] // tensor_strategy[i]
+        index = 0 if dim == -1 else device_coordinate[len(dev_mat) - 1 - dim]
+        offset.append(index * size)
+        slice_shape.append(size)
+    return offset, slice_shape
+
+
+def _is_first_replica(dev_mat, tensor_map, rank_index):
     """
-    Convert device_coordinate according to the tensor map.
+    Whether the device holds the first replica of its tensor slice.
+
+    The devices whose coordinates only differ in the device dimensions that the tensor is not split along
+    hold the same slice, the one at coordinate 0 in all these dimensions is the first replica.
 
     Args:
-        device_coordinate (list): The coordinate for local device in the device matrix.
-        tensor_map (list): The map relation between tensor and devices.
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+        rank_index (int): The rank of the device.
 
     Returns:
-        List, the converted coordinate.
+        Bool, whether the device holds the first replica.
     """
-    device_coordinate_new = []
-    for i in range(len(tensor_map)):
-        if tensor_map[len(tensor_map) - 1 - i] != -1:
-            device_coordinate_new.insert(0, device_coordinate[len(device_coordinate) - 1 -
-                                                              tensor_map[len(tensor_map) - 1 - i]])
-        else:
-            device_coordinate_new.insert(0, 0)
-    return device_coordinate_new
+    device_coordinate = _rank_to_coordinate(rank_index, dev_mat)
+    split_dims = set([len(dev_mat) - 1 - dim for dim in tensor_map if dim != -1])
+    for i, coordinate in enumerate(device_coordinate):
+        if i not in split_dims and coordinate != 0:
+            return False
+    return True
 
 
-def _chunk_tensor(np_tensor, strategy, depth):
+def _get_slice_index(shape, dev_mat, tensor_map, rank_index):
     """
-    Recursive function to chunk tensor.
+    Get the index of the tensor slice on a device, which selects the slice from the whole tensor as a view.
 
     Args:
-        np_tensor (NDarray): The matrix to be split.
-        strategy (list): The split strategy with the same size of np_tensor.
-        depth (int): Recursion depth.
+        shape (list): The shape of the whole tensor.
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+        rank_index (int): The rank of the device.
 
     Returns:
-        NDarray, the splited matrix.
+        Tuple of slice, one for each dimension.
 
-    Raises:
-        ValueError: If np_tensor can not be split by strategy.
+    Examples:
+        >>> index = _get_slice_index([32, 16], [2, 4], [1, -1], 5)
+        >>> # index is (slice(16, 32), slice(0, 16))
     """
-    output = []
-    axis = len(np_tensor.shape) - depth
-    if np_tensor.shape[axis] % strategy[0] != 0:
-        raise ValueError("np_tensor can not be split by strategy!")
-    ret = list(np.split(np_tensor, strategy[0], axis))
-    if depth == 1:
-        return ret
-    for ret_ in ret:
-        output.extend(
-            _chunk_tensor(ret_, strategy[len(strategy) - depth + 1:len(strategy)], depth - 1))
+    offset, slice_shape = _get_slice_region(shape, dev_mat, tensor_map, rank_index)
+    return tuple(slice(start, start + size) for start, size in zip(offset, slice_shape))
 
-    return output
 
-
-def _chunk_tensor_by_strategy(np_tensor, strategy):
+def _get_tensor_slice(np_tensor, dev_mat, tensor_map, rank_index):
     """
-    Split the input by strategy.
+    Get the slice of the whole tensor on a device, which is a view of the whole tensor without copying it.
 
     Args:
-        np_tensor (NDarray): The matrix to be split.
-        strategy (list): The split strategy with the same size of np_tensor.
+        np_tensor (NDarray): The whole tensor.
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+        rank_index (int): The rank of the device.
 
     Returns:
-        NDarray, the splited matrix.
+        NDarray, the view of the tensor slice.
 
     Raises:
-        TypeError: If np_tensor is not ndarray
-        ValueError: If the length of np_tensor does not match the length of strategy.
+        ValueError: If the tensor can not be split by the layout.
+    """
+    return np_tensor[_get_slice_index(np_tensor.shape, dev_mat, tensor_map, rank_index)]
+
+
+def _merge_tensor_slices(tensor_slices, dev_mat, tensor_map):
+    """
+    Assemble the whole tensor from the tensor slices of all the devices.
+
+    The whole tensor is allocated once, and the slice of each device is written into its region of the tensor,
+    the duplicated slices of the devices holding the same slice are written once.
+
+    Args:
+        tensor_slices (list[NDarray]): The tensor slice of each device, ordered by the rank.
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+
+    Returns:
+        NDarray, the whole tensor.
     """
-    if not isinstance(np_tensor, np.ndarray):
-        raise TypeError("np_tensor should be ndarray!")
-    if len(strategy) != len(np_tensor.shape):
-        raise ValueError("The length of np_tensor does not match the length of strategy!")
-    return _chunk_tensor(np_tensor, strategy, len(strategy))
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    slice_shape = tensor_slices[0].shape
+    shape = [dim * split for dim, split in zip(slice_shape, tensor_strategy)]
+    np_tensor = np.empty(shape, tensor_slices[0].dtype)
+    for rank_index, tensor_slice in enumerate(tensor_slices):
+        if _is_first_replica(dev_mat, tensor_map, rank_index):
+            np_tensor[_get_slice_index(shape, dev_mat, tensor_map, rank_index)] = tensor_slice
+    return np_tensor
 
 
 def _load_tensor(tensor, dev_mat, tensor_map):
@@ -188,11 +202,7 @@ def _load_tensor(tensor, dev_mat, tensor_map):
         >>> tensor_slice = _load_tensor(tensor, dev_mat, tensor_map)
     """
     rank = get_rank()
-    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
-    tensor_slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, rank)
-    np_tensor = tensor.asnumpy()
-    np_tensor_list = _chunk_tensor_by_strategy(np_tensor, tensor_strategy)
-    np_tensor_slice = np_tensor_list[int(tensor_slice_index)]
+    np_tensor_slice = _get_tensor_slice(tensor.asnumpy(), dev_mat, tensor_map, rank)
     tensor_slice = Tensor(np_tensor_slice)
     return tensor_slice
 
@@ -247,31 +257,4 @@ def _reshape_param_data(param_data, dev_mat, tensor_map):
         device_count *= dim
 
     tensor_slices = np.split(param_data.asnumpy(), device_count, axis=0)
-    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
-
-    # get the actual number of slices,as: different devices may load the same slice
-    slice_count = 1
-    for dim in tensor_strategy:
-        slice_count *= dim
-
-    # reorder slices and remove duplicates based on device matrix and tensor_map
-    tensor_slices_new = list(range(slice_count))
-    for i in range(device_count):
-        slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, i)
-        tensor_slices_new[int(slice_index)] = np.array(tensor_slices[i])
-
-    # combine slices to generate complete parameter
-    dim_len = len(tensor_strategy)
-    for i in range(dim_len):
-        ele_count = int(len(tensor_slices_new) / tensor_strategy[dim_len - 1 - i])
-        tensor_slices_new_inner = []
-        for j in range(ele_count):
-            new_tensor = tensor_slices_new[j * tensor_strategy[dim_len - 1 - i]]
-            for l in range(j * tensor_strategy[dim_len - 1 - i] + 1,
-                           (j + 1) * tensor_strategy[dim_len - 1 - i]):
-                new_tensor = np.concatenate((new_tensor, tensor_slices_new[l]), axis=dim_len - 1 - i)
-
-            tensor_slices_new_inner.insert(len(tensor_slices_new_inner), np.array(new_tensor))
-        tensor_slices_new = tensor_slices_new_inner
-
-    return Tensor(tensor_slices_new[0])
+    return Tensor(_merge_tensor_slices(tensor_slices, dev_mat, tensor_map))
@@ -143,8 +143,44 @@ def _to_tensor(elem, scaling_sens=None):
     return lst[0] if len(lst) == 1 else tuple(lst)
 
 
-def _to_full_tensor(elem, device_num, global_rank, scaling_sens=None):
-    """Conver numpy to tensor, expanding batch dimension according to device_num, adapt to minddata feed solution."""
+class _StagingBufferPool:
+    """
+    Host buffers of the full tensors in the parallel feed mode, allocated once and reused in the following steps.
+
+    The buffers are keyed by the position of the input, the dtype and the full shape, and the buffers of a key are
+    used in turn, so a full tensor is not overwritten until `depth` more batches are converted. Only the slice of
+    the local rank is rewritten in each step, the other slices keep the data they are allocated with.
+
+    Args:
+        depth (int): Number of the buffers of a key, it should be larger than the number of the converted batches
+            alive at the same time.
+        zero_fill (bool): Whether the buffers are filled with zeros when allocated. If False, the slices of the
+            other ranks are undefined, which is only valid if the network reads the local slice only. Default: True.
+    """
+    def __init__(self, depth, zero_fill=True):
+        self.depth = depth
+        self.zero_fill = zero_fill
+        self._buffers = {}
+        self._next_index = {}
+
+    def get(self, position, dtype, shape):
+        """Get the next buffer of the input at the position."""
+        key = (position, np.dtype(dtype), tuple(shape))
+        buffers = self._buffers.setdefault(key, [])
+        index = self._next_index.get(key, 0)
+        if index == len(buffers):
+            alloc = np.zeros if self.zero_fill else np.empty
+            buffers.append(alloc(key[2], key[1]))
+        self._next_index[key] = (index + 1) % self.depth
+        return buffers[index]
+
+
+def _to_full_tensor(elem, device_num, global_rank, scaling_sens=None, buffer_pool=None):
+    """
+    Conver numpy to tensor, expanding batch dimension according to device_num, adapt to minddata feed solution.
+
+    If buffer_pool is given, the full tensors share the reused buffers of the pool instead of new zero arrays.
+    """
     lst = []
     if not isinstance(elem, (tuple, list)):
         elem = [elem]
@@ -152,24 +188,19 @@ def _to_full_tensor(elem, device_num, global_rank, scaling_sens=None):
         raise ValueError("The global rank must be smaller than device number, the global rank is {}, "
                          "the device num is {}".format(global_rank, device_num))
 
-    for data in elem:
-        if isinstance(data, np.ndarray):
-            data = Tensor(data)
-        if not isinstance(data, Tensor):
+    for position, data in enumerate(elem):
+        if isinstance(data, Tensor):
+            data = data.asnumpy()
+        if not isinstance(data, np.ndarray):
             raise ValueError("elements in tensors must be Tensor")
-        shape_ = data.shape()
-        type_ = data.dtype()
-        new_shape = ()
-        batchsize_per_device = 1
-        for i, item in enumerate(shape_):
-            if i == 0:
-                new_shape += (item * device_num,)
-                batchsize_per_device = item
-            else:
-                new_shape += (item,)
-        new_tensor_numpy = np.zeros(new_shape, dtype_to_nptype(type_))
+        batchsize_per_device = data.shape[0] if data.shape else 1
+        new_shape = (batchsize_per_device * device_num,) + data.shape[1:]
+        if buffer_pool is None:
+            new_tensor_numpy = np.zeros(new_shape, data.dtype)
+        else:
+            new_tensor_numpy = buffer_pool.get(position, data.dtype, new_shape)
         start = global_rank * batchsize_per_device
-        new_tensor_numpy[start: start + batchsize_per_device] = data.asnumpy()
+        new_tensor_numpy[start: start + batchsize_per_device] = data
         new_tensor = Tensor(new_tensor_numpy)
         lst.append(new_tensor)
     if scaling_sens:
@@ -18,13 +18,16 @@ import os
 import stat
 import shutil
 import time
+import queue
+import threading
 import numpy as np
 
 import mindspore.context as context
-from mindspore.train.serialization import _exec_save_checkpoint, _fill_param_into_net, _save_graph
+from mindspore.train.serialization import _exec_save_checkpoint, _fill_param_into_net, _save_graph, \
+    _get_checkpoint_param_list, save_checkpoint, _get_rank_info, _get_sharded_param_list, _save_sharded_checkpoint
 from mindspore.train._utils import _make_directory
 from mindspore import log as logger
-from mindspore._checkparam import check_int_non_negative
+from mindspore._checkparam import check_int_non_negative, check_int_positive, check_bool
 from mindspore.common.tensor import Tensor
 from .summary.summary_record import _cache_summary_tensor_data
 
@@ -150,6 +153,14 @@ class CheckpointConfig:
         keep_checkpoint_max (int): Maximum step to save checkpoint. Default: 5.
         keep_checkpoint_per_n_minutes (int): Keep one checkpoint every n minutes. Default: 0.
             Can't be used with keep_checkpoint_max at the same time.
+        async_save (bool): Whether to save the checkpoint asynchronously. If True, a host snapshot of the
+            parameters is taken in the training thread and the serialization and disk writing are done in a
+            background thread. Default: False.
+        max_pending_saves (int): Maximum number of asynchronous saves in flight, the training is blocked when
+            the limit is reached. Default: 1.
+        sharded (bool): Whether to save a sharded checkpoint in model parallel. If True, each device saves only
+            its local slices to its own file without all-gather, the files of all devices are loaded by
+            load_sharded_checkpoint. Default: False.
 
     Raises:
         ValueError: If the input_param is None or 0.
@@ -163,7 +174,10 @@ class CheckpointConfig:
                  save_checkpoint_steps=1,
                  save_checkpoint_seconds=0,
                  keep_checkpoint_max=5,
-                 keep_checkpoint_per_n_minutes=0):
+                 keep_checkpoint_per_n_minutes=0,
+                 async_save=False,
+                 max_pending_saves=1,
+                 sharded=False):
 
         if not save_checkpoint_steps and not save_checkpoint_seconds and \
                 not keep_checkpoint_max and not keep_checkpoint_per_n_minutes:
@@ -191,6 +205,10 @@ class CheckpointConfig:
             if not self._keep_checkpoint_per_n_minutes or self._keep_checkpoint_per_n_minutes == 0:
                 self._keep_checkpoint_max = 1
 
+        self._async_save = check_bool(async_save)
+        self._max_pending_saves = check_int_positive(max_pending_saves)
+        self._sharded = check_bool(sharded)
+
     @property
     def save_checkpoint_steps(self):
         """Get the value of _save_checkpoint_steps."""
@@ -211,16 +229,85 @@ class CheckpointConfig:
         """Get the value of _keep_checkpoint_per_n_minutes."""
         return self._keep_checkpoint_per_n_minutes
 
+    @property
+    def async_save(self):
+        """Get the value of _async_save."""
+        return self._async_save
+
+    @property
+    def max_pending_saves(self):
+        """Get the value of _max_pending_saves."""
+        return self._max_pending_saves
+
+    @property
+    def sharded(self):
+        """Get the value of _sharded."""
+        return self._sharded
+
     def get_checkpoint_policy(self):
         """Get the policy of checkpoint."""
         checkpoint_policy = {'save_checkpoint_steps': self._save_checkpoint_steps,
                              'save_checkpoint_seconds': self._save_checkpoint_seconds,
                              'keep_checkpoint_max': self._keep_checkpoint_max,
-                             'keep_checkpoint_per_n_minutes': self._keep_checkpoint_per_n_minutes}
+                             'keep_checkpoint_per_n_minutes': self._keep_checkpoint_per_n_minutes,
+                             'async_save': self._async_save,
+                             'max_pending_saves': self._max_pending_saves,
+                             'sharded': self._sharded}
 
         return checkpoint_policy
 
 
+class _AsyncCheckpointWriter:
+    """
+    Run the checkpoint saving tasks one by one in a background thread.
+
+    Args:
+        max_pending (int): Maximum number of tasks in flight, `reserve` is blocked when the limit is reached.
+    """
+    def __init__(self, max_pending):
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def reserve(self):
+        """Wait for a free slot before taking the snapshot of the next task."""
+        self._pending.acquire()
+
+    def submit(self, task, *args):
+        """Submit a task to the background thread, a slot must be reserved before."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="AsyncCheckpointWriter")
+            self._thread.daemon = True
+            self._thread.start()
+        self._queue.put((task, args))
+
+    def wait(self):
+        """Wait until all the submitted tasks are finished."""
+        self._queue.join()
+
+    def close(self):
+        """Finish all the submitted tasks and stop the background thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            task, args = item
+            try:
+                task(*args)
+            except Exception as e:
+                logger.error("Failed to save the checkpoint asynchronously, error: %r", e)
+            finally:
+                self._pending.release()
+                self._queue.task_done()
+
+
 def _set_cur_net(net):
     """
     Set current net for which we are using to save checkpoint.
@@ -539,6 +626,10 @@ class ModelCheckpoint(Callback):
         self._manager = _CheckpointManager()
         self._prefix = _chg_ckpt_file_name_if_same_exist(self._directory, self._prefix)
         self._graph_saved = False
+        self._async_writer = _AsyncCheckpointWriter(self._config.max_pending_saves) \
+            if self._config.async_save else None
+        self._save_statistics = []
+        self._rank_info = None
 
     def step_end(self, run_context):
         """
@@ -565,6 +656,8 @@ class ModelCheckpoint(Callback):
         cb_params = run_context.original_args()
         _to_save_last_ckpt = True
         self._save_ckpt(cb_params, _to_save_last_ckpt)
+        if self._async_writer is not None:
+            self._async_writer.close()
 
         from mindspore.parallel._cell_wrapper import destroy_allgather_cell
         destroy_allgather_cell()
@@ -583,6 +676,52 @@ class ModelCheckpoint(Callback):
 
         return False
 
+    def _remove_outdated_ckpt(self):
+        """Remove the checkpoint files according to the keep policy before the new one is added."""
+        # update checkpoint file list.
+        self._manager.update_ckpoint_filelist(self._directory, self._prefix)
+        # keep checkpoint files number equal max number.
+        if self._config.keep_checkpoint_max and 0 < self._config.keep_checkpoint_max <= self._manager.ckpoint_num:
+            self._manager.remove_oldest_ckpoint_file()
+        elif self._config.keep_checkpoint_per_n_minutes and self._config.keep_checkpoint_per_n_minutes > 0:
+            self._cur_time_for_keep = time.time()
+            if (self._cur_time_for_keep - self._last_time_for_keep) \
+                    < self._config.keep_checkpoint_per_n_minutes * 60:
+                self._manager.keep_one_ckpoint_per_minutes(self._config.keep_checkpoint_per_n_minutes,
+                                                           self._cur_time_for_keep)
+        self._last_time_for_keep = time.time()
+
+    def _write_ckpt(self, param_list, gen_file, cur_file, stall_time):
+        """Write the snapshot of parameters to the checkpoint file, run in the background thread."""
+        write_start = time.time()
+        self._remove_outdated_ckpt()
+        self._save_param_list(param_list, gen_file)
+        if os.path.exists(gen_file):
+            shutil.move(gen_file, cur_file)
+        self._latest_ckpt_file_name = cur_file
+        self._record_save_time(cur_file, stall_time, time.time() - write_start)
+
+    def _get_param_list(self, train_network, snapshot=False):
+        """Get the parameters to save, only the local slices of this device for a sharded checkpoint."""
+        if self._config.sharded:
+            if self._rank_info is None:
+                self._rank_info = _get_rank_info(None, None)
+            return _get_sharded_param_list(train_network, self._rank_info[0], self._rank_info[1], snapshot)
+        return _get_checkpoint_param_list(train_network, snapshot)
+
+    def _save_param_list(self, param_list, gen_file):
+        """Save the parameters from _get_param_list to the checkpoint file."""
+        if self._config.sharded:
+            _save_sharded_checkpoint(param_list, gen_file, self._rank_info[0], self._rank_info[1])
+        else:
+            save_checkpoint(param_list, gen_file)
+
+    def _record_save_time(self, cur_file, stall_time, write_time):
+        """Record the time the training is stalled and the time of writing for one checkpoint."""
+        self._save_statistics.append({"file": cur_file, "stall_time": stall_time, "write_time": write_time})
+        logger.info("Save checkpoint %s, training stall time: %.3fs, write time: %.3fs.",
+                    cur_file, stall_time, write_time)
+
     def _save_ckpt(self, cb_params, force_to_save=False):
         """Save checkpoint files."""
         if cb_params.cur_step_num == self._last_triggered_step:
@@ -592,19 +731,9 @@ class ModelCheckpoint(Callback):
         step_num_in_epoch = (cb_params.cur_step_num - 1) % cb_params.batch_num + 1
 
         if save_ckpt:
+            stall_start = time.time()
             cur_ckpoint_file = self._prefix + "-" + str(cb_params.cur_epoch_num) + "_" \
                                + str(step_num_in_epoch) + ".ckpt"
-            # update checkpoint file list.
-            self._manager.update_ckpoint_filelist(self._directory, self._prefix)
-            # keep checkpoint files number equal max number.
-            if self._config.keep_checkpoint_max and 0 < self._config.keep_checkpoint_max <= self._manager.ckpoint_num:
-                self._manager.remove_oldest_ckpoint_file()
-            elif self._config.keep_checkpoint_per_n_minutes and self._config.keep_checkpoint_per_n_minutes > 0:
-                self._cur_time_for_keep = time.time()
-                if (self._cur_time_for_keep - self._last_time_for_keep) \
-                        < self._config.keep_checkpoint_per_n_minutes * 60:
-                    self._manager.keep_one_ckpoint_per_minutes(self._config.keep_checkpoint_per_n_minutes,
-                                                               self._cur_time_for_keep)
 
             # generate the new checkpoint file and rename it.
             global _save_dir
@@ -612,18 +741,47 @@ class ModelCheckpoint(Callback):
             cur_file = os.path.join(self._directory, cur_ckpoint_file)
             tmp_ckpt_file_name_for_cur_process = str(os.getpid()) + "-" + 'parameters.ckpt'
             gen_file = os.path.join(_save_dir, tmp_ckpt_file_name_for_cur_process)
-            self._last_time_for_keep = time.time()
             self._last_triggered_step = cb_params.cur_step_num
 
             if context.get_context("enable_ge"):
                 _set_cur_net(cb_params.train_network)
                 cb_params.train_network.exec_checkpoint_graph()
 
-            _exec_save_checkpoint(cb_params.train_network, gen_file)
+            if self._async_writer is not None:
+                # only the host snapshot is taken in the training thread
+                self._async_writer.reserve()
+                param_list = self._get_param_list(cb_params.train_network, snapshot=True)
+                self._async_writer.submit(self._write_ckpt, param_list, gen_file, cur_file,
+                                          time.time() - stall_start)
+                return
+
+            self._remove_outdated_ckpt()
+            if self._config.sharded:
+                self._save_param_list(self._get_param_list(cb_params.train_network), gen_file)
+            else:
+                _exec_save_checkpoint(cb_params.train_network, gen_file)
 
             if os.path.exists(gen_file):
                 shutil.move(gen_file, cur_file)
             self._latest_ckpt_file_name = cur_file
+            save_time = time.time() - stall_start
+            self._record_save_time(cur_file, save_time, save_time)
+
+    def wait_pending_saves(self):
+        """Wait until all the asynchronous checkpoint saves are finished."""
+        if self._async_writer is not None:
+            self._async_writer.wait()
+
+    @property
+    def save_statistics(self):
+        """
+        Get the time records of the saved checkpoints.
+
+        Returns:
+            list, each element is a dict like {"file": xx, "stall_time": xx, "write_time": xx}, the unit of time
+            is second.
+        """
+        return self._save_statistics
 
     @property
     def latest_ckpt_file_name(self):
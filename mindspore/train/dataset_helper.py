@@ -13,11 +13,16 @@
 # limitations under the License.
 # ============================================================================
 """Dataset help for minddata dataset"""
-from mindspore._checkparam import check_bool
+import queue
+import threading
+import time
+
+from mindspore._checkparam import check_bool, check_int_non_negative
+from mindspore._extends.utils import put_unless_stopped
 from .. import context
 from .parallel_utils import ParallelMode
 from ._utils import _exec_datagraph, _get_types_and_shapes, _to_tensor, \
-    _construct_tensor_list, _to_full_shapes, _to_full_tensor
+    _construct_tensor_list, _to_full_shapes, _to_full_tensor, _StagingBufferPool
 from ..nn.wrap import GetNextSingleOp
 from ..parallel._utils import _get_device_num, _get_global_rank, _get_parallel_mode
 
@@ -31,23 +36,36 @@ class DatasetHelper:
     Note:
         The iter of DatasetHelper will give one epoch data.
 
+        When the data is fed from host in semi auto parallel or auto parallel mode, the full batch tensors share
+        recycled staging buffers, and each buffer is overwritten by the batch prefetch_size + 2 iterations later.
+        Copy the inputs, e.g. by `Tensor(inputs[0].asnumpy().copy())`, if they are kept across the iterations.
+
     Args:
         dataset (DataSet): The dataset.
         dataset_sink_mode (bool): If true use GetNext to fetch the data, or else feed the data from host.
             Default: True.
+        prefetch_size (int): Number of batches converted to tensors ahead by a background thread when the data
+            is fed from host, 0 means converting each batch when it is fetched. Default: 2.
+        zero_fill (bool): Whether the slices of the other devices in the full batch tensors are zeros when the
+            data is fed from host in semi auto parallel or auto parallel mode. If False, they are undefined, which
+            is only valid if the network reads the local slice of the batch only. Default: True.
 
     Examples:
         >>> dataset_helper = DatasetHelper(dataset)
         >>> for inputs in dataset_helper:
         >>>     outputs = network(*inputs)
     """
-    def __init__(self, dataset, dataset_sink_mode=True):
+    def __init__(self, dataset, dataset_sink_mode=True, prefetch_size=2, zero_fill=True):
         check_bool(dataset_sink_mode)
+        check_int_non_negative(prefetch_size)
+        check_bool(zero_fill)
 
-        iterclass = _DatasetIterGE
         if not dataset_sink_mode:
-            iterclass = _DatasetIterFeed
-        elif not context.get_context("enable_ge"):
+            self.iter = _DatasetIterFeed(dataset, prefetch_size, zero_fill)
+            return
+
+        iterclass = _DatasetIterGE
+        if not context.get_context("enable_ge"):
             if context.get_context("enable_loop_sink"):
                 iterclass = _DatasetIterMSLoopSink
             else:
@@ -67,6 +85,14 @@ class DatasetHelper:
         """Get loop_size for every iteration."""
         return self.iter.loop_size
 
+    def data_wait_time(self):
+        """Get the seconds waited for the data of the last iteration, 0 if the data is not fed from host."""
+        return self.iter.data_wait_time
+
+    def stop(self):
+        """Stop the background reading of the data, the helper is not iterated anymore after it is stopped."""
+        self.iter.stop()
+
 
 class _DatasetIter:
     """Base iter for dataset help"""
@@ -80,6 +106,7 @@ class _DatasetIter:
             dataset.__ME_INITED__ = _exec_datagraph(dataset, self.loop_size).queue_name
 
         self.ind = 0
+        self.data_wait_time = 0.0
         self.dataset = dataset
         dataset_types, dataset_shapes = _get_types_and_shapes(dataset)
         self.dataset_types, self.dataset_shapes = dataset_types, dataset_shapes
@@ -103,6 +130,9 @@ class _DatasetIter:
     def types_shapes(self):
         return self.dataset_types, self.dataset_shapes
 
+    def stop(self):
+        """Nothing is read in background when the data is sunk."""
+
     def get_loop_count(self, dataset):
         loop_count = 1
         if hasattr(dataset, '__loop_size__'):
@@ -152,9 +182,51 @@ class _DatasetIterGE(_DatasetIter):
         self.op = op
 
 
+class _BatchPrefetcher:
+    """
+    Convert the batches of a dataset iterator in a background thread, keeping some of them ready.
+
+    Args:
+        data_iter (Iterator): The iterator of the dataset.
+        convert (Function): Convert a batch to the inputs of the network.
+        batch_num (int): Number of batches read from the iterator.
+        prefetch_size (int): Number of converted batches kept ready.
+    """
+    def __init__(self, data_iter, convert, batch_num, prefetch_size):
+        self._queue = queue.Queue(prefetch_size)
+        self._stop = threading.Event()
+        self._error = None
+        thread = threading.Thread(target=self._run, args=(data_iter, convert, batch_num))
+        thread.daemon = True
+        thread.start()
+
+    def _run(self, data_iter, convert, batch_num):
+        try:
+            for _ in range(batch_num):
+                if not put_unless_stopped(self._queue, (convert(data_iter.__next__()), None), self._stop):
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            # StopIteration of the dataset iterator is passed as well, it ends the epoch as it would do
+            put_unless_stopped(self._queue, (None, e), self._stop)
+
+    def get(self):
+        """Get the next converted batch, raises the error of reading or converting it."""
+        if self._error is not None:
+            raise self._error
+        data, error = self._queue.get()
+        if error is not None:
+            self._error = error
+            raise error
+        return data
+
+    def stop(self):
+        """Stop reading the batches."""
+        self._stop.set()
+
+
 class _DatasetIterFeed:
     """Iter for feed data"""
-    def __init__(self, dataset):
+    def __init__(self, dataset, prefetch_size=0, zero_fill=True):
         self.dataset = dataset
         self.device_num = _get_device_num()
         self.global_rank = _get_global_rank()
@@ -162,13 +234,25 @@ class _DatasetIterFeed:
         self.repeat_ind = 0
         self.loop_count = dataset.get_dataset_size()
         self.ind = 0
+        self.prefetch_size = prefetch_size
+        self.prefetcher = None
+        self.data_wait_time = 0.0
 
         parallel_mode = context.get_auto_parallel_context("parallel_mode")
         self.need_to_full = parallel_mode in (ParallelMode.SEMI_AUTO_PARALLEL, ParallelMode.AUTO_PARALLEL)
+        # a full tensor is kept until the network runs on it, after the batches queued by the prefetcher
+        self.buffer_pool = _StagingBufferPool(prefetch_size + 2, zero_fill) if self.need_to_full else None
 
     def __iter__(self):
         if self.repeat_ind % self.repeat_count == 0:
             self.iter = self.dataset.__iter__()
+            if self.prefetch_size > 0:
+                # the batches are prefetched across the epochs sharing the dataset iterator
+                if self.prefetcher is not None:
+                    self.prefetcher.stop()
+                epoch_num = self.repeat_count if self.repeat_count > 0 else 1
+                self.prefetcher = _BatchPrefetcher(self.iter, self._convert, epoch_num * self.loop_count,
+                                                   self.prefetch_size)
 
         self.repeat_ind += 1
         self.ind = 0
@@ -178,7 +262,21 @@ class _DatasetIterFeed:
         if self.ind >= self.loop_count:
             raise StopIteration()
         self.ind += 1
-        data = self.iter.__next__()
+        start = time.perf_counter()
+        try:
+            if self.prefetcher is not None:
+                return self.prefetcher.get()
+            return self._convert(self.iter.__next__())
+        finally:
+            self.data_wait_time = time.perf_counter() - start
+
+    def stop(self):
+        """Stop the prefetcher, its thread no longer holds the dataset iterator."""
+        if self.prefetcher is not None:
+            self.prefetcher.stop()
+            self.prefetcher = None
+
+    def _convert(self, data):
         if self.need_to_full:
-            return _to_full_tensor(data, self.device_num, self.global_rank)
+            return _to_full_tensor(data, self.device_num, self.global_rank, buffer_pool=self.buffer_pool)
         return _to_tensor(data)
@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """Loss scale manager abstract class."""
+import numpy as np
 from .._checkparam import ParamValidator as validator
 from .._checkparam import Rel
 from .. import nn
@@ -35,6 +36,10 @@ class LossScaleManager:
     def get_update_cell(self):
         """Get the loss scaling update logic cell."""
 
+    def get_overflow_check_steps(self):
+        """Get the number of steps whose overflow flags are checked together, 1 means checking every step."""
+        return 1
+
 class FixedLossScaleManager(LossScaleManager):
     """
     Fixed loss-scale manager.
@@ -85,6 +90,11 @@ class DynamicLossScaleManager(LossScaleManager):
         init_loss_scale (float): Init loss scale. Default: 2**24.
         scale_factor (int): Coefficient of increase and decrease. Default: 2.
         scale_window (int): Maximum continuous normal steps when there is no overflow. Default: 2000.
+        overflow_check_steps (int): Number of steps whose overflow flags are kept on device and checked together
+            when the data is fed from host. If it is larger than 1, the loss scale is updated on device by the
+            update cell, the same as in the dataset sink mode, and the manager catches up with it every
+            `overflow_check_steps` steps and at the end of each epoch, so the steps are not blocked by reading
+            the overflow flag. Default: 1.
 
     Examples:
         >>> loss_scale_manager = DynamicLossScaleManager()
@@ -93,7 +103,8 @@ class DynamicLossScaleManager(LossScaleManager):
     def __init__(self,
                  init_loss_scale=2 ** 24,
                  scale_factor=2,
-                 scale_window=2000):
+                 scale_window=2000,
+                 overflow_check_steps=1):
         if init_loss_scale < 1.0:
             raise ValueError("Loss scale value should be > 1")
         self.loss_scale = init_loss_scale
@@ -108,6 +119,9 @@ class DynamicLossScaleManager(LossScaleManager):
         self.last_overflow_iter = 0
         self.bad_step_max = 1000
         self.bad_step = 0
+        validator.check_integer("overflow_check_steps", overflow_check_steps, 0, Rel.GT)
+        self.overflow_check_steps = overflow_check_steps
+        self._overflow_flags = []
 
     def get_loss_scale(self):
         """Get loss scale value."""
@@ -138,6 +152,27 @@ class DynamicLossScaleManager(LossScaleManager):
         """Get the flag whether to drop optimizer update when there is overflow happened"""
         return True
 
+    def get_overflow_check_steps(self):
+        """Get the number of steps whose overflow flags are checked together, 1 means checking every step."""
+        return self.overflow_check_steps
+
+    def add_overflow(self, overflow):
+        """
+        Keep the overflow flag of a step, the kept flags are checked every `overflow_check_steps` steps.
+
+        Args:
+            overflow (Tensor): The overflow flag on device, which is not read until it is checked.
+        """
+        self._overflow_flags.append(overflow)
+        if len(self._overflow_flags) >= self.overflow_check_steps:
+            self.check_overflow()
+
+    def check_overflow(self):
+        """Read the kept overflow flags and update the loss scale with them in order."""
+        overflow_flags, self._overflow_flags = self._overflow_flags, []
+        for overflow in overflow_flags:
+            self.update_loss_scale(np.all(overflow.asnumpy()))
+
     def get_update_cell(self):
         "Returns the cell for `TrainOneStepWithLossScaleCell`"
         return nn.DynamicLossScaleUpdateCell(self.loss_scale, self.scale_factor, self.scale_window)
@@ -223,6 +223,8 @@ class Model:
         cb_params.device_number = self._device_number
         cb_params.train_dataset = train_dataset
         cb_params.list_callback = list_callback
+        # seconds the step waited for its data, the data is prefetched by a background thread in the feed mode
+        cb_params.data_wait_time = 0.0
 
         if dataset_sink_mode and context.get_context("mode") == context.GRAPH_MODE:
             self._train_dataset_sink_process(epoch, train_dataset, list_callback, cb_params)
@@ -297,6 +299,9 @@ class Model:
             cb_params (_InternalCallbackParam): Callback parameters. Default: None.
         """
         dataset_helper = DatasetHelper(train_dataset, dataset_sink_mode=False)
+        drop_overflow_update = self._loss_scale_manager and self._loss_scale_manager.get_drop_overflow_update()
+        # the loss scale is updated on device and the overflow flags are checked every several steps
+        defer_overflow_check = drop_overflow_update and self._loss_scale_manager.get_overflow_check_steps() > 1
         cb_params.cur_step_num = 0
         run_context = RunContext(cb_params)
         _callback_wrapper(list_callback, run_context, "begin")
@@ -314,16 +319,20 @@ class Model:
                     raise ValueError("when loss_fn is not None, train_dataset should"
                                      "return two elements, but got {}".format(len_element))
                 cb_params.cur_step_num += 1
+                cb_params.data_wait_time = dataset_helper.data_wait_time()
                 _callback_wrapper(list_callback, run_context, "step_begin")
 
                 overflow = False
-                if self._loss_scale_manager and self._loss_scale_manager.get_drop_overflow_update():
+                if drop_overflow_update and not defer_overflow_check:
                     scaling_sens = self._get_scaling_sens()
                     next_element = tuple(next_element) + (Tensor(scaling_sens, mstype.float32),)
 
                 outputs = self._train_network(*next_element)
                 cb_params.net_outputs = outputs
-                if self._loss_scale_manager and self._loss_scale_manager.get_drop_overflow_update():
+                if defer_overflow_check:
+                    _, overflow, _ = outputs
+                    self._loss_scale_manager.add_overflow(overflow)
+                elif drop_overflow_update:
                     _, overflow, _ = outputs
                     overflow = np.all(overflow.asnumpy())
                     self._loss_scale_manager.update_loss_scale(overflow)
@@ -334,12 +343,15 @@ class Model:
                     break
 
             train_dataset.reset()
+            if defer_overflow_check:
+                self._loss_scale_manager.check_overflow()
 
             _callback_wrapper(list_callback, run_context, "epoch_end")
             should_stop = should_stop or run_context.get_stop_requested()
             if should_stop:
                 break
 
+        dataset_helper.stop()
         _callback_wrapper(list_callback, run_context, "end")
 
     def train(self, epoch, train_dataset, callbacks=None, dataset_sink_mode=True):
@@ -452,12 +464,14 @@ class Model:
 
         dataset_helper = DatasetHelper(valid_dataset, dataset_sink_mode=False)
         for next_element in dataset_helper:
+            cb_params.data_wait_time = dataset_helper.data_wait_time()
             list_callback.step_begin(run_context)
             outputs = self._eval_network(*next_element)
             cb_params.net_outputs = outputs
             list_callback.step_end(run_context)
             self._update_metrics(outputs)
 
+        dataset_helper.stop()
         metrics = self._get_metrics()
         cb_params.metrics = metrics
         list_callback.end(run_context)
@@ -499,6 +513,7 @@ class Model:
         cb_params.batch_num = valid_dataset.get_dataset_size()
         cb_params.mode = "eval"
         cb_params.cur_step_num = 0
+        cb_params.data_wait_time = 0.0
 
         self._eval_network.set_train(mode=False)
         self._eval_network.phase = 'eval'
@@ -15,6 +15,8 @@
 """Model and parameters serialization."""
 import os
 import stat
+import json
+import struct
 import numpy as np
 
 import mindspore.nn as nn
@@ -24,11 +26,13 @@ from mindspore.train.checkpoint_pb2 import Checkpoint
 from mindspore.common.tensor import Tensor
 from mindspore.common.initializer import initializer
 from mindspore.common.parameter import Parameter
+from mindspore.common._lazy_tensor import LazyTensor
 from mindspore.common.api import _executor
 from mindspore.common import dtype as mstype
 from mindspore._checkparam import check_input_data
 
-__all__ = ["save_checkpoint", "load_checkpoint", "load_param_into_net", "export"]
+__all__ = ["save_checkpoint", "load_checkpoint", "load_param_into_net", "export", "save_sharded_checkpoint",
+           "load_sharded_checkpoint"]
 
 tensor_to_ms_type = {"Int8": mstype.int8, "Int16": mstype.int16, "Int32": mstype.int32, "Int64": mstype.int64,
                      "Float16": mstype.float16, "Float32": mstype.float32, "Float64": mstype.float64}
@@ -36,21 +40,37 @@ tensor_to_ms_type = {"Int8": mstype.int8, "Int16": mstype.int16, "Int32": mstype
 tensor_to_np_type = {"Int8": np.int8, "Int16": np.int16, "Int32": np.int32, "Int64": np.int64,
                      "Float16": np.float16, "Float32": np.float32, "Float64": np.float64}
 
+# the mmap checkpoint container:
+#   magic(8 bytes) | header length(uint64, little endian) | header(json) | padding | aligned raw tensor blobs
+_MMAP_CKPT_MAGIC = b"MSCKPT01"
+_MMAP_CKPT_VERSION = 1
+_MMAP_CKPT_ALIGNMENT = 64
+_MMAP_CKPT_PREFIX = struct.Struct("<8sQ")
+_CKPT_FORMATS = ("protobuf", "mmap")
 
-def _special_process_par(par, new_par):
+
+def _is_special_shape(par_shape, new_par_shape):
     """
-    Processes the special condition.
+    Checks the special condition.
 
     Like (12,2048,1,1)->(12,2048), this case is caused by GE 4 dimensions tensor.
     """
-    par_shape_len = len(par.data.shape())
-    new_par_shape_len = len(new_par.data.shape())
-    delta_len = new_par_shape_len - par_shape_len
+    par_shape_len = len(par_shape)
+    delta_len = len(new_par_shape) - par_shape_len
     delta_i = 0
     for delta_i in range(delta_len):
-        if new_par.data.shape()[par_shape_len + delta_i] != 1:
+        if new_par_shape[par_shape_len + delta_i] != 1:
             break
-    if delta_i == delta_len - 1:
+    return delta_i == delta_len - 1
+
+
+def _special_process_par(par, new_par):
+    """
+    Processes the special condition.
+
+    Like (12,2048,1,1)->(12,2048), this case is caused by GE 4 dimensions tensor.
+    """
+    if _is_special_shape(par.data.shape(), new_par.data.shape()):
         new_val = new_par.data.asnumpy()
         new_val = new_val.reshape(par.data.shape())
         par.set_parameter_data(Tensor(new_val, par.data.dtype()))
@@ -59,45 +79,156 @@ def _special_process_par(par, new_par):
 
 
 def _update_param(param, new_param):
-    """Updates param's data from new_param's data."""
+    """Updates param's data from new_param's data, new_param must have been checked by _check_param."""
 
-    if isinstance(param.data, Tensor) and isinstance(new_param.data, Tensor):
-        if param.data.dtype() != new_param.data.dtype():
-            logger.error("Failed to combine the net and the parameters for param %s.", param.name)
-            msg = ("Net parameters {} type({}) different from parameter_dict's({})"
-                   .format(param.name, param.data.dtype(), new_param.data.dtype()))
-            raise RuntimeError(msg)
+    if param.is_lazy and isinstance(new_param.lazy_data, (Tensor, LazyTensor)) and \
+            param.lazy_data.shape() == new_param.lazy_data.shape():
+        # replace the data before it is generated, so the initialization is skipped
+        param.set_parameter_data(new_param.lazy_data)
+        return
 
+    if isinstance(param.data, Tensor) and isinstance(new_param.data, Tensor):
         if param.data.shape() != new_param.data.shape():
-            if not _special_process_par(param, new_param):
-                logger.error("Failed to combine the net and the parameters for param %s.", param.name)
-                msg = ("Net parameters {} shape({}) different from parameter_dict's({})"
-                       .format(param.name, param.data.shape(), new_param.data.shape()))
-                raise RuntimeError(msg)
+            _special_process_par(param, new_param)
             return
-
         param.set_parameter_data(new_param.data)
-        return
-
-    if isinstance(param.data, Tensor) and not isinstance(new_param.data, Tensor):
-        if param.data.shape() != (1,) and param.data.shape() != ():
-            logger.error("Failed to combine the net and the parameters for param %s.", param.name)
-            msg = ("Net parameters {} shape({}) is not (1,), inconsitent with parameter_dict's(scalar)."
-                   .format(param.name, param.data.shape()))
-            raise RuntimeError(msg)
+    elif isinstance(param.data, Tensor):
         param.set_parameter_data(initializer(new_param.data, param.data.shape(), param.data.dtype()))
-
-    elif isinstance(new_param.data, Tensor) and not isinstance(param.data, Tensor):
-        logger.error("Failed to combine the net and the parameters for param %s.", param.name)
-        msg = ("Net parameters {} type({}) different from parameter_dict's({})"
-               .format(param.name, type(param.data), type(new_param.data)))
-        raise RuntimeError(msg)
-
     else:
         param.set_parameter_data(type(param.data)(new_param.data))
 
 
-def save_checkpoint(parameter_list, ckpoint_file_name):
+def _check_param(param, new_param):
+    """
+    Checks whether new_param can be loaded into param, without materializing their data.
+
+    Returns:
+        str, the error message, None if it can be loaded.
+    """
+    data, new_data = param.lazy_data, new_param.lazy_data
+    is_tensor = isinstance(data, (Tensor, LazyTensor))
+    new_is_tensor = isinstance(new_data, (Tensor, LazyTensor))
+    if is_tensor and new_is_tensor:
+        if data.dtype() != new_data.dtype():
+            return ("Net parameters {} type({}) different from parameter_dict's({})"
+                    .format(param.name, data.dtype(), new_data.dtype()))
+        if data.shape() != new_data.shape() and not _is_special_shape(data.shape(), new_data.shape()):
+            return ("Net parameters {} shape({}) different from parameter_dict's({})"
+                    .format(param.name, data.shape(), new_data.shape()))
+    elif is_tensor:
+        if data.shape() != (1,) and data.shape() != ():
+            return ("Net parameters {} shape({}) is not (1,), inconsitent with parameter_dict's(scalar)."
+                    .format(param.name, data.shape()))
+    elif new_is_tensor:
+        return ("Net parameters {} type({}) different from parameter_dict's({})"
+                .format(param.name, type(data), type(new_data)))
+    return None
+
+
+def _copy_param_data(param, new_param):
+    """
+    Copies new_param's data into the tensor of param in place.
+
+    Returns:
+        bool, False if the data can not be copied in place, e.g. param's data is not generated yet.
+    """
+    tensor, new_tensor = param.lazy_data, new_param.lazy_data
+    if not isinstance(tensor, Tensor) or not isinstance(new_tensor, (Tensor, LazyTensor)) or \
+            tensor.dtype() != new_tensor.dtype() or tensor.shape() != new_tensor.shape():
+        return False
+    if isinstance(new_tensor, LazyTensor):
+        new_tensor = new_tensor.to_tensor()
+    return _copy_array_data(param, new_tensor.asnumpy())
+
+
+def _copy_array_data(param, new_data):
+    """
+    Copies the numpy array into the tensor of param in place.
+
+    Returns:
+        bool, False if the data can not be copied in place, e.g. the dtype or shape does not match.
+    """
+    tensor = param.lazy_data
+    if not isinstance(tensor, Tensor) or tensor.shape() != new_data.shape:
+        return False
+    data = tensor.asnumpy()
+    if not data.flags.writeable or data.dtype != new_data.dtype:
+        return False
+    np.copyto(data, new_data)
+    tensor.set_dirty()
+    return True
+
+
+def _align(offset):
+    """Rounds the offset up to the alignment of the mmap checkpoint."""
+    return (offset + _MMAP_CKPT_ALIGNMENT - 1) // _MMAP_CKPT_ALIGNMENT * _MMAP_CKPT_ALIGNMENT
+
+
+def _save_pb_checkpoint(parameter_list, ckpoint_file_name):
+    """Saves the parameters to a protobuf checkpoint file."""
+    checkpoint_list = Checkpoint()
+
+    for param in parameter_list:
+        param_value = checkpoint_list.value.add()
+        param_value.tag = param["name"]
+        param_tensor = param_value.tensor
+        param_data = param["data"].asnumpy().reshape(-1)
+        param_tensor.tensor_content = param_data.tostring()
+        param_tensor.tensor_type = str(param["data"].dtype())
+
+        if param['data'].shape() == ():
+            param_tensor.dims.append(0)
+        else:
+            for dim in param['data'].shape():
+                param_tensor.dims.append(dim)
+
+    with open(ckpoint_file_name, "wb") as f:
+        f.write(checkpoint_list.SerializeToString())
+
+
+def _save_mmap_checkpoint(parameter_list, ckpoint_file_name, shard=None):
+    """
+    Saves the parameters to a mmap checkpoint file.
+
+    The header is built from the shapes and types only, then the tensors are converted and written one by one,
+    so at most one tensor is held on the host at the same time.
+
+    For a shard of a sharded checkpoint, the shard information is added to the header, and each parameter
+    carries its "slice", the shape of the whole tensor and the offset of the slice in it.
+    """
+    index = []
+    offset = 0
+    for param in parameter_list:
+        tensor_type = str(param["data"].dtype())
+        shape = list(param["data"].shape())
+        nbytes = int(np.prod(shape)) * np.dtype(tensor_to_np_type[tensor_type]).itemsize
+        item = {"name": param["name"], "type": tensor_type, "shape": shape, "offset": offset, "nbytes": nbytes}
+        if "slice" in param:
+            item["slice"] = param["slice"]
+        index.append(item)
+        offset = _align(offset + nbytes)
+
+    header_dict = {"version": _MMAP_CKPT_VERSION, "alignment": _MMAP_CKPT_ALIGNMENT, "params": index}
+    if shard is not None:
+        header_dict["shard"] = shard
+    header = json.dumps(header_dict).encode("utf-8")
+    data_start = _align(_MMAP_CKPT_PREFIX.size + len(header))
+
+    with open(ckpoint_file_name, "wb") as f:
+        f.write(_MMAP_CKPT_PREFIX.pack(_MMAP_CKPT_MAGIC, len(header)))
+        f.write(header)
+        for param, item in zip(parameter_list, index):
+            f.seek(data_start + item["offset"])
+            param_data = np.ascontiguousarray(param["data"].asnumpy())
+            if param_data.nbytes != item["nbytes"]:
+                raise ValueError("The data size of parameter {} is {}, but {} is expected by its shape."
+                                 .format(item["name"], param_data.nbytes, item["nbytes"]))
+            f.write(memoryview(param_data).cast("B"))
+        # make the file cover the padding of the last tensor
+        f.truncate(data_start + offset)
+
+
+def save_checkpoint(parameter_list, ckpoint_file_name, ckpt_format="protobuf"):
     """
     Saves checkpoint info to a specified file.
 
@@ -105,30 +236,24 @@ def save_checkpoint(parameter_list, ckpoint_file_name):
         parameter_list (list): Parameters list, each element is a dict
                                like {"name":xx, "type":xx, "shape":xx, "data":xx}.
         ckpoint_file_name (str): Checkpoint file name.
+        ckpt_format (str): The format of the checkpoint file, "protobuf" or "mmap". The "mmap" format is a small
+            header index followed by aligned raw tensor data, it is written one tensor at a time and can be
+            loaded lazily by memory map. Default: "protobuf".
 
     Raises:
+        ValueError: The ckpt_format is not supported.
         RuntimeError: Failed to save the Checkpoint file.
     """
+    if ckpt_format not in _CKPT_FORMATS:
+        raise ValueError("The ckpt_format should be one of {}, but got {}.".format(_CKPT_FORMATS, ckpt_format))
+
     logger.info("Execute save checkpoint process.")
-    checkpoint_list = Checkpoint()
 
     try:
-        for param in parameter_list:
-            param_value = checkpoint_list.value.add()
-            param_value.tag = param["name"]
-            param_tensor = param_value.tensor
-            param_data = param["data"].asnumpy().reshape(-1)
-            param_tensor.tensor_content = param_data.tostring()
-            param_tensor.tensor_type = str(param["data"].dtype())
-
-            if param['data'].shape() == ():
-                param_tensor.dims.append(0)
-            else:
-                for dim in param['data'].shape():
-                    param_tensor.dims.append(dim)
-
-        with open(ckpoint_file_name, "wb") as f:
-            f.write(checkpoint_list.SerializeToString())
+        if ckpt_format == "mmap":
+            _save_mmap_checkpoint(parameter_list, ckpoint_file_name)
+        else:
+            _save_pb_checkpoint(parameter_list, ckpoint_file_name)
         os.chmod(ckpoint_file_name, stat.S_IRUSR)
 
     except BaseException as e:
@@ -137,10 +262,72 @@ def save_checkpoint(parameter_list, ckpoint_file_name):
     logger.info("Save checkpoint process finish.")
 
 
+class _MmapCheckpointTensor(LazyTensor):
+    """
+    The tensor data in a mmap checkpoint file, it is read from the memory map when materialized.
+
+    Args:
+        file_map (numpy.memmap): The copy-on-write memory map of the whole checkpoint file.
+        offset (int): The offset of the tensor data in the file.
+        shape (tuple): The shape of the tensor.
+        tensor_type (str): The type name of the tensor in the checkpoint file.
+    """
+    def __init__(self, file_map, offset, shape, tensor_type):
+        super(_MmapCheckpointTensor, self).__init__(shape, tensor_to_ms_type[tensor_type])
+        self._file_map = file_map
+        self._offset = offset
+        self._np_type = tensor_to_np_type[tensor_type]
+
+    def to_tensor(self):
+        count = int(np.prod(self._shape))
+        param_data = np.frombuffer(self._file_map, self._np_type, count, self._offset).reshape(self._shape)
+        return Tensor(param_data, self._dtype)
+
+
+def _is_mmap_checkpoint(ckpoint_file_name):
+    """Checks whether the checkpoint file is in the mmap format."""
+    with open(ckpoint_file_name, "rb") as f:
+        return f.read(len(_MMAP_CKPT_MAGIC)) == _MMAP_CKPT_MAGIC
+
+
+def _read_mmap_checkpoint_header(ckpoint_file_name):
+    """Reads the header of the mmap checkpoint file, returns the header and the offset of the tensor data."""
+    with open(ckpoint_file_name, "rb") as f:
+        _, header_len = _MMAP_CKPT_PREFIX.unpack(f.read(_MMAP_CKPT_PREFIX.size))
+        header = json.loads(f.read(header_len).decode("utf-8"))
+    if header.get("version") != _MMAP_CKPT_VERSION:
+        raise ValueError("The mmap checkpoint version {} is not supported.".format(header.get("version")))
+    return header, _align(_MMAP_CKPT_PREFIX.size + header_len)
+
+
+def _load_mmap_checkpoint(ckpoint_file_name):
+    """Loads the mmap checkpoint file, the tensors are returned as lazy parameters."""
+    header, data_start = _read_mmap_checkpoint_header(ckpoint_file_name)
+    if "shard" in header:
+        raise ValueError("The checkpoint file {} is a shard of a sharded checkpoint, please load it with "
+                         "load_sharded_checkpoint.".format(ckpoint_file_name))
+    file_map = np.memmap(ckpoint_file_name, dtype=np.uint8, mode="c")
+
+    parameter_dict = {}
+    for item in header["params"]:
+        name = item["name"]
+        shape = tuple(item["shape"])
+        tensor = _MmapCheckpointTensor(file_map, data_start + item["offset"], shape, item["type"])
+        if shape in [(), (1,)]:
+            # keep the same scalar behavior as the protobuf checkpoint
+            parameter_dict[name] = Parameter(tensor.to_tensor().asnumpy().reshape(-1)[0], name=name)
+        else:
+            parameter_dict[name] = Parameter(tensor, name=name)
+    return parameter_dict
+
+
 def load_checkpoint(ckpoint_file_name, net=None):
     """
     Loads checkpoint info from a specified file.
 
+    Both the protobuf and the mmap checkpoint files are supported. The parameters in a mmap checkpoint file are
+    lazy, their data is only read from the file when it is used.
+
     Args:
         ckpoint_file_name (str): Checkpoint file name.
         net (Cell): Cell network. Default: None
@@ -161,8 +348,20 @@ def load_checkpoint(ckpoint_file_name, net=None):
         raise ValueError("The checkpoint file may be empty, please make sure enter the correct file name.")
 
     logger.info("Execute load checkpoint process.")
-    checkpoint_list = Checkpoint()
 
+    if _is_mmap_checkpoint(ckpoint_file_name):
+        try:
+            parameter_dict = _load_mmap_checkpoint(ckpoint_file_name)
+            logger.info("Load checkpoint process finish.")
+        except BaseException as e:
+            logger.error("Failed to load the checkpoint file %s.", ckpoint_file_name)
+            raise ValueError(e.__str__())
+
+        if net:
+            load_param_into_net(net, parameter_dict)
+        return parameter_dict
+
+    checkpoint_list = Checkpoint()
     try:
         with open(ckpoint_file_name, "rb") as f:
             pb_content = f.read()
@@ -203,16 +402,27 @@ def load_checkpoint(ckpoint_file_name, net=None):
     return parameter_dict
 
 
-def load_param_into_net(net, parameter_dict):
+def load_param_into_net(net, parameter_dict, strict=False):
     """
     Loads parameters into network.
 
+    The parameters are matched by name, all of them are checked before any is loaded, and the data is copied
+    into the tensors of the network parameters in place.
+
     Args:
         net (Cell): Cell network.
         parameter_dict (dict): Parameter dict.
+        strict (bool): Whether all the parameters of the net must be in parameter_dict and all the parameters in
+            parameter_dict must be in the net. Default: False.
+
+    Returns:
+        tuple, the names of the parameters of the net not in parameter_dict, and the names of the parameters
+        in parameter_dict not in the net.
 
     Raises:
         TypeError: Argument is not a Cell, or parameter_dict is not a Parameter dict.
+        ValueError: Argument strict is True, and the parameters of the net and parameter_dict do not match.
+        RuntimeError: The type or shape of a parameter in parameter_dict does not match the net.
     """
     if not isinstance(net, nn.Cell):
         logger.error("Failed to combine the net and the parameters.")
@@ -225,33 +435,51 @@ def load_param_into_net(net, parameter_dict):
         raise TypeError(msg)
 
     logger.info("Execute parameter into net process.")
-    param_name_net_not_have = []
-    for name in parameter_dict:
-        b_par_dict_have_par_of_net = False
-        for _, param in net.parameters_and_names():
-            if name == param.name:
-                b_par_dict_have_par_of_net = True
-                # layerwise parallel parameter data loaded from checkpoint file,
-                # was a complete(merged) data, need to be splited
-                if param.layerwise_parallel:
-                    new_param = parameter_dict[param.name]
-                    _load_tensor_for_layerwise(new_param, param)
-                break
-        if not b_par_dict_have_par_of_net:
-            param_name_net_not_have.append(name)
-
-    param_name_param_dict_not_have = []
+    net_params = {}
     for _, param in net.parameters_and_names():
-        if param.name in parameter_dict:
-            new_param = parameter_dict[param.name]
-
-            if not isinstance(new_param, Parameter):
-                logger.error("Failed to combine the net and the parameters.")
-                msg = ("Argument parameter_dict element should be a Parameter, but got {}.".format(type(new_param)))
-                raise TypeError(msg)
-            _update_param(param, new_param)
-        else:
-            param_name_param_dict_not_have.append(param.name)
+        net_params.setdefault(param.name, []).append(param)
+    param_name_param_dict_not_have = [name for name in net_params if name not in parameter_dict]
+    param_name_net_not_have = [name for name in parameter_dict if name not in net_params]
+    if strict and (param_name_param_dict_not_have or param_name_net_not_have):
+        logger.error("Failed to combine the net and the parameters.")
+        msg = ("Params not matched, in net but not in parameter_dict: {}, in parameter_dict but not in net: {}."
+               .format(param_name_param_dict_not_have, param_name_net_not_have))
+        raise ValueError(msg)
+
+    updates = []
+    errors = []
+    for name, params in net_params.items():
+        if name not in parameter_dict:
+            continue
+        new_param = parameter_dict[name]
+        if not isinstance(new_param, Parameter):
+            logger.error("Failed to combine the net and the parameters.")
+            msg = ("Argument parameter_dict element should be a Parameter, but got {}.".format(type(new_param)))
+            raise TypeError(msg)
+        for param in params:
+            load_param = new_param
+            # layerwise parallel parameter data loaded from checkpoint file,
+            # was a complete(merged) data, need to be splited. The slice is kept apart from parameter_dict,
+            # which is not changed if any parameter does not match
+            if param.layerwise_parallel:
+                load_param = Parameter(_load_tensor_for_layerwise(new_param, param), name=new_param.name)
+            error = _check_param(param, load_param)
+            if error is not None:
+                logger.error("Failed to combine the net and the parameters for param %s.", param.name)
+                errors.append(error)
+            updates.append((param, load_param))
+    if errors:
+        raise RuntimeError("\n".join(errors))
+
+    # a tensor shared by several parameters is replaced rather than overwritten
+    data_users = {}
+    for params in net_params.values():
+        for param in params:
+            data_users[id(param.lazy_data)] = data_users.get(id(param.lazy_data), 0) + 1
+    for param, new_param in updates:
+        if data_users[id(param.lazy_data)] == 1 and _copy_param_data(param, new_param):
+            continue
+        _update_param(param, new_param)
 
     logger.debug("Params not matched(in net but not in parameter_dict):")
     for paramname in param_name_param_dict_not_have:
@@ -260,6 +488,7 @@ def load_param_into_net(net, parameter_dict):
     for paramname in param_name_net_not_have:
         logger.debug("%s", paramname)
     logger.info("Load parameter into net process finish.")
+    return param_name_param_dict_not_have, param_name_net_not_have
 
 
 def _save_graph(network, file_name):
@@ -279,15 +508,18 @@ def _save_graph(network, file_name):
         os.chmod(file_name, stat.S_IWUSR | stat.S_IRUSR)
 
 
-def _exec_save_checkpoint(train_network, ckpoint_file_name):
+def _get_checkpoint_param_list(train_network, snapshot=False):
     """
-    Saves checkpoint for 'ms' backend.
+    Gets the parameters list to save from the train network.
 
     Args:
         train_network (Network): The train network for training.
-        ckpoint_file_name (str): The name of checkpoint file.
-    """
+        snapshot (bool): Whether to copy the parameter data to the host, so that the list is not changed by the
+            following training steps. Default: False.
 
+    Returns:
+        list, each element is a dict like {"name":xx, "data":xx}.
+    """
     param_dict = {}
     for _, param in train_network.parameters_and_names():
         param_dict[param.name] = param
@@ -305,10 +537,217 @@ def _exec_save_checkpoint(train_network, ckpoint_file_name):
         if key in train_network.parameter_layout_dict:
             param_data = _get_merged_param_data(train_network, key, param_data)
 
+        if snapshot:
+            param_data = Tensor(param_data.asnumpy().copy())
+
         each_param["data"] = param_data
         param_list.append(each_param)
 
-    save_checkpoint(param_list, ckpoint_file_name)
+    return param_list
+
+
+def _exec_save_checkpoint(train_network, ckpoint_file_name):
+    """
+    Saves checkpoint for 'ms' backend.
+
+    Args:
+        train_network (Network): The train network for training.
+        ckpoint_file_name (str): The name of checkpoint file.
+    """
+    save_checkpoint(_get_checkpoint_param_list(train_network), ckpoint_file_name)
+
+
+def _get_split_layout(net, param_name):
+    """Gets the (dev_mat, tensor_map) of the parameter if it is split, otherwise None."""
+    layout = net.parameter_layout_dict.get(param_name)
+    if layout is None or len(layout) < 2:
+        return None
+    dev_mat, tensor_map = layout[0], layout[1]
+    if all([dim == -1 for dim in tensor_map]):
+        return None
+    return list(dev_mat), list(tensor_map)
+
+
+def _get_sharded_param_list(train_network, rank_id, group_size, snapshot=False):
+    """
+    Gets the local slices to save from the train network, for a shard of a sharded checkpoint.
+
+    A split parameter is only saved by the device holding the first replica of its slice, and a parameter that
+    is not split is saved by one device in turn, so the devices write disjoint parts of the model.
+
+    Args:
+        train_network (Network): The train network for training.
+        rank_id (int): The rank of the local device.
+        group_size (int): The number of devices.
+        snapshot (bool): Whether to copy the parameter data to the host. Default: False.
+
+    Returns:
+        list, each element is a dict like {"name":xx, "data":xx, "slice":{"shape":xx, "offset":xx}}.
+    """
+    from mindspore.parallel._tensor import _get_tensor_strategy, _get_slice_region, _is_first_replica
+    param_list = []
+    for index, (_, param) in enumerate(train_network.parameters_and_names()):
+        param_data = param.data if isinstance(param.data, Tensor) else Tensor(param.data)
+        local_shape = list(param_data.shape())
+        layout = _get_split_layout(train_network, param.name)
+        if layout is None:
+            if index % group_size != rank_id:
+                continue
+            slice_info = {"shape": local_shape, "offset": [0] * len(local_shape),
+                          "dev_mat": None, "tensor_map": None}
+        else:
+            dev_mat, tensor_map = layout
+            if not _is_first_replica(dev_mat, tensor_map, rank_id):
+                continue
+            strategy = _get_tensor_strategy(dev_mat, tensor_map)
+            shape = [dim * split for dim, split in zip(local_shape, strategy)]
+            offset, _ = _get_slice_region(shape, dev_mat, tensor_map, rank_id)
+            slice_info = {"shape": shape, "offset": offset, "dev_mat": dev_mat, "tensor_map": tensor_map}
+
+        if snapshot:
+            param_data = Tensor(param_data.asnumpy().copy())
+        param_list.append({"name": param.name, "data": param_data, "slice": slice_info})
+    return param_list
+
+
+def _save_sharded_checkpoint(param_list, ckpoint_file_name, rank_id, group_size):
+    """Saves the local slices from _get_sharded_param_list to the shard file of the local device."""
+    logger.info("Execute save sharded checkpoint process, rank %s of %s.", rank_id, group_size)
+    try:
+        _save_mmap_checkpoint(param_list, ckpoint_file_name, {"rank": rank_id, "group_size": group_size})
+        os.chmod(ckpoint_file_name, stat.S_IRUSR)
+    except BaseException as e:
+        logger.error("Failed to save the checkpoint file %s.", ckpoint_file_name)
+        raise RuntimeError(e.__str__())
+    logger.info("Save sharded checkpoint process finish.")
+
+
+def _get_rank_info(rank_id, group_size):
+    """Gets the rank and the number of devices, the ones not given are got from the communication group."""
+    if rank_id is None or group_size is None:
+        from mindspore.communication.management import get_rank, get_group_size
+        rank_id = get_rank() if rank_id is None else rank_id
+        group_size = get_group_size() if group_size is None else group_size
+    if not isinstance(rank_id, int) or not isinstance(group_size, int) or not 0 <= rank_id < group_size:
+        raise ValueError("The rank_id {} and group_size {} are invalid.".format(rank_id, group_size))
+    return rank_id, group_size
+
+
+def save_sharded_checkpoint(train_network, ckpoint_file_name, rank_id=None, group_size=None):
+    """
+    Saves the shard of the local device of a sharded checkpoint, without gathering the split parameters.
+
+    Every device calls it with its own file. The slices of the split parameters are saved by the devices
+    holding their first replicas, and the other parameters are spread over the devices, together with the
+    layout of each slice from parameter_layout_dict. The shard files of all the devices form the checkpoint,
+    which can be loaded by load_sharded_checkpoint on a different device matrix.
+
+    Args:
+        train_network (Cell): The network in model parallel.
+        ckpoint_file_name (str): The shard file name of the local device.
+        rank_id (int): The rank of the local device. Default: None, get it from the communication group.
+        group_size (int): The number of devices. Default: None, get it from the communication group.
+
+    Raises:
+        ValueError: The rank_id or group_size is invalid.
+        RuntimeError: Failed to save the shard file.
+
+    Examples:
+        >>> save_sharded_checkpoint(net, "./rank_{}/net.ckpt".format(get_rank()))
+    """
+    rank_id, group_size = _get_rank_info(rank_id, group_size)
+    param_list = _get_sharded_param_list(train_network, rank_id, group_size)
+    _save_sharded_checkpoint(param_list, ckpoint_file_name, rank_id, group_size)
+
+
+def _assemble_region(pieces, offset, shape, np_type, name):
+    """Copies the parts of the saved slices that overlap the region into a new array."""
+    region = np.empty(shape, np_type)
+    covered = 0
+    for piece_offset, piece_shape, piece in pieces:
+        src, dst = [], []
+        for start, size, piece_start, piece_size in zip(offset, shape, piece_offset, piece_shape):
+            low = max(start, piece_start)
+            high = min(start + size, piece_start + piece_size)
+            if low >= high:
+                break
+            src.append(slice(low - piece_start, high - piece_start))
+            dst.append(slice(low - start, high - start))
+        else:
+            # the lazy slice is read from the file only when it overlaps the region
+            piece_data = piece.to_tensor().asnumpy()
+            region[tuple(dst)] = piece_data[tuple(src)]
+            covered += int(np.prod([s.stop - s.start for s in dst]))
+    if covered != int(np.prod(shape)):
+        raise ValueError("The slices of parameter {} in the checkpoint files do not cover its region {} of "
+                         "shape {}, some shard files may be missing.".format(name, offset, shape))
+    return region
+
+
+def load_sharded_checkpoint(ckpoint_file_names, net=None, rank_id=None):
+    """
+    Loads a sharded checkpoint saved by save_sharded_checkpoint, possibly on a different device matrix.
+
+    The parameters split by the parameter_layout_dict of the net are re-sliced for the local device from the
+    saved slices which overlap its slice, the other parameters are assembled as whole tensors. Only the
+    overlapping slices are read from the shard files, which are memory mapped.
+
+    Args:
+        ckpoint_file_names (list[str]): The shard files of all the devices that saved the checkpoint.
+        net (Cell): Cell network, its parameter_layout_dict gives the layout to load with, the parameters
+            are loaded into it. Default: None, load whole tensors.
+        rank_id (int): The rank of the local device, used when the net has split parameters.
+            Default: None, get it from the communication group.
+
+    Returns:
+        Dict, key is parameter name, value is a Parameter.
+
+    Raises:
+        ValueError: The checkpoint files are incorrect or incomplete.
+
+    Examples:
+        >>> files = ["./rank_{}/net.ckpt".format(i) for i in range(8)]
+        >>> param_dict = load_sharded_checkpoint(files, net)
+    """
+    if not isinstance(ckpoint_file_names, (list, tuple)) or not ckpoint_file_names:
+        raise ValueError("The ckpoint_file_names must be a non-empty list of the shard files.")
+
+    logger.info("Execute load sharded checkpoint process.")
+    pieces = {}
+    params_info = {}
+    for file_name in ckpoint_file_names:
+        if not isinstance(file_name, str) or not os.path.exists(file_name) or not _is_mmap_checkpoint(file_name):
+            raise ValueError("The file {} is not a shard of a sharded checkpoint.".format(file_name))
+        header, data_start = _read_mmap_checkpoint_header(file_name)
+        if "shard" not in header:
+            raise ValueError("The file {} is not a shard of a sharded checkpoint.".format(file_name))
+        file_map = np.memmap(file_name, dtype=np.uint8, mode="c")
+        for item in header["params"]:
+            name = item["name"]
+            tensor = _MmapCheckpointTensor(file_map, data_start + item["offset"], tuple(item["shape"]), item["type"])
+            pieces.setdefault(name, []).append((item["slice"]["offset"], item["shape"], tensor))
+            params_info[name] = (item["slice"]["shape"], item["type"])
+
+    parameter_dict = {}
+    for name, (shape, tensor_type) in params_info.items():
+        offset, region_shape = [0] * len(shape), shape
+        layout = _get_split_layout(net, name) if net is not None else None
+        if layout is not None:
+            from mindspore.parallel._tensor import _get_slice_region
+            if rank_id is None:
+                from mindspore.communication.management import get_rank
+                rank_id = get_rank()
+            offset, region_shape = _get_slice_region(shape, layout[0], layout[1], rank_id)
+        data = _assemble_region(pieces[name], offset, region_shape, tensor_to_np_type[tensor_type], name)
+        if list(shape) in [[], [1]]:
+            parameter_dict[name] = Parameter(data.reshape(-1)[0], name=name)
+        else:
+            parameter_dict[name] = Parameter(Tensor(data, tensor_to_ms_type[tensor_type]), name=name)
+    logger.info("Load sharded checkpoint process finish.")
+
+    if net:
+        load_param_into_net(net, parameter_dict)
+    return parameter_dict
 
 
 def _get_merged_param_data(net, param_name, param_data):
@@ -346,11 +785,14 @@ def _get_merged_param_data(net, param_name, param_data):
 
 def _load_tensor_for_layerwise(new_param, old_param):
     """
-    Replaces parameters with sliced tensors by layerwise parallel strategies.
+    Gets the tensor sliced by layerwise parallel strategies, new_param is not changed.
 
     Args:
         new_param (Parameter): The new layerwise parallel parameter, will be loaded into net.
         old_param(Parameter): The current parameter in the net.
+
+    Returns:
+        Tensor, the slice of new_param's data for the local device.
     """
     if not isinstance(new_param.data, Tensor) or not isinstance(old_param.data, Tensor):
         logger.error("Failed to combine the net and the parameters.")
@@ -358,18 +800,18 @@ def _load_tensor_for_layerwise(new_param, old_param):
         raise TypeError(msg)
 
     if old_param.data.shape() == new_param.data.shape():
-        return
+        return new_param.data
 
     from mindspore.parallel._tensor import _load_tensor
     from mindspore.communication.management import get_group_size
     dev_mat = [get_group_size()]
     shape = new_param.data.shape()
+    tensor_map = [0]
     for x in range(len(shape)):  # dim 0 set 0, others set -1
         if x:
             tensor_map.append(-1)
 
-    new_tensor = _load_tensor(new_param.data, dev_mat, tensor_map)
-    new_param.set_parameter_data(new_tensor)
+    return _load_tensor(new_param.data, dev_mat, tensor_map)
 
 
 def _fill_param_into_net(net, parameter_list):
@@ -380,10 +822,21 @@ def _fill_param_into_net(net, parameter_list):
         net (Cell): train network.
         parameter_list (list): parameters list from ge callback.
     """
+    net_params = {}
+    data_users = {}
+    for _, param in net.parameters_and_names():
+        net_params.setdefault(param.name, []).append(param)
+        data_users[id(param.lazy_data)] = data_users.get(id(param.lazy_data), 0) + 1
+
     parameter_dict = {}
     for each_param in parameter_list:
         param_name = each_param["name"]
         np_val = each_param["data"].asnumpy()
+        # copy the data into the tensors of the matched parameters, the others are loaded by load_param_into_net
+        params = net_params.get(param_name)
+        if params and all(data_users[id(param.lazy_data)] == 1 and _copy_array_data(param, np_val)
+                          for param in params):
+            continue
         if np_val.shape == (1,):  # to scalar
             parameter_dict[param_name] = Parameter(np_val[0], name=param_name)
         elif np_val.shape == ():
@@ -391,7 +844,8 @@ def _fill_param_into_net(net, parameter_list):
         else:
             parameter_dict[param_name] = Parameter(Tensor(np_val), name=param_name)
 
-    load_param_into_net(net, parameter_dict)
+    if parameter_dict:
+        load_param_into_net(net, parameter_dict)
 
 
 def export(net, *inputs, file_name, file_format='GEIR'):
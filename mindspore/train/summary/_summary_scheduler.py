@@ -14,10 +14,12 @@
 # ============================================================================
 """Schedule the event writer process."""
 import multiprocessing as mp
+import queue
+import threading
 from enum import Enum, unique
 from mindspore import log as logger
 from ..._c_expression import Tensor
-from ._summary_adapter import SummaryType, package_summary_event, save_summary_data
+from ._summary_adapter import SummaryType, package_summary_event, save_summary_data, del_summary_data
 
 # define the type of summary
 FORMAT_SCALAR_STR = "Scalar"
@@ -35,6 +37,13 @@ g_summary_data_dict = {}
 g_summary_writer_id = 0
 g_summary_file = {}
 
+# the default capacity of the formal worker queue
+FORMAL_WORKER_QUEUE_SIZE = 64
+# the max number of events written between two flushes by a formal worker
+FORMAL_WORKER_BATCH_SIZE = 32
+# the seconds to wait for a free queue slot before dropping the event
+FORMAL_WORKER_PUT_TIMEOUT = 1
+
 
 @unique
 class ScheduleMethod(Enum):
@@ -141,7 +150,8 @@ class WorkerScheduler:
     Args:
         writer_id (int): The index of writer.
     """
-    def __init__(self, writer_id):
+    def __init__(self, writer_id, policy=ScheduleMethod.TEMP_WORKER, worker_num=1,
+                 queue_size=FORMAL_WORKER_QUEUE_SIZE):
         # Create the process of write event file
         self.write_lock = mp.Lock()
         # Schedule info for all worker
@@ -150,6 +160,13 @@ class WorkerScheduler:
         # write id
         self.writer_id = writer_id
         self.has_graph = False
+        self.policy = policy
+        # the long-lived workers and their bounded queue, only used by the formal worker policy
+        self.data_queue = None
+        self.formal_workers = []
+        self.statistics = _WorkerStatistics()
+        if self.policy == ScheduleMethod.FORMAL_WORKER:
+            self._start_formal_workers(worker_num, queue_size)
 
     def dispatch(self, step, data):
         """
@@ -169,8 +186,7 @@ class WorkerScheduler:
             return False
 
         data_id = SummaryDataManager.summary_data_save(data)
-        self._start_worker(step, data_id)
-        return True
+        return self._start_worker(step, data_id)
 
     def _start_worker(self, step, data_id):
         """
@@ -191,6 +207,15 @@ class WorkerScheduler:
             self.schedule_table[worker] = (step, data_id, WorkerStatus.WORKER_INIT)
             # start the worker
             worker.start()
+        elif policy == ScheduleMethod.FORMAL_WORKER:
+            try:
+                self.data_queue.put((step, data_id), timeout=FORMAL_WORKER_PUT_TIMEOUT)
+            except queue.Full:
+                # the workers can not keep up, drop the step instead of blocking the training
+                del_summary_data(data_id)
+                self.statistics.add_dropped()
+                logger.warning("The summary queue is full, the step(%r) data is dropped.", step)
+                return False
         else:
             logger.error("Do not support the other scheduler policy now.")
 
@@ -198,6 +223,35 @@ class WorkerScheduler:
         self._update_scheduler()
         return True
 
+    def _start_formal_workers(self, worker_num, queue_size):
+        """Create the long-lived workers that consume the bounded data queue."""
+        if not isinstance(worker_num, int) or isinstance(worker_num, bool) or worker_num <= 0:
+            raise ValueError("`worker_num` should be a positive int, but got {}.".format(worker_num))
+        if not isinstance(queue_size, int) or isinstance(queue_size, bool) or queue_size <= 0:
+            raise ValueError("`queue_size` should be a positive int, but got {}.".format(queue_size))
+        self.write_lock = threading.Lock()
+        self.data_queue = queue.Queue(queue_size)
+        for index in range(worker_num):
+            worker = SummaryDataWorker(index, self.data_queue, self.write_lock, self.writer_id, self.statistics)
+            worker.start()
+            self.formal_workers.append(worker)
+
+    def get_statistics(self):
+        """
+        Get the statistics of the scheduler.
+
+        Returns:
+            dict, the current queue depth and the number of dropped, written and flushed events.
+        """
+        statistics = self.statistics.to_dict()
+        statistics["queue_depth"] = self.data_queue.qsize() if self.data_queue is not None else 0
+        return statistics
+
+    def flush(self):
+        """Wait until all queued data is written by the formal workers."""
+        if self.data_queue is not None:
+            self.data_queue.join()
+
     def _data_convert(self, data_list):
         """Convert the data."""
         if data_list is None:
@@ -242,10 +296,110 @@ class WorkerScheduler:
             if worker.is_alive():
                 worker.join()
 
+        if self.formal_workers:
+            # one stop mark for every worker, they are consumed after all pending data
+            for _ in self.formal_workers:
+                self.data_queue.put(None)
+            for worker in self.formal_workers:
+                worker.join()
+            self.formal_workers = []
+
     def _make_policy(self):
         """Select the schedule strategy by data."""
-        # now only support the temp worker
-        return ScheduleMethod.TEMP_WORKER
+        return self.policy
+
+
+class _WorkerStatistics:
+    """The counters of the formal workers, shared by all threads of one scheduler."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.dropped_events = 0
+        self.written_events = 0
+        self.flush_count = 0
+
+    def add_dropped(self):
+        with self._lock:
+            self.dropped_events += 1
+
+    def add_written(self, count):
+        with self._lock:
+            self.written_events += count
+            self.flush_count += 1
+
+    def to_dict(self):
+        with self._lock:
+            return {"dropped_events": self.dropped_events,
+                    "written_events": self.written_events,
+                    "flush_count": self.flush_count}
+
+
+class SummaryDataWorker(threading.Thread):
+    """
+    Long-lived worker that consume the summary data from a bounded queue.
+
+    The worker takes all data already queued (up to FORMAL_WORKER_BATCH_SIZE), packages it to events
+    and writes them with one flush.
+
+    Args:
+        index (int): The index of worker.
+        data_queue (Queue): The queue of (step, data_id), None is the stop mark.
+        write_lock (Lock): The thread lock for writer same file.
+        writer_id (int): The index of writer.
+        statistics (_WorkerStatistics): The counters of the scheduler.
+    """
+    def __init__(self, index, data_queue, write_lock, writer_id, statistics):
+        super(SummaryDataWorker, self).__init__()
+        self.daemon = True
+        self.writer_id = writer_id
+        self.writer = SummaryDataManager.summary_file_get(self.writer_id)
+        if self.writer is None:
+            logger.error("The writer_id(%r) does not have writer", writer_id)
+        self.data_queue = data_queue
+        self.write_lock = write_lock
+        self.statistics = statistics
+        self.name = "SummaryDataWorker_" + str(index)
+
+    def run(self):
+        """The consumer process the queued data until the stop mark is received."""
+        stopped = False
+        while not stopped:
+            items = [self.data_queue.get()]
+            while len(items) < FORMAL_WORKER_BATCH_SIZE:
+                try:
+                    items.append(self.data_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = []
+            for item in items:
+                if item is None:
+                    stopped = True
+                    continue
+                step, data_id = item
+                # All exceptions need to be caught, otherwise the worker exits and the queue is blocked
+                try:
+                    logger.debug("worker(%r) process a data(%r)", self.name, step)
+                    events.append(package_summary_event(data_id, step).SerializeToString())
+                except Exception as e:
+                    logger.error("Summary data worker exception occurred, value = %r", e)
+
+            try:
+                self._write_summary(events)
+            except Exception as e:
+                logger.error("Summary data worker exception occurred, value = %r", e)
+            finally:
+                for _ in items:
+                    self.data_queue.task_done()
+
+    def _write_summary(self, events):
+        """Write the serialized events to event file with one flush."""
+        if not events:
+            return
+        with self.write_lock:
+            for event_str in events:
+                self.writer.write_event_to_file(event_str)
+            self.writer.flush()
+        self.statistics.add_written(len(events))
 
 
 class SummaryDataProcess(mp.Process):
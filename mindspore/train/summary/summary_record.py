@@ -16,7 +16,7 @@
 import os
 import threading
 from mindspore import log as logger
-from ._summary_scheduler import WorkerScheduler, SummaryDataManager
+from ._summary_scheduler import WorkerScheduler, SummaryDataManager, ScheduleMethod, FORMAL_WORKER_QUEUE_SIZE
 from ._summary_adapter import get_event_file_name, package_graph_event
 from ._event_writer import EventRecord
 from .._utils import _make_directory
@@ -53,14 +53,20 @@ class SummaryRecord:
 
     Args:
         log_dir (str): The log_dir is a directory location to save the summary.
-        queue_max_size (int): The capacity of event queue.(reserved). Default: 0.
+        queue_max_size (int): The capacity of event queue, used when `worker_num` is greater than 0. Default: 0.
         flush_time (int): Frequency to flush the summaries to disk, the unit is second. Default: 120.
         file_prefix (str): The prefix of file. Default: "events".
         file_suffix (str): The suffix of file. Default: "_MS".
         network (Cell): Obtain a pipeline through network for saving graph summary. Default: None.
+        worker_num (int): The number of long-lived workers that write the summary. If it is 0, a new process
+            is started to write every recorded step. Otherwise the recorded steps are put into a bounded queue
+            with `queue_max_size` capacity (64 if `queue_max_size` is 0) and the workers write them in batches
+            with one flush, steps are dropped when the queue stays full. Default: 0.
 
     Raises:
-        TypeError: If `queue_max_size` and `flush_time` is not int, or `file_prefix` and `file_suffix` is not str.
+        TypeError: If `queue_max_size`, `flush_time` and `worker_num` is not int, or `file_prefix` and
+            `file_suffix` is not str.
+        ValueError: If `worker_num` is less than 0.
         RuntimeError: If the log_dir can not be resolved to a canonicalized absolute pathname.
 
     Examples:
@@ -73,7 +79,8 @@ class SummaryRecord:
                  flush_time=120,
                  file_prefix="events",
                  file_suffix="_MS",
-                 network=None):
+                 network=None,
+                 worker_num=0):
 
         _check_str_by_regular(file_prefix)
         _check_str_by_regular(file_suffix)
@@ -83,6 +90,10 @@ class SummaryRecord:
             raise TypeError("`queue_max_size` and `flush_time` should be int")
         if not isinstance(file_prefix, str) or not isinstance(file_suffix, str):
             raise TypeError("`file_prefix` and `file_suffix`  should be str.")
+        if not isinstance(worker_num, int) or isinstance(worker_num, bool):
+            raise TypeError("`worker_num` should be int")
+        if worker_num < 0:
+            raise ValueError("`worker_num` should be greater than or equal to 0, but got {}.".format(worker_num))
 
         self.queue_max_size = queue_max_size
         if queue_max_size < 0:
@@ -111,7 +122,12 @@ class SummaryRecord:
             raise RuntimeError(ex)
         self.event_writer = EventRecord(self.full_file_name, self.flush_time)
         self.writer_id = SummaryDataManager.summary_file_set(self.event_writer)
-        self.worker_scheduler = WorkerScheduler(self.writer_id)
+        if worker_num > 0:
+            queue_size = self.queue_max_size if self.queue_max_size > 0 else FORMAL_WORKER_QUEUE_SIZE
+            self.worker_scheduler = WorkerScheduler(self.writer_id, ScheduleMethod.FORMAL_WORKER,
+                                                    worker_num, queue_size)
+        else:
+            self.worker_scheduler = WorkerScheduler(self.writer_id)
 
         self.step = 0
         self._closed = False
@@ -150,9 +166,10 @@ class SummaryRecord:
             if graph_proto is None:
                 logger.error("Failed to get proto for graph")
             else:
-                self.event_writer.write_event_to_file(
-                    package_graph_event(graph_proto).SerializeToString())
-                self.event_writer.flush()
+                with self.worker_scheduler.write_lock:
+                    self.event_writer.write_event_to_file(
+                        package_graph_event(graph_proto).SerializeToString())
+                    self.event_writer.flush()
                 self.has_graph = True
 
         data = _summary_tensor_cache.get("SummaryRecord")
@@ -170,8 +187,9 @@ class SummaryRecord:
         self.worker_scheduler.dispatch(self.step, data)
 
         # count & flush
-        self.event_writer.count_event()
-        self.event_writer.flush_cycle()
+        with self.worker_scheduler.write_lock:
+            self.event_writer.count_event()
+            self.event_writer.flush_cycle()
 
         logger.debug("Send the summary data to scheduler for saving, step = %d", self.step)
         return True
@@ -191,6 +209,20 @@ class SummaryRecord:
         """
         return self.event_writer.full_file_name
 
+    @property
+    def statistics(self):
+        """
+        Get the statistics of the summary workers.
+
+        Examples:
+            >>> summary_record = SummaryRecord(log_dir="/opt/log", worker_num=1)
+            >>> print(summary_record.statistics)
+
+        Returns:
+            dict, includes `queue_depth`, `dropped_events`, `written_events` and `flush_count`.
+        """
+        return self.worker_scheduler.get_statistics()
+
     def flush(self):
         """
         Flush the event file to disk.
@@ -205,7 +237,9 @@ class SummaryRecord:
         if self._closed:
             logger.error("The record writer is closed and can not flush.")
         else:
-            self.event_writer.flush()
+            self.worker_scheduler.flush()
+            with self.worker_scheduler.write_lock:
+                self.event_writer.flush()
 
     def close(self):
         """
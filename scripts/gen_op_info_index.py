@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# coding=UTF-8
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Function:
+    Generate mindspore/ops/_op_impl/_op_info_index.py, the index of the built-in op info modules
+Usage:
+    python gen_op_info_index.py
+"""
+import os
+import ast
+
+OP_IMPL_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "mindspore", "ops", "_op_impl")
+
+HEADER = '''# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The index of the op info modules, generated by scripts/gen_op_info_index.py. Do not edit."""
+
+'''
+
+
+def load_build_op_info_index():
+    """Load build_op_info_index from the package source, without importing mindspore."""
+    with open(os.path.join(OP_IMPL_DIR, "__init__.py")) as f:
+        tree = ast.parse(f.read())
+    nodes = [node for node in tree.body
+             if isinstance(node, (ast.Import, ast.FunctionDef)) and
+             getattr(node, "name", None) in (None, "build_op_info_index")]
+    nodes += [node for node in tree.body if isinstance(node, ast.Assign) and
+              any(getattr(target, "id", None) == "_EXCLUDED_MODULES" for target in node.targets)]
+    module = ast.Module(body=nodes)
+    if hasattr(ast, "TypeIgnore"):
+        module.type_ignores = []
+    scope = {}
+    exec(compile(module, "<op_impl>", "exec"), scope)  # pylint: disable=exec-used
+    return scope["build_op_info_index"]
+
+
+def gen_op_info_index(output_file):
+    """Write the index of the op info modules."""
+    build_op_info_index = load_build_op_info_index()
+    index = build_op_info_index(OP_IMPL_DIR)
+    with open(output_file, "w") as f:
+        f.write(HEADER)
+        f.write("OP_INFO_INDEX = {\n")
+        for key in sorted(index, key=lambda key: (key[1], key[0])):
+            f.write("    {!r}: {!r},\n".format(key, index[key]))
+        f.write("}\n")
+    print("{} op info modules are written to {}".format(len(index), output_file))
+
+
+if __name__ == "__main__":
+    gen_op_info_index(os.path.join(OP_IMPL_DIR, "_op_info_index.py"))
@@ -0,0 +1,44 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+
+"""Import time test."""
+
+import sys
+import subprocess
+
+from mindspore import log as logger
+
+repeat = 5
+
+# the op info is registered on the first lookup, or eagerly as it was before the lazy registration
+LAZY_IMPORT = "import time; t = time.perf_counter(); import mindspore; print(time.perf_counter() - t)"
+EAGER_IMPORT = "import time; t = time.perf_counter(); import mindspore; " \
+               "from mindspore.ops._op_impl import register_all_ops; register_all_ops(); " \
+               "print(time.perf_counter() - t)"
+
+
+def import_time(code):
+    """The best time of importing in a new process."""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", code])
+        times.append(float(output.decode().split()[-1]))
+    return min(times)
+
+
+def test_import_time():
+    lazy_time = import_time(LAZY_IMPORT)
+    eager_time = import_time(EAGER_IMPORT)
+    logger.info("import mindspore: %.3fs, with all op info registered: %.3fs", lazy_time, eager_time)
@@ -0,0 +1,77 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+
+"""Log call time test."""
+
+import os
+import shutil
+import time
+
+log_count = 20000
+
+
+def _rm_env_config():
+    envlist = ['GLOG_v', 'GLOG_logtostderr', 'GLOG_log_dir', 'logger_maxBytes', 'logger_backupCount',
+               'logger_async']
+    for env in envlist:
+        if os.environ.get(env):
+            del os.environ[env]
+
+
+def count_lines(file_path, message):
+    """The number of the lines of the message in the log files."""
+    count = 0
+    for file_name in os.listdir(file_path):
+        with open(os.path.join(file_path, file_name)) as f:
+            count += sum(message in line for line in f)
+    return count
+
+
+def test_log_async_perf():
+    """
+    Overhead of the suppressed and emitted log calls, written in the caller or in the writer thread
+    """
+    file_path = '/tmp/log/mindspore_test'
+    for async_mode in ('0', '1'):
+        _rm_env_config()
+        os.environ['GLOG_v'] = '2'
+        os.environ['GLOG_logtostderr'] = '0'
+        os.environ['GLOG_log_dir'] = file_path
+        os.environ['logger_async'] = async_mode
+        from mindspore import log as logger
+        if os.path.exists(file_path):
+            shutil.rmtree(file_path)
+        os.makedirs(file_path, exist_ok=True)
+
+        start = time.perf_counter()
+        for i in range(0, log_count, 1):
+            logger.info("test log message info :%r", i)
+        suppressed_time = (time.perf_counter() - start) / log_count
+
+        start = time.perf_counter()
+        for i in range(0, log_count, 1):
+            logger.warning("test log message warning :%r", i)
+        emitted_time = (time.perf_counter() - start) / log_count
+        logger.warning("logger_async=%s: suppressed call %.2f us, emitted call %.2f us",
+                       async_mode, suppressed_time * 1e6, emitted_time * 1e6)
+
+        # the records in the queue are written when the handler is closed
+        logger._get_logger().handlers[0].close()
+        assert count_lines(file_path, "test log message warning") == log_count
+        assert count_lines(file_path, "test log message info") == 0
+        shutil.rmtree(file_path)
+        # Clean up _global_logger to avoid affecting for next usecase
+        logger._global_logger = None
+    _rm_env_config()
@@ -0,0 +1,75 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+
+"""Slicing and merging time of a large embedding table by model parallel layouts."""
+
+import time
+import numpy as np
+
+from mindspore import log as logger
+from mindspore.parallel._tensor import _get_tensor_strategy, _get_tensor_slice, _merge_tensor_slices
+
+repeat = 3
+
+VOCAB_SIZE = 400000
+EMBEDDING_SIZE = 128
+LAYOUTS = [([8], [0, -1]), ([2, 4], [1, 0])]
+
+
+def split_slices(np_tensor, strategy):
+    """All the slices by recursive np.split, as the slices were got before."""
+    slices = [np_tensor]
+    for axis, split in enumerate(strategy):
+        slices = [part for tensor in slices for part in np.split(tensor, split, axis)]
+    return slices
+
+
+def concatenate_slices(slices, strategy):
+    """The whole tensor by pairwise np.concatenate from the last axis, as it was merged before."""
+    for axis in reversed(range(len(strategy))):
+        merged = []
+        for i in range(0, len(slices), strategy[axis]):
+            tensor = slices[i]
+            for part in slices[i + 1:i + strategy[axis]]:
+                tensor = np.concatenate((tensor, part), axis=axis)
+            merged.append(tensor)
+        slices = merged
+    return slices[0]
+
+
+def best_time(func):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_parallel_tensor_time():
+    table = np.random.rand(VOCAB_SIZE, EMBEDDING_SIZE).astype(np.float32)
+    for dev_mat, tensor_map in LAYOUTS:
+        strategy = _get_tensor_strategy(dev_mat, tensor_map)
+        device_num = int(np.prod(dev_mat))
+        slices = [_get_tensor_slice(table, dev_mat, tensor_map, rank) for rank in range(device_num)]
+        assert (_merge_tensor_slices(slices, dev_mat, tensor_map) == table).all()
+
+        split_time = best_time(lambda: split_slices(table, strategy)[device_num - 1])
+        slice_time = best_time(lambda: _get_tensor_slice(table, dev_mat, tensor_map, device_num - 1))
+        distinct_slices = split_slices(table, strategy)
+        concatenate_time = best_time(lambda: concatenate_slices(distinct_slices, strategy))
+        merge_time = best_time(lambda: _merge_tensor_slices(slices, dev_mat, tensor_map))
+        logger.info("layout %s %s: slice %.6fs (split %.6fs), merge %.3fs (concatenate %.3fs)",
+                    dev_mat, tensor_map, slice_time, split_time, merge_time, concatenate_time)
@@ -0,0 +1,108 @@
+# Copyright 2019 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+
+import mindspore.dataset as ds
+from mindspore import log as logger
+from mindspore.dataset.engine.autotune import AutoTune
+
+
+def generator_1d():
+    for i in range(64):
+        yield (np.array([i]),)
+
+
+def _make_profile(occupancies, wait_ratio=0.0):
+    ops = [{"id": i, "name": "Op{}".format(i), "parent": i - 1, "num_workers": 1, "queue_capacity": 10,
+            "rows": 100, "rows_per_second": 100.0, "avg_queue_size": occ * 10, "avg_queue_occupancy": occ}
+           for i, occ in enumerate(occupancies)]
+    return {"ops": ops, "consumer": {"rows": 100, "wait_time": wait_ratio, "wait_ratio": wait_ratio}}
+
+
+def test_autotune_rebalance():
+    """
+    the starving map gets more workers and the prefetch size grows when the consumer waits.
+    """
+    logger.info("Test autotune rebalance")
+    prefetch_size = ds.config.get_prefetch_size()
+    data1 = ds.GeneratorDataset(generator_1d, ["data"])
+    data2 = data1.map(input_columns="data", operations=(lambda x: x), num_parallel_workers=2)
+    data3 = data2.batch(4, num_parallel_workers=2)
+
+    settings = AutoTune([data3, data2, data1], 8).tune(_make_profile([0.1, 0.05, 0.95], 0.5))
+    assert data2.num_parallel_workers == 3
+    assert data3.num_parallel_workers == 2
+    assert settings["num_parallel_workers"] == {"Op0(0)": 2, "Op1(1)": 3}
+    assert ds.config.get_prefetch_size() == min(prefetch_size * 2, 128)
+    ds.config.set_prefetch_size(prefetch_size)
+
+
+def test_autotune_cpu_budget():
+    """
+    the operators waiting for their consumer give back workers, and the growth stays within the budget.
+    """
+    logger.info("Test autotune cpu budget")
+    data1 = ds.GeneratorDataset(generator_1d, ["data"])
+    data2 = data1.map(input_columns="data", operations=(lambda x: x), num_parallel_workers=4)
+    data3 = data2.map(input_columns="data", operations=(lambda x: x), num_parallel_workers=2)
+    data4 = data3.batch(4, num_parallel_workers=2)
+
+    AutoTune([data4, data3, data2, data1], 8).tune(_make_profile([0.1, 0.05, 0.9, 0.9]))
+    # data2 waits for data3, which is starving
+    assert data2.num_parallel_workers == 3
+    assert data3.num_parallel_workers == 3
+    assert data4.num_parallel_workers + data3.num_parallel_workers + data2.num_parallel_workers <= 8
+
+
+def test_autotune_iterator():
+    """
+    the pipeline runs with autotune enabled.
+    """
+    logger.info("Test autotune iterator")
+    prefetch_size = ds.config.get_prefetch_size()
+    ds.config.set_autotune(True, 4)
+    assert ds.config.get_autotune()
+    assert ds.config.get_autotune_cpu_budget() == 4
+    try:
+        data1 = ds.GeneratorDataset(generator_1d, ["data"])
+        data1 = data1.map(input_columns="data", operations=(lambda x: x + 1), num_parallel_workers=1)
+        data1 = data1.batch(4)
+        for _ in range(2):
+            num_iter = 0
+            for _ in data1.create_dict_iterator():
+                num_iter += 1
+            assert num_iter == 16
+    finally:
+        ds.config.set_autotune(False)
+        ds.config.set_prefetch_size(prefetch_size)
+
+
+def test_autotune_config_exception():
+    """
+    the invalid arguments of set_autotune.
+    """
+    logger.info("Test autotune config exception")
+    with pytest.raises(TypeError):
+        ds.config.set_autotune(1)
+    with pytest.raises(ValueError):
+        ds.config.set_autotune(True, 0)
+
+
+if __name__ == '__main__':
+    test_autotune_rebalance()
+    test_autotune_cpu_budget()
+    test_autotune_iterator()
+    test_autotune_config_exception()
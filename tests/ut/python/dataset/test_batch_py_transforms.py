@@ -0,0 +1,114 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Testing the batched execution of py_transforms
+"""
+import numpy as np
+
+import mindspore.dataset as ds
+import mindspore.dataset.transforms.vision.py_transforms as py_vision
+
+
+def generate_images(num, height=32, width=48):
+    for i in range(num):
+        yield (np.full((height, width, 3), i * 10, dtype=np.uint8),)
+
+
+def test_batch_call_same_as_compose():
+    """
+    Test the deterministic transforms give the same result on a batch as on each image
+    """
+    images = np.random.randint(0, 256, (4, 32, 48, 3)).astype(np.uint8)
+    transforms = [py_vision.CenterCrop((16, 24)),
+                  py_vision.HWC2CHW(),
+                  py_vision.ToType(np.float32),
+                  py_vision.Normalize((0.5, 0.4, 0.3), (0.2, 0.3, 0.4))]
+    transform = py_vision.ComposeOp(transforms)
+    batch = transform.batch_call(images, is_hwc=True)
+    assert batch.shape == (4, 3, 16, 24)
+
+    expected = np.stack([py_vision.Normalize((0.5, 0.4, 0.3), (0.2, 0.3, 0.4))(
+        img[8:24, 12:36].transpose(2, 0, 1).astype(np.float32)) for img in images])
+    np.testing.assert_allclose(batch, expected, rtol=1e-6)
+
+
+def test_batch_call_random_per_image():
+    """
+    Test the random parameters are drawn for each image of the batch
+    """
+    np.random.seed(0)
+    images = np.random.rand(64, 3, 8, 8).astype(np.float32)
+    flipped = py_vision.RandomHorizontalFlip(0.5).batch_call(images)
+    num_flipped = sum([np.array_equal(img[:, :, ::-1], out) for img, out in zip(images, flipped)])
+    assert 0 < num_flipped < 64
+
+    cropped = py_vision.RandomCrop((4, 4)).batch_call(images)
+    assert cropped.shape == (64, 3, 4, 4)
+    offsets = set()
+    for img, out in zip(images, cropped):
+        for i in range(5):
+            for j in range(5):
+                if np.array_equal(img[:, i:i + 4, j:j + 4], out):
+                    offsets.add((i, j))
+    assert len(offsets) > 1
+
+    erased = py_vision.RandomErasing(prob=1.0).batch_call(images)
+    erased_area = (erased == 0).reshape(64, -1).sum(axis=1)
+    assert np.all(erased_area > 0)
+    assert len(set(erased_area)) > 1
+
+
+def test_batch_call_pil_transform():
+    """
+    Test the transforms without batch_call are applied to the PIL Image of each image
+    """
+    images = np.random.randint(0, 256, (4, 32, 48, 3)).astype(np.uint8)
+    transform = py_vision.ComposeOp([py_vision.Resize((16, 24)), py_vision.ToTensor()])
+    expected = np.stack([py_vision.ToTensor()(py_vision.Resize((16, 24))(py_vision.ToPIL()(img)))
+                         for img in images])
+
+    batch = transform.batch_call(images, is_hwc=True)
+    assert batch.shape == (4, 3, 16, 24)
+    np.testing.assert_allclose(batch, expected)
+    # the images of shape (N, C, H, W) are transposed for PIL
+    batch = transform.batch_call(images.transpose(0, 3, 1, 2))
+    np.testing.assert_allclose(batch, expected)
+
+def test_batch_map_pipeline():
+    """
+    Test the batched transforms as the per_batch_map of batch
+    """
+    transform = py_vision.ComposeOp([py_vision.RandomCrop(24, padding=4),
+                                     py_vision.RandomHorizontalFlip(0.5),
+                                     py_vision.ToTensor(),
+                                     py_vision.Normalize((0.5, 0.5, 0.5), (0.5, 0.5, 0.5)),
+                                     py_vision.Cutout(8)])
+    data = ds.GeneratorDataset(lambda: generate_images(10), ["image"])
+    data = data.batch(4, input_columns=["image"], per_batch_map=transform.batch_map(is_hwc=True))
+
+    num_rows = 0
+    for item in data.create_dict_iterator():
+        image = item["image"]
+        assert image.dtype == np.float32
+        assert image.shape[1:] == (3, 24, 24)
+        num_rows += image.shape[0]
+    assert num_rows == 10
+
+
+if __name__ == "__main__":
+    test_batch_call_same_as_compose()
+    test_batch_call_random_per_image()
+    test_batch_call_pil_transform()
+    test_batch_map_pipeline()
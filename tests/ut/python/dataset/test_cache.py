@@ -0,0 +1,144 @@
+# Copyright 2019 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+
+import mindspore.dataset as ds
+from mindspore import log as logger
+
+
+def generator_1d():
+    for i in range(64):
+        yield (np.array([i]),)
+
+
+def test_cache_repeat():
+    """
+    the rows before the cache are only read once when the dataset is repeated.
+    """
+    logger.info("Test cache with repeat")
+    calls = []
+
+    def add_one(x):
+        calls.append(1)
+        return x + 1
+
+    data1 = ds.GeneratorDataset(generator_1d, ["data"])
+    data1 = data1.map(input_columns="data", operations=add_one)
+    data1 = data1.cache()
+    data1 = data1.repeat(3)
+
+    iterator = data1.create_dict_iterator()
+    i = 0
+    for item in iterator:
+        np.testing.assert_array_equal(item["data"], np.array([i % 64 + 1]))
+        i = i + 1
+    assert i == 192
+    assert len(calls) == 64
+
+    statistics = iterator.get_cache_statistics()
+    assert len(statistics) == 1
+    assert statistics[0]["complete"]
+    assert statistics[0]["misses"] == 64
+    assert statistics[0]["hits"] == 128
+    assert statistics[0]["spill_hits"] == 0
+
+
+def test_cache_spill():
+    """
+    the rows beyond the memory budget are spilled and read back.
+    """
+    logger.info("Test cache spill")
+    data1 = ds.GeneratorDataset(generator_1d, ["data"])
+    # every row has 8 bytes, keep 16 rows in memory
+    data1 = data1.cache(memory_budget=128)
+    data1 = data1.repeat(2)
+
+    iterator = data1.create_tuple_iterator()
+    i = 0
+    for item in iterator:
+        np.testing.assert_array_equal(item[0], np.array([i % 64]))
+        i = i + 1
+    assert i == 128
+
+    statistics = iterator.get_cache_statistics()[0]
+    assert statistics["misses"] == 64
+    assert statistics["hits"] + statistics["spill_hits"] == 64
+    assert statistics["spill_hits"] > 0
+    assert statistics["memory_bytes"] <= 128
+    assert statistics["spill_bytes"] > 0
+
+
+def test_cache_reuse_between_iterators():
+    """
+    the cache is kept by the dataset and reused by the next iterator.
+    """
+    logger.info("Test cache reuse between iterators")
+    data1 = ds.GeneratorDataset(generator_1d, ["data"])
+    data1 = data1.cache()
+
+    for _ in range(2):
+        iterator = data1.create_tuple_iterator()
+        assert sum([1 for _ in iterator]) == 64
+
+    statistics = iterator.get_cache_statistics()[0]
+    assert statistics["misses"] == 64
+    assert statistics["hits"] == 64
+
+
+def generator_columns():
+    for i in range(8):
+        yield (np.array([i, i]), np.array([i * 10]), np.array([-i]))
+
+
+def test_cache_column_order():
+    """
+    the columns keep their order through the cache.
+    """
+    logger.info("Test cache column order")
+    data1 = ds.GeneratorDataset(generator_columns, ["image", "label", "weight"])
+    data1 = data1.cache()
+    data1 = data1.repeat(2)
+
+    i = 0
+    for item in data1.create_tuple_iterator():
+        assert len(item) == 3
+        np.testing.assert_array_equal(item[0], np.array([i % 8, i % 8]))
+        np.testing.assert_array_equal(item[1], np.array([i % 8 * 10]))
+        np.testing.assert_array_equal(item[2], np.array([-(i % 8)]))
+        i = i + 1
+    assert i == 16
+
+
+def test_cache_exception():
+    """
+    the invalid arguments of cache.
+    """
+    logger.info("Test cache exception")
+    data1 = ds.GeneratorDataset(generator_1d, ["data"])
+    with pytest.raises(TypeError):
+        data1.cache(memory_budget="1G")
+    with pytest.raises(ValueError):
+        data1.cache(memory_budget=-1)
+    with pytest.raises(ValueError):
+        data1.cache(spill_dir="/path/does/not/exist")
+
+
+if __name__ == '__main__':
+    test_cache_repeat()
+    test_cache_spill()
+    test_cache_reuse_between_iterators()
+    test_cache_column_order()
+    test_cache_exception()
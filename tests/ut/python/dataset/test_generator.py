@@ -18,6 +18,7 @@ import pytest
 import mindspore.common.dtype as mstype
 import mindspore.dataset as ds
 from mindspore import log as logger
+from mindspore.dataset.engine.datasets import _copy_row_to_shm
 
 
 # Generate 1d int numpy array from 0 - 63
@@ -391,6 +392,72 @@ def test_case_13():
         i = i + 1
 
 
+class RandomAccessDataset:
+    """
+    Random-accessible source that returns (data, label) rows
+    """
+    def __init__(self, num_rows=64):
+        self.num_rows = num_rows
+
+    def __getitem__(self, item):
+        return (np.array([[item, item + 1], [item + 2, item + 3]]), np.array([item]))
+
+    def __len__(self):
+        return self.num_rows
+
+
+def test_case_parallel_workers():
+    """
+    Test random-accessible source with parallel worker processes and threads
+    """
+    logger.info("Test random-accessible source with parallel workers")
+
+    for python_multiprocessing in [True, False]:
+        data1 = ds.GeneratorDataset(RandomAccessDataset(), ["data", "label"], num_parallel_workers=4,
+                                    python_multiprocessing=python_multiprocessing)
+        i = 0
+        for item in data1.create_dict_iterator():
+            assert np.array_equal(item["data"], np.array([[i, i + 1], [i + 2, i + 3]]))
+            assert np.array_equal(item["label"], np.array([i]))
+            i = i + 1
+        assert i == 64
+
+
+def test_case_parallel_workers_sampler():
+    """
+    Test sampler with parallel workers, the order of the sampler is kept
+    """
+    logger.info("Test sampler with parallel workers")
+
+    indices = list(range(63, -1, -2))
+    data1 = ds.GeneratorDataset(RandomAccessDataset(), ["data", "label"], sampler=indices, num_parallel_workers=3)
+    i = 0
+    for item in data1.create_dict_iterator():
+        assert np.array_equal(item["label"], np.array([indices[i]]))
+        i = i + 1
+    assert i == len(indices)
+
+
+def test_case_copy_row_to_shm():
+    """
+    Test the row is copied to the shared memory slot only when the aligned arrays fit
+    """
+    logger.info("Test copy row to shared memory")
+
+    shm = np.zeros([64], np.uint8)
+    row = (np.array([1], np.uint8), np.array([2], np.uint8), np.arange(55, dtype=np.uint8))
+    # the offsets 0, 8 and 16 are aligned, the last array ends beyond the slot
+    assert _copy_row_to_shm(row, shm) is None
+    assert not shm.any()
+
+    row = (np.array([1], np.uint8), np.array([2], np.uint8), np.arange(48, dtype=np.uint8))
+    meta = _copy_row_to_shm(row, shm)
+    assert [offset for _, _, offset in meta] == [0, 8, 16]
+    for x, (dtype, shape, offset) in zip(row, meta):
+        y = np.frombuffer(shm, dtype, count=x.size, offset=offset).reshape(shape)
+        assert np.array_equal(x, y)
+
+
 def test_case_error_1():
     def generator_np():
         for i in range(64):
@@ -454,6 +521,9 @@ if __name__ == "__main__":
     test_case_11()
     test_case_12()
     test_case_13()
+    test_case_parallel_workers()
+    test_case_parallel_workers_sampler()
+    test_case_copy_row_to_shm()
     test_case_error_1()
     test_case_error_2()
     test_case_error_3()
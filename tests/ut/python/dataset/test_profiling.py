@@ -0,0 +1,108 @@
+# Copyright 2019 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+
+import numpy as np
+import pytest
+
+import mindspore.dataset as ds
+from mindspore import log as logger
+from mindspore.dataset.engine.profiling import summarize
+
+
+def generator_1d():
+    for i in range(64):
+        yield (np.array([i]),)
+
+
+def test_profiling_iterator():
+    """
+    profile a pipeline and dump the result as json and chrome trace.
+    """
+    logger.info("Test profiling iterator")
+    data1 = ds.GeneratorDataset(generator_1d, ["data"])
+    data1 = data1.map(input_columns="data", operations=(lambda x: x + 1))
+    data1 = data1.batch(4)
+
+    iterator = data1.create_dict_iterator(profile=True)
+    num_iter = 0
+    for _ in iterator:
+        num_iter += 1
+    assert num_iter == 16
+
+    profile = iterator.profiler.to_dict()
+    assert [op["name"] for op in profile["ops"]] == ["BatchDataset", "MapDataset", "GeneratorDataset"]
+    assert [op["parent"] for op in profile["ops"]] == [-1, 0, 1]
+    assert profile["ops"][0]["rows"] == 16
+    assert profile["consumer"]["rows"] == 16
+    assert profile["samples"]
+
+    summary = iterator.profiler.summary()
+    assert "bottleneck" in summary and "suggestion" in summary
+
+    iterator.profiler.dump("pipeline_profile.json")
+    iterator.profiler.dump("pipeline_trace.json", "chrome")
+    with open("pipeline_profile.json") as f:
+        assert json.load(f)["summary"] == summary
+    with open("pipeline_trace.json") as f:
+        assert json.load(f)["traceEvents"]
+    os.remove("pipeline_profile.json")
+    os.remove("pipeline_trace.json")
+
+    with pytest.raises(ValueError):
+        iterator.profiler.dump("pipeline_profile.xml", "xml")
+
+
+def test_profiling_disabled():
+    """
+    no profiler is created by default.
+    """
+    logger.info("Test profiling disabled")
+    data1 = ds.GeneratorDataset(generator_1d, ["data"])
+    iterator = data1.create_tuple_iterator()
+    assert iterator.profiler is None
+
+
+def _make_profile(occupancies):
+    ops = [{"id": i, "name": "Op{}".format(i), "parent": i - 1, "num_workers": 1, "queue_capacity": 10,
+            "rows": 100, "rows_per_second": 100.0, "avg_queue_size": occ * 10, "avg_queue_occupancy": occ}
+           for i, occ in enumerate(occupancies)]
+    return {"ops": ops}
+
+
+def test_profiling_summarize():
+    """
+    the slowest stage is the one with an empty output queue and a full input queue.
+    """
+    logger.info("Test profiling summarize")
+    # root <- map <- source, the map can not keep up with the source
+    summary = summarize(_make_profile([0.1, 0.05, 0.95]))
+    assert summary["bottleneck"] == "Op1"
+    assert "num_parallel_workers" in summary["suggestion"]
+
+    # the source can not keep up
+    summary = summarize(_make_profile([0.1, 0.1, 0.0]))
+    assert summary["bottleneck"] == "Op2"
+
+    # the consumer is slower than the pipeline
+    summary = summarize(_make_profile([0.9, 0.9, 0.9]))
+    assert summary["bottleneck"] == "consumer"
+
+
+if __name__ == '__main__':
+    test_profiling_iterator()
+    test_profiling_disabled()
+    test_profiling_summarize()
@@ -129,6 +129,27 @@ def test_rgb_hsv_batch_chw():
     assert_allclose(rgb_base.flatten(), rgb_de.flatten(), rtol=1e-5, atol=0)
 
 
+def test_rgb_hsv_batch_float32():
+    rgb_flat = generate_numpy_random_rgb((6 * 8 * 8, 3)).astype(np.float32)
+    rgb_imgs = rgb_flat.reshape((6, 8, 8, 3))
+    hsv_base = np.array([
+        colorsys.rgb_to_hsv(
+            r.astype(np.float64), g.astype(np.float64), b.astype(np.float64))
+        for r, g, b in rgb_imgs.reshape((-1, 3))
+    ]).reshape(rgb_imgs.shape)
+    hsv_de = util.rgb_to_hsvs(rgb_imgs, True)
+    assert hsv_de.dtype == np.float32
+    assert_allclose(hsv_base.flatten(), hsv_de.flatten(), rtol=1e-5, atol=1e-7)
+
+    # the batch in (N, C, H, W) gives the same result
+    hsv_chw = util.rgb_to_hsvs(rgb_imgs.transpose((0, 3, 1, 2)), False)
+    assert_allclose(hsv_chw.transpose((0, 2, 3, 1)), hsv_de, rtol=1e-6, atol=0)
+
+    rgb_de = util.hsv_to_rgbs(hsv_de, True)
+    assert rgb_de.dtype == np.float32
+    assert_allclose(rgb_imgs.flatten(), rgb_de.flatten(), rtol=1e-5, atol=1e-6)
+
+
 def test_rgb_hsv_pipeline():
     # First dataset
     transforms1 = [
@@ -164,5 +185,6 @@ if __name__ == "__main__":
     test_rgb_hsv_batch_hwc()
     test_rgb_hsv_chw()
     test_rgb_hsv_batch_chw()
+    test_rgb_hsv_batch_float32()
     test_rgb_hsv_pipeline()
 
@@ -0,0 +1,93 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test_confusion_matrix"""
+import numpy as np
+import pytest
+from mindspore.nn.metrics import ConfusionMatrix, Precision, Recall, Fbeta, get_metric_fn
+from mindspore import Tensor
+
+
+def test_confusion_matrix():
+    x = Tensor(np.array([[0.2, 0.5], [0.3, 0.1], [0.9, 0.6]]))
+    y = Tensor(np.array([1, 0, 1]))
+    y2 = Tensor(np.array([[0, 1], [1, 0], [0, 1]]))
+    metric = get_metric_fn('confusion_matrix')
+    metric.clear()
+    metric.update(x, y)
+    metric.update(x, y2)
+    matrix = metric.eval()
+
+    assert np.equal(matrix, np.array([[2, 0], [2, 2]])).all()
+    assert np.equal(metric.true_positives, np.array([2, 2])).all()
+    assert np.equal(metric.positives, np.array([4, 2])).all()
+    assert np.equal(metric.actual_positives, np.array([2, 4])).all()
+
+
+def test_confusion_matrix_class_num():
+    with pytest.raises(ValueError):
+        ConfusionMatrix(0)
+    x = Tensor(np.array([[0.2, 0.5, 0.7], [0.3, 0.1, 0.2], [0.9, 0.6, 0.5]]))
+    metric = ConfusionMatrix(2)
+    with pytest.raises(ValueError):
+        metric.update(x, Tensor(np.array([1, 0, 1])))
+    with pytest.raises(ValueError):
+        ConfusionMatrix().update(x, Tensor(np.array([1, 0])))
+    with pytest.raises(RuntimeError):
+        ConfusionMatrix().eval()
+
+
+def test_confusion_matrix_large_class_num():
+    class_num = 2000
+    x = np.random.rand(256, class_num).astype(np.float32)
+    y = np.random.randint(0, class_num, 256)
+    # repeat the samples so that the same (label, prediction) pairs are counted more than once
+    x = np.concatenate([x, x[:64]])
+    y = np.concatenate([y, y[:64]])
+    metric = ConfusionMatrix()
+    metric.update(Tensor(x), Tensor(y))
+
+    expect = np.zeros((class_num, class_num), np.int64)
+    for label, prediction in zip(y, x.argmax(axis=1)):
+        expect[label, prediction] += 1
+    assert np.equal(metric.eval(), expect).all()
+
+def test_merge_classification_metrics():
+    """test_merge_classification_metrics"""
+    x = np.random.rand(90, 7)
+    y = np.random.randint(0, 7, 90)
+    for metric_type in (Precision, Recall, ConfusionMatrix, lambda: Fbeta(2)):
+        total = metric_type()
+        total.update(Tensor(x), Tensor(y))
+        workers = [metric_type() for _ in range(3)]
+        for i, worker in enumerate(workers):
+            worker.update(Tensor(x[i * 30:(i + 1) * 30]), Tensor(y[i * 30:(i + 1) * 30]))
+        merged = metric_type()
+        for worker in workers:
+            merged.merge(worker)
+        assert np.allclose(merged.eval(), total.eval())
+
+
+def test_merge_multilabel_precision():
+    x = Tensor(np.array([[0, 1, 0, 1], [1, 0, 1, 1], [0, 0, 0, 1]]))
+    y = Tensor(np.array([[0, 1, 1, 1], [0, 1, 1, 1], [0, 0, 0, 1]]))
+    metric = Precision('multilabel')
+    metric.update(x, y)
+    other = Precision('multilabel')
+    other.update(x, y)
+    metric.merge(other)
+
+    assert np.allclose(metric.eval(), np.array([1, 2/3, 1, 1, 2/3, 1]))
+    with pytest.raises(TypeError):
+        metric.merge(Precision('classification'))
@@ -49,6 +49,26 @@ def test_imagenet_to_mindrecord():
         os.remove(MINDRECORD_FILE + str(i))
         os.remove(MINDRECORD_FILE + str(i) + ".db")
 
+def test_imagenet_to_mindrecord_parallel():
+    """test transform imagenet dataset to mindrecord with parallel workers."""
+    imagenet_transformer = ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR,
+                                        MINDRECORD_FILE, PARTITION_NUMBER,
+                                        num_parallel_workers=4)
+    imagenet_transformer.transform()
+    for i in range(PARTITION_NUMBER):
+        assert os.path.exists(MINDRECORD_FILE + str(i))
+        assert os.path.exists(MINDRECORD_FILE + str(i) + ".db")
+    read(MINDRECORD_FILE + "0")
+    for i in range(PARTITION_NUMBER):
+        os.remove(MINDRECORD_FILE + str(i))
+        os.remove(MINDRECORD_FILE + str(i) + ".db")
+
+def test_imagenet_to_mindrecord_num_parallel_workers_0():
+    """test transform imagenet dataset to mindrecord when num_parallel_workers is 0."""
+    with pytest.raises(ValueError, match="num_parallel_workers"):
+        ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR, MINDRECORD_FILE,
+                     PARTITION_NUMBER, num_parallel_workers=0)
+
 def test_imagenet_to_mindrecord_default_partition_number():
     """
     test transform imagenet dataset to mindrecord
@@ -15,6 +15,7 @@
 """test mindrecord base"""
 import os
 import uuid
+import numpy as np
 from mindspore.mindrecord import FileWriter, FileReader, MindPage, SUCCESS
 from mindspore import log as logger
 from utils import get_data, get_nlp_data
@@ -114,6 +115,21 @@ def test_cv_file_reader_partial_tutorial():
             reader.finish()
     assert count == 5
 
+def test_cv_file_reader_batch_tutorial():
+    """tutorial for cv file batch reader."""
+    rows = list(FileReader(CV_FILE_NAME + "0").get_next())
+    reader = FileReader(CV_FILE_NAME + "0", columns=["label", "data"])
+    batches = list(reader.get_batches(4, prefetch_size=1))
+    assert [len(batch["label"]) for batch in batches] == [4, 4, 2]
+    for batch in batches:
+        assert set(batch) == {"label", "data"}
+        assert batch["label"].dtype == np.int64
+    labels = np.concatenate([batch["label"] for batch in batches])
+    images = [bytes(image) for batch in batches for image in batch["data"]]
+    assert labels.tolist() == [x["label"] for x in rows]
+    assert images == [x["data"] for x in rows]
+    reader.close()
+
 def test_cv_page_reader_tutorial():
     """tutorial for cv page reader."""
     reader = MindPage(CV_FILE_NAME + "0")
@@ -174,6 +190,20 @@ def test_nlp_file_reader_tutorial():
     assert count == 10
     reader.close()
 
+def test_nlp_file_reader_batch_tutorial():
+    """tutorial for nlp file batch reader."""
+    rows = list(FileReader(NLP_FILE_NAME + "0").get_next())
+    reader = FileReader(NLP_FILE_NAME + "0")
+    count = 0
+    for batch in reader.get_batches(3):
+        assert len(batch) == 6
+        assert batch["rating"].dtype == np.float32
+        for i, input_ids in enumerate(batch["input_ids"]):
+            assert (input_ids == rows[count + i]["input_ids"]).all()
+        count += len(batch["id"])
+    assert count == 10
+    reader.close()
+
 def test_nlp_page_reader_tutorial():
     """tutorial for nlp page reader."""
     reader = MindPage(NLP_FILE_NAME + "0")
@@ -277,6 +307,35 @@ def test_cv_file_writer_no_blob():
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
 
+def test_cv_file_writer_columns():
+    """test cv file writer with columnar data."""
+    writer = FileWriter(CV_FILE_NAME, 1)
+    data = get_data("../data/mindrecord/testImageNetData/")
+    cv_schema_json = {"file_name": {"type": "string"}, "label": {"type": "int64"},
+                      "data": {"type": "bytes"}, "mask": {"type": "float32", "shape": [2, 2]}}
+    writer.add_schema(cv_schema_json, "columns_schema")
+    writer.add_index(["file_name", "label"])
+    masks = np.arange(len(data) * 4, dtype=np.float64).reshape(len(data), 4)
+    columns = {"file_name": [x["file_name"] for x in data],
+               "label": np.array([x["label"] for x in data]),
+               "data": [x["data"] for x in data],
+               "mask": masks}
+    writer.write_columns(columns)
+    writer.commit()
+    reader = FileReader(CV_FILE_NAME)
+    count = 0
+    for x in reader.get_next():
+        assert len(x) == 4
+        index = columns["file_name"].index(x["file_name"])
+        assert x["data"] == data[index]["data"]
+        assert x["label"] == data[index]["label"]
+        assert np.array_equal(x["mask"], masks[index].reshape(2, 2).astype(np.float32))
+        count += 1
+    assert count == 10
+    reader.close()
+    os.remove(CV_FILE_NAME)
+    os.remove("{}.db".format(CV_FILE_NAME))
+
 def test_cv_file_writer_no_raw():
     """test cv file writer without raw data."""
     writer = FileWriter(NLP_FILE_NAME)
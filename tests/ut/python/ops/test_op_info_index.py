@@ -0,0 +1,39 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test_op_info_index """
+import sys
+
+from mindspore.ops import _op_impl
+from mindspore.ops._op_impl import OP_INFO_INDEX, build_op_info_index, register_op
+
+
+def test_op_info_index_up_to_date():
+    """ the index must be regenerated by scripts/gen_op_info_index.py after adding an op info module """
+    assert OP_INFO_INDEX == build_op_info_index()
+
+
+def test_op_info_registered_lazily():
+    module_name = _op_impl.__name__ + "." + OP_INFO_INDEX[("ReLU6", "AutoDiff")]
+    assert register_op("ReLU6", "AutoDiff")
+    assert module_name in sys.modules
+    # registering again does not import the module again
+    module = sys.modules[module_name]
+    assert register_op("ReLU6", "AutoDiff")
+    assert sys.modules[module_name] is module
+
+
+def test_op_info_not_built_in():
+    assert not register_op("NotBuiltInOp", "TBE")
+    assert not register_op("Add", "AKG")
@@ -24,6 +24,7 @@ from mindspore.nn.optim import Momentum, Adam
 from mindspore.ops import functional as F
 from mindspore.common import dtype as mstype
 from mindspore.train import Model
+from mindspore.train.callback import Callback
 from ....dataset_mock import MindData
 from mindspore.nn.optim import Lamb
 
@@ -274,3 +275,69 @@ def test_adam_compile():
     train_network.set_train()
     output = train_network(inputs, label, scaling_sens)
     print("the result is ", output)
+
+
+def test_dynamic_loss_scale_deferred_overflow_check():
+    overflows = [False, True, False, False, True, True, False]
+    scale_manager = DynamicLossScaleManager(2 ** 10, 2, 2)
+    deferred_manager = DynamicLossScaleManager(2 ** 10, 2, 2, overflow_check_steps=3)
+    assert deferred_manager.get_overflow_check_steps() == 3
+    assert FixedLossScaleManager().get_overflow_check_steps() == 1
+    loss_scales = []
+    for step, overflow in enumerate(overflows):
+        scale_manager.update_loss_scale(overflow)
+        deferred_manager.add_overflow(Tensor(np.array(overflow)))
+        loss_scales.append(scale_manager.get_loss_scale())
+        # the deferred manager catches up every 3 steps
+        checked_step = step - (step + 1) % 3
+        expect = loss_scales[checked_step] if checked_step >= 0 else 2 ** 10
+        assert deferred_manager.get_loss_scale() == expect
+    deferred_manager.check_overflow()
+    assert deferred_manager.get_loss_scale() == scale_manager.get_loss_scale()
+    assert deferred_manager.cur_iter == scale_manager.cur_iter
+
+
+class OverflowNet(nn.Cell):
+    """ Stub train network returning (loss, overflow, scale) with the given overflow flags """
+    def __init__(self, overflows):
+        super(OverflowNet, self).__init__()
+        self.overflows = overflows
+        self.inputs_num = []
+
+    def __call__(self, *inputs):
+        overflow = self.overflows[len(self.inputs_num)]
+        self.inputs_num.append(len(inputs))
+        return Tensor(np.array(1.0, np.float32)), Tensor(np.array(overflow)), Tensor(np.array(1.0, np.float32))
+
+
+class LossScaleRecorder(Callback):
+    """ Record the loss scale at the end of each epoch """
+    def __init__(self, scale_manager):
+        self.scale_manager = scale_manager
+        self.loss_scales = []
+
+    def epoch_end(self, run_context):
+        self.loss_scales.append(self.scale_manager.get_loss_scale())
+
+
+def test_model_deferred_overflow_check():
+    overflows = [False, True, False, False, True, True]
+    scale_manager = DynamicLossScaleManager(2 ** 10, 2, 2)
+    expected = []
+    for step, overflow in enumerate(overflows):
+        scale_manager.update_loss_scale(overflow)
+        if step % 2 == 1:
+            expected.append(scale_manager.get_loss_scale())
+
+    # the overflow flags of an epoch are checked before its end even if fewer than overflow_check_steps
+    deferred_manager = DynamicLossScaleManager(2 ** 10, 2, 2, overflow_check_steps=4)
+    network = OverflowNet(overflows)
+    model = Model(Net(16, 16), loss_scale_manager=deferred_manager)
+    model._train_network = network
+    recorder = LossScaleRecorder(deferred_manager)
+    dataset = MindDataSet((np.float32, np.float32), ((32, 16), (32, 16)))
+    model.train(3, dataset, callbacks=[recorder], dataset_sink_mode=False)
+    # the loss scale is not fed as the sens input in deferred mode
+    assert network.inputs_num == [2] * len(overflows)
+    assert recorder.loss_scales == expected
+    assert deferred_manager.cur_iter == scale_manager.cur_iter
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import numpy as np
-from mindspore.train._utils import _to_full_shapes, _to_full_tensor
+from mindspore.train._utils import _to_full_shapes, _to_full_tensor, _StagingBufferPool
 from mindspore import Tensor
 import mindspore as ms
 
@@ -71,6 +71,37 @@ def test_to_full_tensor_sens_2():
     assert (full_tensor == expect_tensors)
 
 
+def test_staging_buffer_pool():
+    pool = _StagingBufferPool(2)
+    buffers = [pool.get(0, np.float32, (8, 3)) for _ in range(3)]
+    assert buffers[0] is not buffers[1]
+    assert buffers[0] is buffers[2]
+    assert not buffers[0].any()
+    assert pool.get(1, np.float32, (8, 3)) is not buffers[0]
+    assert pool.get(0, np.int32, (8, 3)) is not buffers[0]
+    assert pool.get(0, np.float32, (4, 3)).shape == (4, 3)
 
 
-
+def test_to_full_tensor_buffer_pool():
+    device_num = 4
+    global_rank = 2
+    pool = _StagingBufferPool(2)
+    for i in range(3):
+        elem0 = np.array([[1, 2, 3], [4, 5, 6]], np.float32) + i
+        elem1 = np.array([[1], [4]], np.int32) + i
+        full_tensor = _to_full_tensor((elem0, elem1), device_num, global_rank, buffer_pool=pool)
+
+        expect0 = np.zeros((8, 3), np.float32)
+        expect0[4:6] = elem0
+        expect1 = np.zeros((8, 1), np.int32)
+        expect1[4:6] = elem1
+        assert (full_tensor[0].asnumpy() == expect0).all()
+        assert (full_tensor[1].asnumpy() == expect1).all()
+
+
+def test_to_full_tensor_no_zero_fill():
+    elem = np.array([[1, 2, 3], [4, 5, 6]], np.float32)
+    pool = _StagingBufferPool(1, zero_fill=False)
+    full_tensor = _to_full_tensor(elem, 4, 1, buffer_pool=pool)
+    assert full_tensor[0].shape() == (8, 3)
+    assert (full_tensor[0].asnumpy()[2:4] == elem).all()
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from mindspore.parallel._tensor import _load_tensor
+import numpy as np
+from mindspore.parallel._tensor import _load_tensor, _get_slice_region, _is_first_replica, _get_slice_index, \
+    _get_tensor_slice, _merge_tensor_slices
 from mindspore import Tensor
 from hccl_test.manage.api import Hccl
 
@@ -38,5 +40,35 @@ def test_load_tensor():
     hccl.rank_id = 0
 
 
+def test_get_slice_region():
+    dev_mat = [2, 3]
+    tensor_map = [1, -1]
+    offset, slice_shape = _get_slice_region([2, 3], dev_mat, tensor_map, 5)
+    assert offset == [1, 0]
+    assert slice_shape == [1, 3]
+
+    offset, slice_shape = _get_slice_region([4, 6], [2, 3], [-1, 0], 4)
+    assert offset == [0, 2]
+    assert slice_shape == [4, 2]
+
+    assert _is_first_replica(dev_mat, tensor_map, 3)
+    assert not _is_first_replica(dev_mat, tensor_map, 5)
+
+
+def test_get_tensor_slice():
+    np_tensor = np.arange(24).reshape(4, 6)
+    assert _get_slice_index([4, 6], [2, 3], [1, 0], 5) == (slice(2, 4), slice(4, 6))
+    tensor_slice = _get_tensor_slice(np_tensor, [2, 3], [1, 0], 5)
+    assert (tensor_slice == np_tensor[2:4, 4:6]).all()
+    assert np.shares_memory(tensor_slice, np_tensor)
+
+
+def test_merge_tensor_slices():
+    np_tensor = np.arange(36).reshape(6, 6)
+    for dev_mat, tensor_map in [([2, 3], [1, 0]), ([2, 3], [0, 1]), ([2, 3], [-1, 0]), ([6], [-1, -1])]:
+        tensor_slices = [_get_tensor_slice(np_tensor, dev_mat, tensor_map, rank) for rank in range(6)]
+        assert (_merge_tensor_slices(tensor_slices, dev_mat, tensor_map) == np_tensor).all()
+
+
 if __name__ == '__main__':
     test_load_tensor()
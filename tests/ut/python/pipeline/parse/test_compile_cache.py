@@ -0,0 +1,59 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test_compile_cache """
+import os
+import numpy as np
+
+import mindspore.nn as nn
+from mindspore import Tensor, context
+from mindspore.common import _compile_cache
+from mindspore.common.api import _executor
+from mindspore.ops import operations as P
+
+
+class Net(nn.Cell):
+    """ Net definition """
+    def __init__(self):
+        super(Net, self).__init__()
+        self.dense = nn.Dense(4, 3)
+        self.relu = P.ReLU()
+
+    def construct(self, x):
+        return self.relu(self.dense(x))
+
+
+def test_compile_cache(tmp_path):
+    """ test the parse results are reused by the compile of the same network after a restart """
+    context.set_context(compile_cache_path=str(tmp_path))
+    try:
+        input_data = Tensor(np.ones([2, 4]).astype(np.float32))
+        _executor.compile(Net(), input_data)
+        cache = _compile_cache.get_compile_cache()
+        assert cache.misses == 1
+        assert len(os.listdir(str(tmp_path))) == 1
+
+        # drop the cache in memory as a restarted job
+        _compile_cache._compile_cache = None
+        _executor.compile(Net(), input_data)
+        cache = _compile_cache.get_compile_cache()
+        assert cache.hits == 1
+        assert cache.saved_time > 0
+
+        _executor.compile(Net(), Tensor(np.ones([3, 4]).astype(np.float32)))
+        assert cache.misses == 1
+        assert len(os.listdir(str(tmp_path))) == 2
+    finally:
+        context.set_context(compile_cache_path="")
+        _compile_cache._compile_cache = None
@@ -0,0 +1,60 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test_parse_cache """
+import numpy as np
+
+import mindspore.nn as nn
+from mindspore import Tensor
+from mindspore.common.api import _executor
+from mindspore._extends.parse import parser
+# pylint: disable=W0212
+# W0212: protected-access
+
+
+class Net(nn.Cell):
+    """ Net definition """
+    def __init__(self):
+        super(Net, self).__init__()
+        self.dense1 = nn.Dense(4, 4)
+        self.dense2 = nn.Dense(4, 4)
+        self.dense3 = nn.Dense(4, 4)
+
+    def construct(self, x):
+        return self.dense3(self.dense2(self.dense1(x)))
+
+
+def test_parse_results_reused():
+    """ test the construct shared by the cells is parsed once """
+    input_data = Tensor(np.ones([2, 4]).astype(np.float32))
+    snapshot = parser.parse_statistics.snapshot()
+    _executor.compile(Net(), input_data)
+    stats = parser.parse_statistics.since(snapshot)
+    assert nn.Dense.construct.__code__ in parser._parse_results
+    assert stats.cached_num >= 2
+    assert stats.total_time >= 0
+
+    snapshot = parser.parse_statistics.snapshot()
+    _executor.compile(Net(), input_data)
+    stats = parser.parse_statistics.since(snapshot)
+    assert stats.parsed_num == 0
+    assert stats.cached_num > 0
+
+
+def test_parse_result_source():
+    result = parser._parse_function(Net.construct)
+    assert result.source.startswith("def construct(self, x):")
+    assert result.col_offset == 4
+    assert result.tree.body[0].name == "construct"
+    assert parser._parse_function(Net().construct) is result
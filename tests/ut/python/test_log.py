@@ -300,6 +300,44 @@ def test_log_perf():
     logger._global_logger = None
 
 
+def test_log_async_file():
+    """
+    test the logs written by the writer thread, with rotating files
+    """
+    _rm_env_config()
+    file_path = '/tmp/log/mindspore_test'
+    os.environ['GLOG_v'] = '1'
+    os.environ['GLOG_logtostderr'] = '0'
+    os.environ['GLOG_log_dir'] = file_path
+    os.environ['logger_maxBytes'] = '1000'
+    os.environ['logger_backupCount'] = '10'
+    os.environ['logger_async'] = '1'
+
+    from mindspore import log as logger
+    if os.path.exists(file_path):
+        shutil.rmtree(file_path)
+    os.makedirs(file_path, exist_ok=True)
+
+    log_count = 100
+    for i in range(0, log_count, 1):
+        logger.warning("test log message warning %r", i)
+    logger.debug("test log message debug")
+    assert logger.get_log_config()['logger_async'] == '1'
+    # the records in the queue are written when the handler is closed
+    logger._get_logger().handlers[0].close()
+
+    file_count = len(os.listdir(file_path))
+    with open(f'{file_path}/mindspore.log') as f:
+        last_line = f.read().splitlines()[-1]
+
+    if os.path.exists(file_path):
+        shutil.rmtree(file_path)
+    assert file_count == 11
+    assert last_line.endswith("test log message warning 99")
+    # Clean up _global_logger to avoid affecting for next usecase
+    logger._global_logger = None
+
+
 def test_log_ms_import():
     _rm_env_config()
     import mindspore as ms
@@ -310,7 +348,8 @@ def test_log_ms_import():
 	
 
 def _rm_env_config():
-    envlist = ['GLOG_v', 'GLOG_logtostderr', 'GLOG_log_dir', 'logger_maxBytes', 'logger_backupCount']
+    envlist = ['GLOG_v', 'GLOG_logtostderr', 'GLOG_log_dir', 'logger_maxBytes', 'logger_backupCount',
+               'logger_async']
     for env in envlist:
         if os.environ.get(env):
             del os.environ[env]
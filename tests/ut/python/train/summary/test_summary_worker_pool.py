@@ -0,0 +1,69 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+@File  : test_summary_worker_pool.py
+@Desc  : test the long-lived summary workers
+"""
+import os
+import numpy as np
+import pytest
+from mindspore.train.summary.summary_record import SummaryRecord, _cache_summary_tensor_data
+from mindspore.common.tensor import Tensor
+
+CUR_DIR = os.getcwd()
+SUMMARY_DIR = CUR_DIR + "/test_temp_summary_event_file/"
+
+
+def get_test_data(step):
+    """ get_test_data """
+    return [{"name": "x1[:Scalar]", "data": Tensor(np.array(step + 1).astype(np.float32))},
+            {"name": "x2[:Tensor]", "data": Tensor(np.ones([2, 3]).astype(np.float32))}]
+
+
+def test_summary_worker_pool():
+    """ test the steps are written by the long-lived workers """
+    test_writer = SummaryRecord(SUMMARY_DIR, file_suffix="_MS_POOL", worker_num=2)
+    for i in range(1, 100):
+        _cache_summary_tensor_data(get_test_data(i))
+        test_writer.record(i)
+    test_writer.flush()
+    statistics = test_writer.statistics
+    test_writer.close()
+
+    assert statistics["queue_depth"] == 0
+    assert statistics["dropped_events"] == 0
+    assert statistics["written_events"] == 99
+    assert statistics["flush_count"] <= 99
+
+
+def test_summary_worker_pool_statistics_after_close():
+    """ test the pending steps are written when close """
+    test_writer = SummaryRecord(SUMMARY_DIR, queue_max_size=4, file_suffix="_MS_POOL", worker_num=1)
+    for i in range(1, 10):
+        _cache_summary_tensor_data(get_test_data(i))
+        test_writer.record(i)
+    test_writer.close()
+
+    statistics = test_writer.statistics
+    assert statistics["queue_depth"] == 0
+    assert statistics["written_events"] + statistics["dropped_events"] == 9
+
+
+def test_summary_worker_num_invalid():
+    """ test the invalid worker_num """
+    with pytest.raises(ValueError):
+        SummaryRecord(SUMMARY_DIR, worker_num=-1)
+    with pytest.raises(TypeError):
+        SummaryRecord(SUMMARY_DIR, worker_num=1.5)
@@ -0,0 +1,110 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test_dataset_helper """
+import threading
+import time
+import numpy as np
+import pytest
+from mindspore.train.dataset_helper import DatasetHelper
+
+
+class CountData:
+    """ Dataset of numbered batches, a new iterator starts from 0 """
+
+    def __init__(self, size, repeat_count=1, error_at=None):
+        self.size = size
+        self.repeat_count = repeat_count
+        self.error_at = error_at
+        self.read_num = 0
+        self.iter_num = 0
+
+    def get_dataset_size(self):
+        return self.size
+
+    def get_repeat_count(self):
+        return self.repeat_count
+
+    def __iter__(self):
+        self.iter_num += 1
+        return self._batches()
+
+    def _batches(self):
+        for i in range(self.size * self.repeat_count):
+            if i == self.error_at:
+                raise ValueError("bad batch")
+            self.read_num += 1
+            yield np.array([i], np.int32), np.array([i * 2], np.float32)
+
+    def reset(self):
+        pass
+
+
+def read_epochs(dataset_helper, epoch):
+    return [[int(data.asnumpy()[0]) for data, _ in dataset_helper] for _ in range(epoch)]
+
+
+@pytest.mark.parametrize("repeat_count", [1, 3])
+def test_feed_prefetch_epochs(repeat_count):
+    expected = read_epochs(DatasetHelper(CountData(4, repeat_count), False, prefetch_size=0), 3)
+    assert read_epochs(DatasetHelper(CountData(4, repeat_count), False), 3) == expected
+    if repeat_count == 1:
+        assert expected == [[0, 1, 2, 3]] * 3
+    else:
+        assert expected == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]]
+
+
+def test_feed_prefetch_ahead():
+    dataset = CountData(10)
+    dataset_helper = DatasetHelper(dataset, False, prefetch_size=3)
+    inputs = iter(dataset_helper)
+    data, label = next(inputs)
+    assert data.asnumpy()[0] == 0 and label.asnumpy()[0] == 0
+    assert dataset_helper.data_wait_time() >= 0
+    for _ in range(100):
+        if dataset.read_num == 5:
+            break
+        time.sleep(0.01)
+    # one batch is fetched, one is being put into the queue and three are kept ready
+    assert dataset.read_num == 5
+    assert [int(next(inputs)[0].asnumpy()[0]) for _ in range(9)] == list(range(1, 10))
+    with pytest.raises(StopIteration):
+        next(inputs)
+    assert dataset.iter_num == 1
+
+
+def test_feed_prefetch_error():
+    dataset_helper = DatasetHelper(CountData(4, error_at=2), False)
+    inputs = iter(dataset_helper)
+    assert len([next(inputs), next(inputs)]) == 2
+    with pytest.raises(ValueError):
+        next(inputs)
+    with pytest.raises(ValueError):
+        next(inputs)
+
+
+def test_feed_prefetch_stop():
+    threads = threading.active_count()
+    dataset = CountData(10, repeat_count=3)
+    dataset_helper = DatasetHelper(dataset, False, prefetch_size=2)
+    inputs = iter(dataset_helper)
+    next(inputs)
+    dataset_helper.stop()
+    for _ in range(100):
+        if threading.active_count() == threads:
+            break
+        time.sleep(0.01)
+    # the thread ends before reading the batches of the rest epochs
+    assert threading.active_count() == threads
+    assert dataset.read_num < 10
@@ -267,6 +267,40 @@ def test_checkpoint_save_ckpt_seconds():
     ckpt_cb2.step_end(run_context)
 
 
+def test_checkpoint_save_ckpt_async():
+    """Test checkpoint save ckpt asynchronously."""
+    train_config = CheckpointConfig(
+        save_checkpoint_steps=16,
+        keep_checkpoint_max=1,
+        async_save=True,
+        max_pending_saves=2)
+    ckpt_cb = ModelCheckpoint(prefix="async_ckpt", directory='./test_files', config=train_config)
+    cb_params = _InternalCallbackParam()
+    net = Net()
+    loss = nn.SoftmaxCrossEntropyWithLogits()
+    optim = Momentum(net.trainable_params(), learning_rate=0.1, momentum=0.9)
+    network_ = WithLossCell(net, loss)
+    _train_network = TrainOneStepCell(network_, optim)
+    cb_params.train_network = _train_network
+    cb_params.epoch_num = 10
+    cb_params.cur_epoch_num = 1
+    cb_params.cur_step_num = 16
+    cb_params.batch_num = 32
+    run_context = RunContext(cb_params)
+    ckpt_cb.begin(run_context)
+    ckpt_cb.step_end(run_context)
+    cb_params.cur_step_num = 32
+    ckpt_cb.step_end(run_context)
+    ckpt_cb.wait_pending_saves()
+
+    assert len(ckpt_cb.save_statistics) == 2
+    assert os.path.exists(ckpt_cb.latest_ckpt_file_name)
+    ckpt_files = [f for f in os.listdir('./test_files') if f.startswith(ckpt_cb._prefix + "-")]
+    assert len([f for f in ckpt_files if f.endswith(".ckpt")]) == 1
+    with pytest.raises(ValueError):
+        CheckpointConfig(async_save=True, max_pending_saves=0)
+
+
 def test_build_callbacks():
     """Test_build_callbacks."""
     ck_obj = ModelCheckpoint()
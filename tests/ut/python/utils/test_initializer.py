@@ -185,6 +185,52 @@ def test_init_he_uniform_error():
         init.initializer(init.HeUniform(), [6], ms.float32)
 
 
+def test_init_lazy():
+    """ test_init_lazy """
+    np.random.seed(1)
+    tensor = init.initializer('truncatednormal', [1024, 1024], ms.float16, lazy=True)
+    param = ms.Parameter(tensor, name="weight")
+    assert param.is_lazy
+    assert param.lazy_data.shape() == (1024, 1024)
+    assert param.lazy_data.dtype() == ms.float16
+
+    data = param.default_input.asnumpy()
+    assert not param.is_lazy
+    assert data.dtype == np.float16
+    assert np.all(np.abs(data) <= 0.0201)
+
+    np.random.seed(1)
+    expected = init.initializer('truncatednormal', [1024, 1024], ms.float16)
+    assert np.array_equal(data, expected.asnumpy())
+
+
+def test_init_lazy_clone():
+    """ test_init_lazy_clone """
+    param = ms.Parameter(init.initializer('normal', [64, 32], lazy=True), name="weight")
+    same = param.clone("same")
+    assert np.array_equal(same.default_input.asnumpy(), param.default_input.asnumpy())
+    zeros = param.clone("moment", init='zeros')
+    assert zeros.is_lazy
+    _check_value(zeros.default_input, 0, 0)
+
+
+def test_init_random_chunks():
+    """ test_init_random_chunks """
+    chunk_size = init._RANDOM_CHUNK_SIZE
+    try:
+        init._RANDOM_CHUNK_SIZE = 1000
+        arr = np.empty((100, 101), np.float32)
+        init.Uniform(scale=2)(arr, seed=5)
+        assert np.all(np.abs(arr) <= 2)
+        assert len(np.unique(arr[:10].reshape(-1)[:1000])) == 1000
+        assert not np.array_equal(arr.reshape(-1)[:1000], arr.reshape(-1)[1000:2000])
+        arr2 = np.empty((100, 101), np.float32)
+        init.Uniform(scale=2)(arr2, seed=5)
+        assert np.array_equal(arr, arr2)
+    finally:
+        init._RANDOM_CHUNK_SIZE = chunk_size
+
+
 def test_conv2d_abnormal_kernel_negative():
     kernel = np.random.randn(64, 3, 7, 7).astype(np.float32)
     with py.raises(ValueError):
@@ -0,0 +1,98 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test multi_compiler with a stub compiler"""
+import json
+import os
+
+import pytest
+
+from mindspore._extends.parallel_compile import multi_compiler
+
+
+class StubCompiler:
+    """Writes the kernel file and logs each compiled kernel with the pid of the compiling process."""
+    compiler_version = "1"
+
+    def __init__(self):
+        self.meta_dir = multi_compiler._KERNEL_META_DIRS["TBE"]
+
+    @classmethod
+    def version(cls):
+        return cls.compiler_version
+
+    def compile(self, json_str):
+        kernel_name = json.loads(json_str)["op_info"]["kernel_name"]
+        if kernel_name.startswith("bad"):
+            raise ValueError("Tbe compile error")
+        os.makedirs(self.meta_dir, exist_ok=True)
+        with open(os.path.join(self.meta_dir, kernel_name + ".o"), "w") as f:
+            f.write(kernel_name)
+        with open(os.path.join(self.meta_dir, "..", "compiled.log"), "a") as f:
+            f.write("{} {}\n".format(kernel_name, os.getpid()))
+
+
+def kernel_json(kernel_name):
+    return json.dumps({"platform": "TBE", "op_info": {"name": "add", "kernel_name": kernel_name}})
+
+
+def compiled_kernels(tmp_path):
+    log_file = tmp_path / "compiled.log"
+    if not log_file.exists():
+        return []
+    return [line.split()[0] for line in log_file.read_text().splitlines()]
+
+
+@pytest.fixture(name="stub_compiler")
+def fixture_stub_compiler(tmp_path, monkeypatch):
+    monkeypatch.setitem(multi_compiler._COMPILERS, "TBE", StubCompiler)
+    monkeypatch.setitem(multi_compiler._KERNEL_META_DIRS, "TBE", str(tmp_path / "kernel_meta"))
+    monkeypatch.setenv(multi_compiler.KERNEL_CACHE_PATH_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(StubCompiler, "compiler_version", "1")
+    return tmp_path
+
+
+def test_compile_cache(stub_compiler):
+    tmp_path = stub_compiler
+    jsons = [kernel_json("add_{}".format(i)) for i in range(8)] + [kernel_json("add_0")]
+    assert multi_compiler.compilekernelparallel(jsons, 3, 60)
+    assert sorted(compiled_kernels(tmp_path)) == ["add_{}".format(i) for i in range(8)]
+
+    # the kernels are copied from the cache, even if the kernel files are removed
+    for file_name in os.listdir(str(tmp_path / "kernel_meta")):
+        os.remove(str(tmp_path / "kernel_meta" / file_name))
+    assert multi_compiler.compilekernelparallel(jsons + [kernel_json("add_8")], 3, 60)
+    assert sorted(compiled_kernels(tmp_path)) == ["add_{}".format(i) for i in range(9)]
+    assert (tmp_path / "kernel_meta" / "add_3.o").read_text() == "add_3"
+
+    # the kernels are compiled again by another compiler version
+    StubCompiler.compiler_version = "2"
+    assert multi_compiler.compilekernelparallel(jsons[:2], 3, 60)
+    assert len(compiled_kernels(tmp_path)) == 11
+
+
+def test_compile_workers_shared(stub_compiler):
+    tmp_path = stub_compiler
+    jsons = [kernel_json("add_{}".format(i)) for i in range(16)]
+    assert multi_compiler.compilekernelparallel(jsons, 4, 60)
+    lines = (tmp_path / "compiled.log").read_text().splitlines()
+    assert len(lines) == 16
+    assert len(set(line.split()[1] for line in lines)) <= 4
+
+
+def test_compile_error(stub_compiler):
+    jsons = [kernel_json("add_0"), kernel_json("bad_0")]
+    with pytest.raises(ValueError) as err:
+        multi_compiler.compilekernelparallel(jsons, 2, 60)
+    assert "bad_0" in str(err.value)
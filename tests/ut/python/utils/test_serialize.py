@@ -29,7 +29,8 @@ from mindspore.nn.optim.momentum import Momentum
 from mindspore.nn import WithLossCell, TrainOneStepCell
 from mindspore.train.callback import _CheckpointManager
 from mindspore.train.serialization import save_checkpoint, load_checkpoint,load_param_into_net, \
-                                          _exec_save_checkpoint, export, _save_graph
+                                          _exec_save_checkpoint, export, _save_graph, save_sharded_checkpoint, \
+                                          load_sharded_checkpoint, _fill_param_into_net
 from ..ut_filter import run_on_onnxruntime
 from mindspore import context
 
@@ -131,6 +132,81 @@ def test_load_checkpoint():
     assert isinstance(par_dict, dict)
 
 
+def test_save_and_load_mmap_checkpoint():
+    """ test_save_and_load_mmap_checkpoint """
+    param_data = np.random.randint(0, 255, [12, 1024]).astype(np.float32)
+    parameter_list = [{'name': "param", 'data': Tensor(param_data)},
+                      {'name': "step", 'data': Tensor(np.array([3]).astype(np.int32))}]
+    ckpoint_file_name = os.path.join(_cur_dir, './mmap_parameters.ckpt')
+    if os.path.exists(ckpoint_file_name):
+        os.chmod(ckpoint_file_name, stat.S_IWRITE)
+        os.remove(ckpoint_file_name)
+    save_checkpoint(parameter_list, ckpoint_file_name, ckpt_format="mmap")
+
+    par_dict = load_checkpoint(ckpoint_file_name)
+    assert len(par_dict) == 2
+    assert par_dict['param'].is_lazy
+    assert par_dict['param'].data.dtype() == mstype.float32
+    assert not par_dict['param'].is_lazy
+    assert np.array_equal(par_dict['param'].data.asnumpy(), param_data)
+    assert par_dict['step'].data == 3
+
+    os.chmod(ckpoint_file_name, stat.S_IWRITE)
+    os.remove(ckpoint_file_name)
+
+
+class ShardedNet(nn.Cell):
+    """Net with a split weight and a replicated bias."""
+    def __init__(self, weight, bias, dev_mat=None, tensor_map=None):
+        super(ShardedNet, self).__init__()
+        self.weight = Parameter(Tensor(weight), name="weight")
+        self.bias = Parameter(Tensor(bias), name="bias")
+        if dev_mat is not None:
+            self.parameter_layout_dict = {"weight": (dev_mat, tensor_map)}
+
+    def construct(self, x):
+        return x
+
+
+def test_save_and_load_sharded_checkpoint():
+    """ test_save_and_load_sharded_checkpoint """
+    weight = np.arange(32).reshape(8, 4).astype(np.float32)
+    bias = np.ones([4]).astype(np.float32)
+    file_names = [os.path.join(_cur_dir, './sharded_rank_{}.ckpt'.format(i)) for i in range(4)]
+    # weight is split in rows by 2 devices and replicated on 2 devices
+    for rank in range(4):
+        row = rank // 2 * 4
+        net = ShardedNet(weight[row:row + 4], bias, [2, 2], [1, -1])
+        if os.path.exists(file_names[rank]):
+            os.chmod(file_names[rank], stat.S_IWRITE)
+            os.remove(file_names[rank])
+        save_sharded_checkpoint(net, file_names[rank], rank_id=rank, group_size=4)
+
+    par_dict = load_sharded_checkpoint(file_names)
+    assert np.array_equal(par_dict['weight'].data.asnumpy(), weight)
+    assert np.array_equal(par_dict['bias'].data.asnumpy(), bias)
+
+    # restore on a different device matrix, weight is split in columns by 4 devices
+    net = ShardedNet(np.zeros([8, 1]).astype(np.float32), np.zeros([4]).astype(np.float32), [4], [-1, 0])
+    load_sharded_checkpoint(file_names, net, rank_id=3)
+    assert np.array_equal(net.weight.data.asnumpy(), weight[:, 3:4])
+    assert np.array_equal(net.bias.data.asnumpy(), bias)
+
+    with pytest.raises(ValueError):
+        load_sharded_checkpoint(file_names[:1])
+    with pytest.raises(ValueError):
+        load_checkpoint(file_names[0])
+
+    for file_name in file_names:
+        os.chmod(file_name, stat.S_IWRITE)
+        os.remove(file_name)
+
+
+def test_save_checkpoint_error_format():
+    with pytest.raises(ValueError):
+        save_checkpoint([], "./error_format.ckpt", ckpt_format="json")
+
+
 def test_checkpoint_manager():
     """ test_checkpoint_manager """
     ckp_mgr = _CheckpointManager()
@@ -269,6 +345,74 @@ def test_load_param_into_net():
     assert net.conv1.weight.default_input.asnumpy()[0][0][0][0] == 1
 
 
+def test_load_param_into_net_lazy():
+    net = Net(10)
+    assert net.fc.weight.is_lazy
+
+    parameter_dict = {}
+    one_param = Parameter(Tensor(np.ones(shape=(10, 224*224*4)), dtype=mstype.float32),
+                          name="fc.weight")
+    parameter_dict["fc.weight"] = one_param
+    load_param_into_net(net, parameter_dict)
+    assert isinstance(net.fc.weight.lazy_data, Tensor)
+    assert np.all(net.fc.weight.default_input.asnumpy() == 1)
+
+
+def test_load_param_into_net_in_place():
+    net = Net(10)
+    weight = net.conv1.weight.default_input
+    bias = net.fc.bias.default_input
+    net.fc.bias.default_input = weight
+
+    parameter_dict = {}
+    parameter_dict["conv1.weight"] = Parameter(Tensor(np.ones(shape=(64, 3, 7, 7)), dtype=mstype.float32),
+                                               name="conv1.weight")
+    parameter_dict["fc.bias"] = Parameter(Tensor(np.full((10,), 2), dtype=mstype.float32), name="fc.bias")
+    with pytest.raises(RuntimeError):
+        load_param_into_net(net, parameter_dict)
+    # nothing is loaded if any parameter does not match
+    assert np.all(weight.asnumpy() == 0)
+
+    net.fc.bias.default_input = bias
+    load_param_into_net(net, parameter_dict)
+    assert net.conv1.weight.default_input is weight
+    assert np.all(weight.asnumpy() == 1)
+    assert np.all(net.fc.bias.default_input.asnumpy() == 2)
+
+
+def test_load_param_into_net_strict():
+    net = Net(10)
+    parameter_dict = {}
+    parameter_dict["conv1.weight"] = Parameter(Tensor(np.ones(shape=(64, 3, 7, 7)), dtype=mstype.float32),
+                                               name="conv1.weight")
+    parameter_dict["conv1.w"] = Parameter(Tensor(np.ones(shape=(64, 3, 7, 7)), dtype=mstype.float32),
+                                          name="conv1.w")
+    with pytest.raises(ValueError):
+        load_param_into_net(net, parameter_dict, strict=True)
+    assert np.all(net.conv1.weight.default_input.asnumpy() == 0)
+
+    missing, unexpected = load_param_into_net(net, parameter_dict)
+    assert "conv1.weight" not in missing
+    assert "fc.weight" in missing
+    assert unexpected == ["conv1.w"]
+    assert np.all(net.conv1.weight.default_input.asnumpy() == 1)
+
+    parameter_dict = {param.name: param for param in Net(10).get_parameters()}
+    assert load_param_into_net(net, parameter_dict, strict=True) == ([], [])
+
+
+def test_fill_param_into_net():
+    net = Net(10)
+    weight = net.conv1.weight.default_input
+    assert net.fc.weight.is_lazy
+    parameter_list = [{"name": "conv1.weight", "data": Tensor(np.ones(shape=(64, 3, 7, 7)), dtype=mstype.float32)},
+                      {"name": "fc.weight", "data": Tensor(np.ones(shape=(10, 224*224*4)), dtype=mstype.float32)}]
+    _fill_param_into_net(net, parameter_list)
+    # the data is copied into the tensor of the parameter
+    assert net.conv1.weight.default_input is weight
+    assert np.all(weight.asnumpy() == 1)
+    assert np.all(net.fc.weight.default_input.asnumpy() == 1)
+
 def test_exec_save_checkpoint():
     net = Net()
     loss = SoftmaxCrossEntropyWithLogits(is_grad=False, sparse=True)